@@ -90,6 +90,9 @@ class AIAssistant:
             thread_name_prefix="MeetMinder"
         )
         
+        # Settings dialog, built on first open and reused afterwards
+        self._settings_dialog = None
+        
         # Set application properties
         self.app.setApplicationName("MeetMinder")
         self.app.setApplicationDisplayName("MeetMinder")
@@ -874,9 +877,17 @@ class AIAssistant:
             logger.info(f"🤖 Current AI settings: {current_config['assistant']}")
             logger.info(f"🎤 Current transcription: {current_config['transcription']['provider']}")
             
-            # Create and show settings dialog
-            settings_dialog = ModernSettingsDialog(current_config, self.overlay)
-            settings_dialog.settings_changed.connect(self._on_settings_changed)
+            # Reuse the built dialog when possible; building every tab is the
+            # bulk of the cost of opening settings
+            settings_dialog = self._settings_dialog
+            if settings_dialog is not None and settings_dialog.is_reusable_for(self.overlay):
+                settings_dialog.reload(current_config)
+            else:
+                if settings_dialog is not None:
+                    settings_dialog.deleteLater()
+                settings_dialog = ModernSettingsDialog(current_config, self.overlay)
+                settings_dialog.settings_changed.connect(self._on_settings_changed)
+                self._settings_dialog = settings_dialog
             settings_dialog.exec_()
             
         except Exception as e:
@@ -0,0 +1,107 @@
+"""
+Tests for the settings dialog
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import wait
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PyQt5")
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtTest import QTest
+from PyQt5.QtWidgets import QApplication, QWidget
+
+
+class _Doc:
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+
+class _Store:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def list_documents(self):
+        return self.docs
+
+    async def get_stats(self):
+        return {'total_documents': len(self.docs), 'completed_documents': len(self.docs)}
+
+
+class _Helper:
+    """Mirrors AIHelper's document methods, including asyncio.run() for stats"""
+
+    def __init__(self, docs):
+        self.document_store = _Store(docs)
+
+    def list_documents(self):
+        return [doc.__dict__ for doc in self.document_store.list_documents()]
+
+    def get_document_store_stats(self):
+        return asyncio.run(self.document_store.get_stats())
+
+
+class TestDocumentsTab:
+
+    @pytest.fixture
+    def app(self):
+        return QApplication.instance() or QApplication([])
+
+    def _settle(self, app, dialog):
+        """Wait for the background listing and deliver it on this thread"""
+        if dialog._docs_loading is not None:
+            wait([dialog._docs_loading], timeout=5)
+        end = time.time() + 5
+        while dialog._docs_loading is not None and time.time() < end:
+            app.processEvents()
+            time.sleep(0.01)
+
+    def test_refresh_documents_shows_listing(self, app):
+        """Listing and stats load off the GUI thread and fill the tab"""
+        from ui.settings_dialog import ModernSettingsDialog
+
+        parent = QWidget()
+        parent.ai_helper = _Helper([_Doc(id='abcdefghij', file_name='notes.pdf', status='completed')])
+        dialog = ModernSettingsDialog({}, parent)
+
+        # Opening the tab builds it and calls refresh_documents()
+        index = next(i for i, key in dialog._tab_keys.items() if key == 'documents')
+        dialog.tab_widget.setCurrentIndex(index)
+        assert dialog._docs_loading is not None
+        self._settle(app, dialog)
+
+        summary = dialog.documents_summary.text()
+        assert "Error" not in summary
+        assert "Total Documents: 1" in summary
+        model = dialog.documents_model
+        assert model.rowCount() == 1
+        assert "notes.pdf" in model.data(model.index(0), Qt.DisplayRole)
+
+
+class TestKnowledgeTab:
+
+    @pytest.fixture
+    def app(self):
+        return QApplication.instance() or QApplication([])
+
+    def test_clear_topics_undo(self, app):
+        """Ctrl+Z right after clicking Clear Topics restores the topics"""
+        from ui.settings_dialog import ModernSettingsDialog
+
+        dialog = ModernSettingsDialog({})
+        index = next(i for i, key in dialog._tab_keys.items() if key == 'knowledge')
+        dialog.tab_widget.setCurrentIndex(index)
+        dialog.show()
+        QApplication.setActiveWindow(dialog)
+        dialog.topic_definitions.setPlainText("Budget: costs")
+
+        QTest.mouseClick(dialog.clear_topics_btn, Qt.LeftButton)
+        assert dialog.topic_definitions.toPlainText() == ""
+        QTest.keyClick(QApplication.focusWidget(), Qt.Key_Z, Qt.ControlModifier)
+
+        assert dialog.topic_definitions.toPlainText() == "Budget: costs"
+        dialog.close()
@@ -9,7 +9,7 @@ from PyQt5 import QtWidgets, QtCore, QtGui
 from PyQt5.QtCore import QTimer, pyqtSignal, QThread, QPropertyAnimation, QEasingCurve, pyqtSlot, QRect, QPoint, QSize
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
                            QTextEdit, QFrame, QSizePolicy, QGraphicsDropShadowEffect,
-                           QScrollArea, QApplication, QGraphicsBlurEffect, QDesktopWidget)
+                           QScrollArea, QApplication, QGraphicsBlurEffect)
 from PyQt5.QtGui import QFont, QPalette, QColor, QIcon, QPainter, QBrush, QLinearGradient
 
 # Import theme system
@@ -59,8 +59,7 @@ class ResponsiveWidthMonitor(QThread):
         while self.is_running:
             try:
                 # Get current screen dimensions
-                desktop = QApplication.desktop()
-                screen_rect = desktop.screenGeometry()
+                screen_rect = QApplication.primaryScreen().geometry()
                 width = screen_rect.width()
                 height = screen_rect.height()
                 
@@ -433,7 +432,7 @@ class ModernOverlay(QWidget):
             print("⚠️ Theme system not available, using default styling")
         
         # Get screen resolution for responsive sizing
-        screen = QApplication.desktop().screenGeometry()
+        screen = QApplication.primaryScreen().geometry()
         self.screen_scale = min(screen.width() / 1920, screen.height() / 1080)
         self.screen_scale = max(0.8, min(2.0, self.screen_scale))  # Clamp between 0.8x and 2.0x
         
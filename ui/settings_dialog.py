@@ -1,16 +1,35 @@
 import sys
 import os
+import logging
+import asyncio
+import threading
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any, Callable
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                            QPushButton, QCheckBox, QSpinBox, QComboBox,
                            QGroupBox, QFormLayout, QSlider, QFrame, 
-                           QTabWidget, QTextEdit, QLineEdit, QScrollArea,
+                           QTabWidget, QTextEdit, QPlainTextEdit, QLineEdit, QScrollArea,
                            QWidget, QGridLayout, QFileDialog, QMessageBox,
-                           QApplication, QDesktopWidget, QSizePolicy)
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QFont, QIcon
+                           QApplication, QToolTip, QStackedWidget,
+                           QListWidget, QListWidgetItem, QListView, QAbstractScrollArea)
+from PyQt5 import sip
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QEvent, QObject, QAbstractListModel, QModelIndex
+from PyQt5.QtGui import QIcon, QTextCursor
 import json
 
+# orjson, when installed, validates JSON much faster; its JSONDecodeError
+# subclasses json.JSONDecodeError, so callers catch the stdlib type either way
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # Import translation system
 try:
     from utils.translation_manager import get_translation_manager, t, set_language
@@ -23,25 +42,640 @@ except ImportError:
     def set_language(lang: str):
         pass
 
+logger = logging.getLogger('meetminder.settings_dialog')
+
+# Prompt and topic files, relative to the working directory like config.yaml
+_PROMPT_FILE = Path('prompt_rules.md')
+_TOPICS_FILE = Path('topic_definitions.txt')
+
+# Shown by "Reset to Default" and used when prompt_rules.md does not exist yet
+DEFAULT_PROMPT = """You are an intelligent AI meeting assistant designed to provide helpful, contextual responses based on real-time audio transcription and user interactions.
+
+**Core Behavior:**
+- Be concise yet comprehensive in your responses
+- Provide actionable insights and suggestions
+- Adapt your tone to the context (professional for meetings, casual for general chat)
+- Focus on being helpful rather than just informative
+
+**Response Guidelines:**
+- Keep responses under 200 words unless detailed explanation is needed
+- Use bullet points for lists and actionable items
+- Include relevant examples when helpful
+- Ask clarifying questions when context is unclear
+
+**Context Awareness:**
+- Pay attention to meeting dynamics and conversation flow
+- Identify key topics, decisions, and action items
+- Provide relevant suggestions based on the current discussion
+- Be sensitive to the professional or casual nature of the interaction
+
+**Expertise Areas:**
+- Meeting facilitation and note-taking
+- Technical problem-solving
+- Project management insights
+- Communication enhancement
+- General productivity tips"""
+
+DEFAULT_TOPIC_PLACEHOLDER = "Example topic definitions:\n\nMeeting Management: Strategies for organizing and running effective meetings\nProject Planning: Techniques for project planning and execution\nTechnical Discussions: Handling technical topics and problem-solving\nClient Communication: Best practices for client interactions\n\nEnter one topic per line with format: Topic Name: Description"
+
+# Pixel sizes the dialog layout is designed around (1920x1080 reference)
+_SCALED_SIZES = (15, 20, 25, 30, 800, 900, 1200, 1400)
+
+# Combo box choices, shared by every dialog instance
+_AI_PROVIDERS = tuple(map(sys.intern, ("azure_openai", "openai", "google_gemini", "deepseek", "claude")))
+_AUDIO_MODES = tuple(map(sys.intern, ("single_stream", "dual_stream")))
+_TRANSCRIPTION_PROVIDERS = tuple(map(sys.intern, ("local_whisper", "google_speech", "azure_speech", "openai_whisper")))
+_WHISPER_MODELS = tuple(map(sys.intern, ("tiny", "base", "small", "medium", "large")))
+_ACTIVATION_MODES = tuple(map(sys.intern, ("manual", "auto")))
+_VERBOSITY_LEVELS = tuple(map(sys.intern, ("concise", "standard", "detailed")))
+_RESPONSE_STYLES = tuple(map(sys.intern, ("professional", "casual", "technical")))
+_INPUT_PRIORITIES = tuple(map(sys.intern, ("mic", "system_audio", "balanced")))
+_AZURE_SPEECH_LANGUAGES = tuple(map(sys.intern, ("en-US", "en-GB", "es-ES", "fr-FR", "de-DE", "it-IT", "pt-BR", "zh-CN", "ja-JP", "ko-KR")))
+_OPENAI_WHISPER_MODELS = tuple(map(sys.intern, ("whisper-1",)))
+_OPENAI_WHISPER_LANGUAGES = tuple(map(sys.intern, ("auto-detect", "en", "es", "fr", "de", "it", "pt", "zh", "ja", "ko")))
+_EMBEDDING_PROVIDERS = tuple(map(sys.intern, ("local", "openai")))
+_EMBEDDING_MODELS = tuple(map(sys.intern, ("all-MiniLM-L6-v2", "all-mpnet-base-v2", "e5-small-v2")))
+_VECTOR_BACKENDS = tuple(map(sys.intern, ("faiss", "pinecone")))
+
+# Slider value label texts for every value in each slider's range, formatted
+# once so dragging a slider only looks its text up
+_PROCESSING_TEXTS = {v: "%.1fs" % (v * 0.1) for v in range(5, 51)}
+_SPEECH_THRESHOLD_TEXTS = {v: "%d%%" % v for v in range(10, 91)}
+_SIZE_TEXTS = {v: "%.1fx" % (v * 0.1) for v in range(10, 41)}
+_OPACITY_TEXTS = {v: "%.2f" % (v * 0.01) for v in range(5, 51)}
+_MATCHING_TEXTS = {v: "%d%%" % v for v in range(1, 101)}
+
+# Document status -> marker shown in the Documents tab list
+_STATUS_EMOJI = {
+    "pending": "⏳",
+    "processing": "🔄",
+    "completed": "✅",
+    "failed": "❌",
+}
+
+# Document types FileExtractor can read, and the upload picker's filter for them
+_DOCUMENT_EXTENSIONS = ("pdf", "docx", "doc", "txt", "md", "pptx", "ppt", "xlsx", "xls",
+                        "py", "js", "java", "cpp", "c", "html", "css", "json", "xml")
+_DOCUMENT_FILTER = "Documents (%s)" % " ".join("*." + ext for ext in _DOCUMENT_EXTENSIONS)
+
+# Event loop for document uploads and listings, running in a daemon thread for
+# the whole session so neither blocks the UI nor builds a loop per call
+_background_loop = None
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting it on first use"""
+    global _background_loop
+    if _background_loop is None:
+        _background_loop = asyncio.new_event_loop()
+        threading.Thread(target=_background_loop.run_forever, name="SettingsAsync", daemon=True).start()
+    return _background_loop
+
+# Prompt/topic file writes get their own single worker: they never queue
+# behind a slow upload, run in save order, and the interpreter joins the
+# worker at exit, so a write queued just before quitting is not lost
+_file_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="SettingsFiles")
+
+class _ResultBridge(QObject):
+    """Carries finished background futures to their slot on the GUI thread.
+    
+    One bridge lives for the whole session, so a result that arrives after
+    main.py has deleteLater()'d its dialog is dropped here instead of being
+    emitted on a deleted object from the worker thread.
+    """
+    
+    finished = pyqtSignal(object, object)  # (bound slot, future)
+    
+    def __init__(self):
+        super().__init__()
+        self.finished.connect(self._deliver)
+    
+    def _deliver(self, slot, future):
+        # Runs on the GUI thread, where deleteLater() happens, so this
+        # check cannot race the deletion
+        if not sip.isdeleted(slot.__self__):
+            slot(future)
+
+_result_bridge = None
+
+def _when_done(future, slot):
+    """Call ``slot(future)`` on the GUI thread once ``future`` finishes,
+    unless the slot's widget has been deleted by then"""
+    global _result_bridge
+    if _result_bridge is None:
+        # Created on first use from the GUI thread, which it then belongs to
+        _result_bridge = _ResultBridge()
+    future.add_done_callback(partial(_result_bridge.finished.emit, slot))
+
+async def _list_documents(helper):
+    """Return (documents, stats) from ``helper``; runs on the background loop"""
+    # get_document_store_stats() wraps asyncio.run(), which refuses to start
+    # inside this running loop, so both calls go to a worker thread
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, lambda: (helper.list_documents(), helper.get_document_store_stats()))
+
+def _qthrottled(fn, ms: int = 30, parent=None) -> Callable:
+    """Wrap a one-argument slot so bursts of calls collapse into one.
+    
+    Each call records its argument and starts a single-shot timer if one is
+    not already pending, so the slot runs at most once per ``ms`` and always
+    with the latest argument.
+    """
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(ms)
+    pending = [None]
+    timer.timeout.connect(lambda: fn(pending[0]))
+    
+    def call(value):
+        pending[0] = value
+        if not timer.isActive():
+            timer.start()
+    
+    return call
+
+def _dget(config: Mapping, path: str, default: Any = None) -> Any:
+    """Return the value at dotted ``path`` in a nested config, or ``default``"""
+    value = config
+    for key in path.split('.'):
+        if not isinstance(value, Mapping) or key not in value:
+            return default
+        value = value[key]
+    return value
+
+def _dset(config: Dict[str, Any], path: str, value: Any):
+    """Set the value at dotted ``path``, creating intermediate dicts"""
+    *parents, leaf = path.split('.')
+    for key in parents:
+        config = config.setdefault(key, {})
+    config[leaf] = value
+
+def _read_widget(widget: QWidget, scale: int = None) -> Any:
+    """Return a bound widget's value; ``scale`` divides integer slider/spin values"""
+    if isinstance(widget, QCheckBox):
+        return widget.isChecked()
+    if isinstance(widget, QComboBox):
+        return widget.currentText()
+    if isinstance(widget, (QTextEdit, QPlainTextEdit)):
+        return widget.toPlainText()
+    if isinstance(widget, QLineEdit):
+        return widget.text()
+    return widget.value() / scale if scale else widget.value()
+
+def _write_widget(widget: QWidget, value: Any, scale: int = None):
+    """Show ``value`` in a bound widget; the inverse of _read_widget"""
+    if isinstance(widget, QCheckBox):
+        widget.setChecked(value)
+    elif isinstance(widget, QComboBox):
+        widget.setCurrentText(value)
+    elif isinstance(widget, (QTextEdit, QPlainTextEdit)):
+        widget.setPlainText(value)
+    elif isinstance(widget, QLineEdit):
+        widget.setText(str(value))
+    else:
+        widget.setValue(int(value * scale) if scale else value)
+
+def _change_signal(widget: QWidget):
+    """Return the signal a bound widget emits when the user edits it"""
+    if isinstance(widget, QCheckBox):
+        return widget.toggled
+    if isinstance(widget, QComboBox):
+        return widget.currentTextChanged
+    if isinstance(widget, (QTextEdit, QPlainTextEdit, QLineEdit)):
+        return widget.textChanged
+    return widget.valueChanged
+
+class _ApiLineEdit(QLineEdit):
+    """QLineEdit preconfigured for credential/endpoint fields.
+    
+    Height and colors come from the dialog stylesheet (fieldClass=apiField),
+    so construction is a single call instead of a chain of setters.
+    """
+    
+    def __init__(self, placeholder: str = None, password: bool = False, parent=None):
+        super().__init__(parent)
+        if placeholder:
+            self.setPlaceholderText(placeholder)
+        if password:
+            self.setEchoMode(QLineEdit.Password)
+        self.setProperty("fieldClass", "apiField")
+
+class _FormLayout(QFormLayout):
+    """QFormLayout with the dialog's left-aligned labels and the given row spacing"""
+    
+    def __init__(self, spacing: int, parent=None):
+        super().__init__(parent)
+        self.setSpacing(spacing)
+        self.setLabelAlignment(Qt.AlignLeft)
+
+class _DocumentListModel(QAbstractListModel):
+    """Read-only model over the document store listing.
+    
+    Row text is formatted the first time the view asks for it and kept, so
+    the view only pays for rows it actually paints, and only once.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._docs = []
+        self._rows = []  # formatted display text per row, None until painted
+        self._labels = ("Unknown", "Status:", "Error:")
+    
+    def set_documents(self, documents):
+        """Replace the listing, translating the row labels once"""
+        self.beginResetModel()
+        self._docs = list(documents)
+        self._rows = [None] * len(self._docs)
+        self._labels = (t("settings.documents.unknown", "Unknown"),
+                        t("settings.documents.status_label", "Status:"),
+                        t("settings.documents.error_label", "Error:"))
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._docs)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        row = index.row()
+        if role == Qt.DisplayRole:
+            text = self._rows[row]
+            if text is None:
+                doc = self._docs[row]
+                unknown = self._labels[0]
+                text = self._rows[row] = (f"{_STATUS_EMOJI.get(doc.get('status'), '❓')} {doc.get('file_name', unknown)} "
+                                          f"(ID: {doc.get('id', 'N/A')[:8]}...)")
+            return text
+        if role == Qt.ToolTipRole:
+            doc = self._docs[row]
+            unknown, status_label, error_label = self._labels
+            tip = f"{status_label} {doc.get('status', unknown)}"
+            if doc.get('error_message'):
+                tip += f"\n{error_label} {doc['error_message']}"
+            return tip
+        return None
+
 class ModernSettingsDialog(QDialog):
     """Modern tabbed settings dialog with organized sections"""
     
     settings_changed = pyqtSignal(dict)
     
+    # Window icon shared by all dialog instances, loaded on first use
+    _APP_ICON = None
+    # Screen geometry, scale factor and scaled sizes, shared until the desktop changes
+    _cached_screen = None
+    _cached_scale = None
+    _cached_sizes = None
+    _scale_watch_connected = False
+    _watched_screen = None
+    # Future of the latest prompt/topic file write, shared so any dialog
+    # reading those files waits for it; see save_settings
+    _files_writing = None
+    
+    # AI provider groups as (provider, prefix, title, fields), where provider
+    # is the combo/config value. Each field is
+    # (name, label, placeholder, is_password); translation keys are derived as
+    # settings.ai_provider.<prefix>.<name>[_placeholder] and the widget is
+    # stored as self.<prefix>_<name>.
+    _PROVIDER_FIELDS = (
+        ("azure_openai", "azure", "🔷 Azure OpenAI Configuration", (
+            ("endpoint", "Endpoint:", "https://your-resource.openai.azure.com/", False),
+            ("api_key", "API Key:", "Your Azure OpenAI API key", True),
+            ("model", "Model:", "gpt-4", False),
+            ("deployment", "Deployment:", "your-deployment-name", False),
+            ("api_version", "API Version:", None, False),
+        )),
+        ("openai", "openai", "🟢 OpenAI Configuration", (
+            ("api_key", "API Key:", "Your OpenAI API key", True),
+            ("model", "Model:", "gpt-4", False),
+        )),
+        ("google_gemini", "gemini", "🔴 Google Gemini Configuration", (
+            ("api_key", "API Key:", "Your Gemini API key", True),
+            ("model", "Model:", "gemini-2.0-flash", False),
+            ("project_id", "Project ID:", "your-project-id", False),
+        )),
+        ("deepseek", "deepseek", "🧠 DeepSeek Configuration", (
+            ("api_key", "API Key:", "Your DeepSeek API key", True),
+            ("base_url", "Base URL:", "https://api.deepseek.com", False),
+            ("model", "Model:", "deepseek-coder", False),
+        )),
+        ("claude", "claude", "🎭 Claude Configuration", (
+            ("api_key", "API Key:", "Your Anthropic API key", True),
+            ("base_url", "Base URL:", "https://api.anthropic.com", False),
+            ("model", "Model:", "claude-3-sonnet-20240229", False),
+        )),
+    )
+    
+    # Hotkey editors and debug toggles as (attribute, translation key, label)
+    _HOTKEY_FIELDS = (
+        ("trigger_assistance", "settings.hotkeys.trigger_ai", "Trigger AI:"),
+        ("toggle_overlay", "settings.hotkeys.toggle_overlay", "Toggle Overlay:"),
+        ("take_screenshot", "settings.hotkeys.screenshot", "Screenshot:"),
+        ("emergency_reset", "settings.hotkeys.emergency_reset", "Emergency Reset:"),
+        ("toggle_hide_for_screenshots", "settings.hotkeys.toggle_hide", "Toggle Hide Overlay:"),
+    )
+    # Assistant combos as (attribute, translation key, label, choices)
+    _ASSISTANT_FIELDS = (
+        ("activation_mode", "settings.assistant.activation_mode", "Activation Mode:", _ACTIVATION_MODES),
+        ("verbosity", "settings.assistant.verbosity", "Response Verbosity:", _VERBOSITY_LEVELS),
+        ("response_style", "settings.assistant.response_style", "Response Style:", _RESPONSE_STYLES),
+        ("input_prioritization", "settings.assistant.input_priority", "Input Priority:", _INPUT_PRIORITIES),
+    )
+    # Transcription service combos, same layout as _ASSISTANT_FIELDS
+    _AZURE_SPEECH_FIELDS = (
+        ("azure_speech_language", "settings.audio.transcription.azure_speech.language", "Language:", _AZURE_SPEECH_LANGUAGES),
+    )
+    _OPENAI_WHISPER_FIELDS = (
+        ("openai_whisper_model", "settings.audio.transcription.openai_whisper.model", "Model:", _OPENAI_WHISPER_MODELS),
+        ("openai_whisper_language", "settings.audio.transcription.openai_whisper.language", "Language:", _OPENAI_WHISPER_LANGUAGES),
+    )
+    # Theme combo entries as (theme name, translation key, label)
+    _THEME_CHOICES = (
+        ("dark", "settings.theme.dark", "Dark Mode"),
+        ("light", "settings.theme.light", "Light Mode"),
+    )
+    # Enhanced overlay toggles as (attribute, translation key, label,
+    # tooltip translation key, tooltip)
+    _ENHANCED_FLAGS = (
+        ("enable_blur_effects", "settings.blur_effects.label", "Enable blur effects",
+         "settings.blur_effects.tooltip", "Apply blur effects to background for professional look"),
+        ("enable_smooth_animations", "settings.smooth_animations.label", "Enable smooth animations",
+         "settings.smooth_animations.tooltip", "Use smooth animations for transitions and resizing"),
+        ("enable_auto_width", "settings.auto_width.label", "Enable auto-width adjustment",
+         "settings.auto_width.tooltip", "Automatically adjust overlay width based on content"),
+        ("enable_dynamic_transparency", "settings.dynamic_transparency.label", "Enable dynamic transparency",
+         "settings.dynamic_transparency.tooltip", "Adjust transparency based on activity and context"),
+    )
+    _DEBUG_FLAGS = (
+        ("debug_enabled", "settings.debug.enabled", "Enable debug mode"),
+        ("verbose_logging", "settings.debug.verbose_logging", "Verbose logging"),
+        ("save_transcriptions", "settings.debug.save_transcriptions", "Save transcriptions to files"),
+        ("save_audio_chunks", "settings.debug.save_audio", "Save audio chunks to files"),
+    )
+    
+    # Transcription combo value -> attribute name of the group box it reveals
+    _TRANSCRIPTION_GROUPS = {
+        "local_whisper": "whisper_group",
+        "google_speech": "google_speech_group",
+        "azure_speech": "azure_speech_group",
+        "openai_whisper": "openai_whisper_group",
+    }
+    
+    # Widgets that map 1:1 onto a config value, per tab, as
+    # (dotted config path, widget attribute, default when missing).
+    # Both the tab loaders and save_settings read this table; values that
+    # need translating (theme, language, monitored apps) are handled inline.
+    _CONFIG_BINDINGS = {
+        'ai_provider': (
+            ('ai_provider.type', 'ai_provider_type', 'azure_openai'),
+            ('ai_provider.azure_openai.endpoint', 'azure_endpoint', ''),
+            ('ai_provider.azure_openai.api_key', 'azure_api_key', ''),
+            ('ai_provider.azure_openai.model', 'azure_model', ''),
+            ('ai_provider.azure_openai.deployment_name', 'azure_deployment', ''),
+            ('ai_provider.azure_openai.api_version', 'azure_api_version', '2024-02-01'),
+            ('ai_provider.openai.api_key', 'openai_api_key', ''),
+            ('ai_provider.openai.model', 'openai_model', ''),
+            ('ai_provider.google_gemini.api_key', 'gemini_api_key', ''),
+            ('ai_provider.google_gemini.model', 'gemini_model', ''),
+            ('ai_provider.google_gemini.project_id', 'gemini_project_id', ''),
+            ('ai_provider.deepseek.api_key', 'deepseek_api_key', ''),
+            ('ai_provider.deepseek.base_url', 'deepseek_base_url', 'https://api.deepseek.com'),
+            ('ai_provider.deepseek.model', 'deepseek_model', 'deepseek-coder'),
+            ('ai_provider.claude.api_key', 'claude_api_key', ''),
+            ('ai_provider.claude.base_url', 'claude_base_url', 'https://api.anthropic.com'),
+            ('ai_provider.claude.model', 'claude_model', 'claude-3-sonnet-20240229'),
+        ),
+        'audio': (
+            ('audio.mode', 'audio_mode', 'dual_stream'),
+            ('audio.buffer_duration_minutes', 'buffer_duration', 5),
+            ('audio.processing_interval_seconds', 'processing_interval', 1.6),
+            ('audio.system_audio_monitoring.full_monitoring', 'full_system_audio', False),
+            ('audio.system_audio_monitoring.audio_filtering.filter_non_speech', 'filter_music', True),
+            ('audio.system_audio_monitoring.audio_filtering.speech_detection_threshold',
+             'speech_detection_threshold', 0.6),
+            ('transcription.provider', 'transcription_provider', 'local_whisper'),
+            ('transcription.whisper.model_size', 'whisper_model', 'base'),
+            ('transcription.google_speech.json_file_path', 'google_json_file', ''),
+            ('transcription.google_speech.json_content', 'google_json_content', ''),
+            ('transcription.azure_speech.api_key', 'azure_speech_key', ''),
+            ('transcription.azure_speech.region', 'azure_speech_region', 'eastus'),
+            ('transcription.azure_speech.endpoint', 'azure_speech_endpoint', ''),
+            ('transcription.azure_speech.language', 'azure_speech_language', 'en-US'),
+            ('transcription.openai_whisper.api_key', 'openai_whisper_api_key', ''),
+            ('transcription.openai_whisper.model', 'openai_whisper_model', 'whisper-1'),
+            ('transcription.openai_whisper.language', 'openai_whisper_language', 'auto-detect'),
+        ),
+        'ui': (
+            ('ui.overlay.size_multiplier', 'size_multiplier', 1.0),
+            ('ui.overlay.show_transcript', 'show_transcript', False),
+            ('ui.overlay.hide_from_sharing', 'hide_from_sharing', True),
+            ('ui.overlay.auto_hide_seconds', 'auto_hide_seconds', 5),
+            ('ui.overlay.enhanced.background_opacity', 'background_opacity', 0.15),
+            ('ui.overlay.enhanced.blur_enabled', 'enable_blur_effects', True),
+            ('ui.overlay.enhanced.smooth_animations', 'enable_smooth_animations', True),
+            ('ui.overlay.enhanced.auto_width', 'enable_auto_width', True),
+            ('ui.overlay.enhanced.dynamic_transparency', 'enable_dynamic_transparency', False),
+            ('ui.hide_overlay_for_screenshots', 'hide_overlay_for_screenshots', False),
+            ('screen_sharing_detection.enabled', 'enable_screen_sharing_detection', False),
+        ),
+        'assistant': (
+            ('assistant.activation_mode', 'activation_mode', 'manual'),
+            ('assistant.verbosity', 'verbosity', 'standard'),
+            ('assistant.response_style', 'response_style', 'professional'),
+            ('assistant.input_prioritization', 'input_prioritization', 'system_audio'),
+        ),
+        'knowledge': (
+            ('topic_graph.enabled', 'enable_topic_graph', True),
+            ('topic_graph.matching_threshold', 'matching_threshold', 0.6),
+            ('topic_graph.max_matches', 'max_matches', 3),
+        ),
+        'hotkeys': (
+            ('hotkeys.trigger_assistance', 'trigger_assistance', 'ctrl+space'),
+            ('hotkeys.toggle_overlay', 'toggle_overlay', 'ctrl+b'),
+            ('hotkeys.take_screenshot', 'take_screenshot', 'ctrl+h'),
+            ('hotkeys.emergency_reset', 'emergency_reset', 'ctrl+shift+r'),
+            ('hotkeys.toggle_hide_for_screenshots', 'toggle_hide_for_screenshots', 'ctrl+shift+h'),
+        ),
+        'debug': (
+            ('debug.enabled', 'debug_enabled', False),
+            ('debug.verbose_logging', 'verbose_logging', False),
+            ('debug.save_transcriptions', 'save_transcriptions', False),
+            ('debug.save_audio_chunks', 'save_audio_chunks', False),
+            ('debug.max_debug_files', 'max_debug_files', 100),
+        ),
+        'documents': (
+            ('documents.enabled', 'documents_enabled', True),
+            ('documents.chunk_size', 'chunk_size', 1000),
+            ('documents.chunk_overlap', 'chunk_overlap', 200),
+            ('documents.max_context_chunks', 'max_context_chunks', 5),
+            ('documents.embedding.provider', 'embedding_provider', 'local'),
+            ('documents.embedding.model', 'embedding_model', 'all-MiniLM-L6-v2'),
+            ('documents.vector.backend', 'vector_backend', 'faiss'),
+        ),
+    }
+    # Monitorable applications as (config key, display label, enabled by default);
+    # default-enabled meeting apps are listed first, under their own header
+    _MONITORED_APPS = (
+        ("google_meet", "🟢 Google Meet", True),
+        ("zoom", "🔵 Zoom", True),
+        ("teams", "🟣 Microsoft Teams", True),
+        ("skype", "🔷 Skype", True),
+        ("discord", "🟦 Discord", True),
+        ("slack", "🟨 Slack", True),
+        ("webex", "🟧 WebEx", True),
+        ("gotomeeting", "🟫 GoToMeeting", True),
+        ("browser", "🌐 Chrome/Edge Browser", False),
+        ("firefox", "🦊 Firefox", False),
+        ("spotify", "🎵 Spotify", False),
+        ("youtube", "📺 YouTube", False),
+        ("vlc", "🎬 VLC Media Player", False),
+        ("obs", "📹 OBS Studio", False),
+        ("custom", "⚙️ Custom Application", False),
+    )
+    
+    # Inputs outside _CONFIG_BINDINGS whose edits still count as a change
+    _UNBOUND_INPUTS = {
+        'ui': ('language_selector', 'theme_selector'),
+        'prompts': ('system_prompt',),
+        'knowledge': ('topic_definitions',),
+    }
+    # Integer sliders that stand for fractional config values; each has an
+    # _on_<attribute>_changed slot that updates its value label
+    _SLIDER_SCALES = {
+        'processing_interval': 10,
+        'speech_detection_threshold': 100,
+        'size_multiplier': 10,
+        'background_opacity': 100,
+        'matching_threshold': 100,
+    }
+    # (attribute, setter, translation key, default) for the widgets that
+    # refresh_translations updates; attributes of unbuilt tabs are skipped
+    _RETRANSLATE = (
+        ('save_button', 'setText', "settings.buttons.save", "💾 Save Settings"),
+        ('cancel_button', 'setText', "settings.buttons.cancel", "❌ Cancel"),
+        ('reset_button', 'setText', "settings.buttons.reset", "🔄 Reset to Defaults"),
+        ('auto_hide_seconds', 'setSuffix', "settings.auto_hide.suffix", " seconds (0 = disabled)"),
+        ('show_transcript', 'setText', "settings.show_transcript.label", "Show live transcript in expanded view"),
+        ('hide_from_sharing', 'setText', "settings.hide_from_sharing.label", "Hide from screen sharing"),
+        ('enable_screen_sharing_detection', 'setText', "settings.screen_sharing.label", "Enable screen sharing detection"),
+        ('hide_overlay_for_screenshots', 'setText', "settings.hide_screenshots.label", "Hide overlay for screenshots/debugging"),
+        ('appearance_group', 'setTitle', "settings.appearance.title", "🎨 Appearance"),
+        ('enhanced_group', 'setTitle', "settings.enhanced_features.title", "🚀 Enhanced Features"),
+        ('provider_group', 'setTitle', "settings.ai_provider.title", "🤖 AI Provider"),
+        ('azure_group', 'setTitle', "settings.ai_provider.azure.title", "🔷 Azure OpenAI Configuration"),
+        ('openai_group', 'setTitle', "settings.ai_provider.openai.title", "🟢 OpenAI Configuration"),
+        ('gemini_group', 'setTitle', "settings.ai_provider.gemini.title", "🔴 Google Gemini Configuration"),
+        ('deepseek_group', 'setTitle', "settings.ai_provider.deepseek.title", "🧠 DeepSeek Configuration"),
+        ('claude_group', 'setTitle', "settings.ai_provider.claude.title", "🎭 Claude Configuration"),
+        ('mode_group', 'setTitle', "settings.audio.title", "🎤 Audio Configuration"),
+        ('system_audio_group', 'setTitle', "settings.audio.system_audio.title", "🔊 System Audio Monitoring"),
+        ('transcription_group', 'setTitle', "settings.audio.transcription.title", "📝 Transcription Settings"),
+        ('whisper_group', 'setTitle', "settings.audio.transcription.whisper.title", "🤖 Local Whisper Configuration"),
+        ('google_speech_group', 'setTitle', "settings.audio.transcription.google_speech.title", "🔴 Google Speech-to-Text Configuration"),
+        ('azure_speech_group', 'setTitle', "settings.audio.transcription.azure_speech.title", "🔷 Azure Speech Services Configuration"),
+        ('openai_whisper_group', 'setTitle', "settings.audio.transcription.openai_whisper.title", "🟢 OpenAI Whisper API Configuration"),
+        ('behavior_group', 'setTitle', "settings.assistant.title", "🧠 Assistant Behavior"),
+        ('prompt_group', 'setTitle', "settings.prompts.title", "📝 AI Prompt Configuration"),
+        ('knowledge_group', 'setTitle', "settings.knowledge.title", "🧠 Knowledge Graph"),
+        ('doc_settings_group', 'setTitle', "settings.documents.title", "📚 Document Store Configuration"),
+        ('debug_group', 'setTitle', "settings.debug.title", "🐛 Debug & Logging"),
+        ('prompt_info', 'setText', "settings.prompts.info", "Customize the MeetMinder assistant's behavior and response style:"),
+        ('system_prompt', 'setPlaceholderText', "settings.prompts.placeholder", "Enter system prompt that defines the MeetMinder assistant's behavior, tone, and expertise..."),
+        ('load_prompt_btn', 'setText', "settings.prompts.load_file", "📁 Load from File"),
+        ('save_prompt_btn', 'setText', "settings.prompts.save_file", "💾 Save to File"),
+        ('reset_prompt_btn', 'setText', "settings.prompts.reset_default", "🔄 Reset to Default"),
+        ('enable_topic_graph', 'setText', "settings.knowledge.enable", "Enable topic analysis and suggestions"),
+        ('topic_info', 'setText', "settings.knowledge.topic_definitions", "Topic Definitions:"),
+        ('topic_definitions', 'setPlaceholderText', "settings.knowledge.topic_definitions_placeholder", DEFAULT_TOPIC_PLACEHOLDER),
+        ('documents_enabled', 'setText', "settings.documents.enabled", "Enable document storage and retrieval"),
+        ('upload_button', 'setText', "settings.documents.upload", "📤 Upload Document"),
+        ('refresh_button', 'setText', "settings.documents.refresh_list", "🔄 Refresh List"),
+        ('embedding_group', 'setTitle', "settings.documents.embedding_provider_title", "🧮 Embedding Provider"),
+        ('vector_group', 'setTitle', "settings.documents.vector_storage_title", "💾 Vector Storage"),
+        ('management_group', 'setTitle', "settings.documents.management_title", "📁 Document Management"),
+        ('import_topics_btn', 'setText', "settings.knowledge.import_topics", "📁 Import Topics"),
+        ('export_topics_btn', 'setText', "settings.knowledge.export_topics", "💾 Export Topics"),
+        ('clear_topics_btn', 'setText', "settings.knowledge.clear_all", "🗑️ Clear All"),
+        ('hotkeys_group', 'setTitle', "settings.hotkeys.title", "⌨️ Global Hotkeys"),
+        ('full_system_audio', 'setText', "settings.audio.system_audio.full_monitoring", "Monitor all system audio (overrides specific app selection)"),
+        ('app_selection_label', 'setText', "settings.audio.system_audio.select_apps", "Select specific applications to monitor:"),
+        ('meeting_header', 'setText', "settings.audio.system_audio.meeting_apps", "📞 Meeting & Communication Apps (Enabled by Default)"),
+        ('other_header', 'setText', "settings.audio.system_audio.other_apps", "🖥️ Other Applications (Disabled by Default)"),
+        ('custom_app_input', 'setPlaceholderText', "settings.audio.system_audio.custom_app", "Enter custom application name (e.g., MyApp.exe)"),
+        ('add_custom_btn', 'setText', "settings.audio.system_audio.add_custom", "➕ Add"),
+        ('filter_label', 'setText', "settings.audio.system_audio.filtering", "🎛️ Audio Filtering:"),
+        ('filter_music', 'setText', "settings.audio.system_audio.filter_music", "🎵 Filter out music and non-speech audio (recommended)"),
+    )
+    
+    # Seconds a document listing is reused before the helper is asked again
+    _DOCS_CACHE_TTL = 2.0
+    
     def __init__(self, current_config: Dict[str, Any], parent=None):
         super().__init__(parent)
-        self.current_config = current_config.copy()
+        # Read-only view; the dialog never mutates the caller's config
+        self.current_config = MappingProxyType(current_config)
         self.overlay_ref = parent  # Store reference to overlay for refreshing
+        self._file_dialogs = {}  # role -> QFileDialog, see _pick_file
+        self._retranslatable = []  # (label, key, default) rows, see _add_row
+        self._tooltips = {}  # widget -> (key, default), see _lazy_tooltip
+        self._docs_cache = None  # (documents, stats), see refresh_documents
+        self._docs_cache_ts = 0.0
+        self._docs_loading = None  # pending listing future, if any
+        self._dirty = False  # set by any edit; a clean Save just closes
+        self._applied_theme = None  # 'light' or 'dark' once a stylesheet is set
+        self._translations_stale = False  # language changed while hidden
+        # Widget text is translated once at build time
+        self._built_language = get_translation_manager().get_language() if TRANSLATIONS_AVAILABLE else None
         
         # Get screen resolution for responsive sizing
-        self.screen = QApplication.desktop().screenGeometry()
-        self.scale_factor = min(self.screen.width() / 1920, self.screen.height() / 1080)
-        self.scale_factor = max(0.8, min(1.5, self.scale_factor))  # Clamp between 0.8x and 1.5x
+        # _s maps every fixed size used while building the tabs to its scaled value
+        self.screen, self.scale_factor, self._s = type(self)._get_scale()
         
-        print(f"🖥️ Screen: {self.screen.width()}x{self.screen.height()}, Scale: {self.scale_factor:.2f}x")
+        logger.debug("Screen: %dx%d, Scale: %.2fx", self.screen.width(), self.screen.height(), self.scale_factor)
         
+        # Building the visible tab loads its values; the other tabs load
+        # when first opened, so no separate load pass is needed here
         self.setup_ui()
-        self.load_current_settings()
+    
+    @classmethod
+    def _get_scale(cls):
+        """Return (screen geometry, clamped scale factor, scaled sizes), computed once per desktop layout"""
+        if cls._cached_screen is None:
+            # QScreen replaces the deprecated QDesktopWidget lookup
+            primary = QApplication.primaryScreen()
+            screen = primary.geometry()
+            factor = min(screen.width() / 1920, screen.height() / 1080)
+            cls._cached_screen = screen
+            cls._cached_scale = max(0.8, min(1.5, factor))  # Clamp between 0.8x and 1.5x
+            cls._cached_sizes = MappingProxyType({size: int(size * cls._cached_scale) for size in _SCALED_SIZES})
+            if not cls._scale_watch_connected:
+                QApplication.instance().primaryScreenChanged.connect(cls._invalidate_scale)
+                cls._scale_watch_connected = True
+            if primary is not cls._watched_screen:
+                primary.geometryChanged.connect(cls._invalidate_scale)
+                cls._watched_screen = primary
+        return cls._cached_screen, cls._cached_scale, cls._cached_sizes
+    
+    @classmethod
+    def _invalidate_scale(cls, *_):
+        cls._cached_screen = None
+        cls._cached_scale = None
+        cls._cached_sizes = None
+    
+    def is_reusable_for(self, parent) -> bool:
+        """Whether this already-built dialog can be shown again for ``parent``"""
+        if parent is not self.overlay_ref:
+            return False
+        if TRANSLATIONS_AVAILABLE:
+            return get_translation_manager().get_language() == self._built_language
+        return True
+    
+    def reload(self, current_config: Dict[str, Any]):
+        """Point a reused dialog at a fresh config and reload every widget
+
+        The reload is queued so exec_() can show the dialog first; the
+        timer fires on the dialog's first event-loop pass, before any input.
+        """
+        self.current_config = MappingProxyType(current_config)
+        QTimer.singleShot(0, self.load_current_settings)
     
     def scale(self, value: int) -> int:
         """Scale a value by the screen scale factor"""
@@ -51,13 +685,18 @@ class ModernSettingsDialog(QDialog):
         """Setup the tabbed settings UI"""
         self.setWindowTitle(t("settings.title", "MeetMinder Settings"))
         
-        # Set window icon
-        if os.path.exists("MeetMinderIcon.ico"):
-            self.setWindowIcon(QIcon("MeetMinderIcon.ico"))
+        # Window icon: inherited from QApplication when the app set one;
+        # otherwise load it ourselves (stat + decode happen once per process)
+        cls = type(self)
+        if QApplication.windowIcon().isNull():
+            if cls._APP_ICON is None:
+                cls._APP_ICON = QIcon("MeetMinderIcon.ico") if os.path.exists("MeetMinderIcon.ico") else QIcon()
+            if not cls._APP_ICON.isNull():
+                self.setWindowIcon(cls._APP_ICON)
         
         # Responsive sizing based on screen resolution
-        dialog_width = self.scale(1400)  # Increased width for better content visibility
-        dialog_height = self.scale(900)   # Increased height for better content visibility
+        dialog_width = self._s[1400]  # Increased width for better content visibility
+        dialog_height = self._s[900]   # Increased height for better content visibility
         self.setFixedSize(dialog_width, dialog_height)
         
         # Center on screen
@@ -69,23 +708,37 @@ class ModernSettingsDialog(QDialog):
         self.apply_current_theme()
         
         layout = QVBoxLayout()
-        layout.setContentsMargins(self.scale(25), self.scale(25), self.scale(25), self.scale(25))
-        layout.setSpacing(self.scale(20))
+        layout.setContentsMargins(self._s[25], self._s[25], self._s[25], self._s[25])
+        layout.setSpacing(self._s[20])
         
         # Create tab widget
         self.tab_widget = QTabWidget()
-        self.tab_widget.setMinimumSize(self.scale(1200), self.scale(800))
-        
-        # Setup all tabs
-        self.setup_ai_provider_tab()
-        self.setup_audio_tab()
-        self.setup_ui_tab()
-        self.setup_assistant_tab()
-        self.setup_prompts_tab()
-        self.setup_knowledge_tab()
-        self.setup_documents_tab()
-        self.setup_hotkeys_tab()
-        self.setup_debug_tab()
+        self.tab_widget.setMinimumSize(self._s[1200], self._s[800])
+        
+        # Register every tab now, but only build its contents on first view
+        self._unbuilt_tabs = {}
+        self._tab_loaders = {}
+        self._tab_keys = {}
+        self._tab_titles = {}  # index -> (translation key, default), see refresh_translations
+        for key, title_key, title, setup, load in (
+            ('ai_provider', "settings.tabs.ai_provider", "🤖 AI Provider", self.setup_ai_provider_tab, self._load_ai_provider_settings),
+            ('audio', "settings.tabs.audio", "🎤 Audio", self.setup_audio_tab, self._load_audio_settings),
+            ('ui', "settings.tabs.interface", "🖥️ Interface", self.setup_ui_tab, self._load_ui_settings),
+            ('assistant', "settings.tabs.assistant", "🧠 Assistant", self.setup_assistant_tab, self._load_assistant_settings),
+            ('prompts', "settings.tabs.prompts", "📝 Prompts", self.setup_prompts_tab, self._load_prompts_settings),
+            ('knowledge', "settings.tabs.knowledge", "🧠 Knowledge", self.setup_knowledge_tab, self._load_knowledge_settings),
+            ('documents', "settings.tabs.documents", "📚 Documents", self.setup_documents_tab, self._load_documents_settings),
+            ('hotkeys', "settings.tabs.hotkeys", "⌨️ Hotkeys", self.setup_hotkeys_tab, self._load_hotkeys_settings),
+            ('debug', "settings.tabs.debug", "🐛 Debug", self.setup_debug_tab, self._load_debug_settings),
+        ):
+            index = self.tab_widget.addTab(QWidget(), t(title_key, title))
+            self._tab_titles[index] = (title_key, title)
+            self._tab_keys[index] = key
+            self._unbuilt_tabs[index] = setup
+            self._tab_loaders[index] = load
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
+        # Builds and loads the visible tab; the rest build when first opened
+        self._ensure_tab_built(self.tab_widget.currentIndex())
         
         layout.addWidget(self.tab_widget)
         
@@ -93,232 +746,139 @@ class ModernSettingsDialog(QDialog):
         self.setup_buttons(layout)
         
         self.setLayout(layout)
-        
-        # Load current settings into the dialog
-        self.load_current_settings()
-        
-        # Clear any hardcoded styles that might interfere with theming
-        self.clear_hardcoded_styles()
     
-    def setup_ai_provider_tab(self):
-        """Setup AI Provider configuration tab"""
-        tab = QScrollArea()
+    def _ensure_tab_built(self, index):
+        """Build the tab at ``index`` on first use and load its values"""
+        setup = self._unbuilt_tabs.pop(index, None)
+        if setup is None:
+            return
+        tab = self.tab_widget.widget(index)
+        # Filling a tab with the loaded values is not an edit
+        was_dirty = self._dirty
+        # Suppress repaints while the tab's widgets are added and filled
+        tab.setUpdatesEnabled(False)
+        try:
+            # Fill a detached content widget, then attach the finished tree once
+            content, layout = self._make_tab_content()
+            setup(layout)
+            self._attach_tab_content(tab, content)
+            key = self._tab_keys[index]
+            self._track_changes([attr for _, attr, _ in self._CONFIG_BINDINGS.get(key, ())]
+                                + list(self._UNBOUND_INPUTS.get(key, ())))
+            self._tab_loaders[index]()
+        finally:
+            tab.setUpdatesEnabled(True)
+        self._dirty = was_dirty
+    
+    def _track_changes(self, attrs):
+        """Connect the named widgets that exist so far to _mark_dirty"""
+        for attr in attrs:
+            widget = getattr(self, attr, None)
+            if widget is not None:
+                _change_signal(widget).connect(self._mark_dirty)
+    
+    def _mark_dirty(self, *_):
+        self._dirty = True
+    
+    def _make_tab_content(self):
+        """Return a detached (content widget, layout) for a setup_*_tab to fill"""
         content = QWidget()
-        
-        # Set proper size policy for content to expand
-        content.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        content.setMinimumSize(self.scale(1200), self.scale(700))  # Increased for more providers
-        
         layout = QVBoxLayout(content)
-        layout.setSpacing(self.scale(25))
-        layout.setContentsMargins(self.scale(30), self.scale(30), self.scale(30), self.scale(30))
-        
+        layout.setSpacing(self._s[25])
+        layout.setContentsMargins(self._s[30], self._s[30], self._s[30], self._s[30])
+        return content, layout
+    
+    def _attach_tab_content(self, tab, content):
+        """Put a built content widget into its tab page
+        
+        Content that fits the smallest page the dialog allows is placed
+        directly; only taller content gets a QScrollArea, which resizes it
+        to fit and scrolls once its size hint exceeds the page.
+        """
+        page_layout = QVBoxLayout(tab)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        page_layout.addWidget(content)
+        # Measure with the dialog's stylesheet applied
+        content.ensurePolished()
+        page_height = self.tab_widget.minimumHeight() - self.tab_widget.tabBar().sizeHint().height()
+        if content.sizeHint().height() > page_height:
+            page_layout.removeWidget(content)
+            scroll = QScrollArea()
+            scroll.setWidget(content)
+            scroll.setWidgetResizable(True)
+            page_layout.addWidget(scroll)
+    
+    def setup_ai_provider_tab(self, layout):
+        """Setup AI Provider configuration tab"""
         # Provider Selection
         self.provider_group = QGroupBox(t("settings.ai_provider.title", "🤖 AI Provider"))
-        provider_layout = QFormLayout()
-        provider_layout.setSpacing(self.scale(20))
-        provider_layout.setLabelAlignment(Qt.AlignLeft)
+        provider_layout = _FormLayout(self._s[20])
         
         self.ai_provider_type = QComboBox()
-        self.ai_provider_type.addItems(["azure_openai", "openai", "google_gemini", "deepseek", "claude"])
-        self.ai_provider_type.setMinimumHeight(self.scale(40))
+        self.ai_provider_type.addItems(_AI_PROVIDERS)
         self.ai_provider_type.currentTextChanged.connect(self.on_provider_changed)
         provider_layout.addRow(t("settings.ai_provider.provider_label", "Provider:"), self.ai_provider_type)
         
         self.provider_group.setLayout(provider_layout)
         layout.addWidget(self.provider_group)
         
-        # Azure OpenAI Settings
-        self.azure_group = QGroupBox(t("settings.ai_provider.azure.title", "🔷 Azure OpenAI Configuration"))
-        self.azure_group.setMinimumHeight(self.scale(350))
-        azure_layout = QFormLayout()
-        azure_layout.setSpacing(self.scale(20))
-        azure_layout.setLabelAlignment(Qt.AlignLeft)
-        
-        self.azure_endpoint = QLineEdit()
-        self.azure_endpoint.setPlaceholderText(t("settings.ai_provider.azure.endpoint_placeholder", "https://your-resource.openai.azure.com/"))
-        self.azure_endpoint.setMinimumHeight(self.scale(40))
-
-        azure_layout.addRow(t("settings.ai_provider.azure.endpoint", "Endpoint:"), self.azure_endpoint)
-        
-        self.azure_api_key = QLineEdit()
-        self.azure_api_key.setPlaceholderText(t("settings.ai_provider.azure.api_key_placeholder", "Your Azure OpenAI API key"))
-        self.azure_api_key.setEchoMode(QLineEdit.Password)
-        self.azure_api_key.setMinimumHeight(self.scale(40))
-
-        azure_layout.addRow(t("settings.ai_provider.azure.api_key", "API Key:"), self.azure_api_key)
-        
-        self.azure_model = QLineEdit()
-        self.azure_model.setPlaceholderText(t("settings.ai_provider.azure.model_placeholder", "gpt-4"))
-        self.azure_model.setMinimumHeight(self.scale(40))
-
-        azure_layout.addRow(t("settings.ai_provider.azure.model", "Model:"), self.azure_model)
-        
-        self.azure_deployment = QLineEdit()
-        self.azure_deployment.setPlaceholderText(t("settings.ai_provider.azure.deployment_placeholder", "your-deployment-name"))
-        self.azure_deployment.setMinimumHeight(self.scale(40))
-
-        azure_layout.addRow(t("settings.ai_provider.azure.deployment", "Deployment:"), self.azure_deployment)
-        
-        self.azure_api_version = QLineEdit()
-        self.azure_api_version.setText("2024-06-01")
-        self.azure_api_version.setMinimumHeight(self.scale(40))
-
-        azure_layout.addRow(t("settings.ai_provider.azure.api_version", "API Version:"), self.azure_api_version)
-        
-        self.azure_group.setLayout(azure_layout)
-        layout.addWidget(self.azure_group)
-        
-        # OpenAI Settings
-        self.openai_group = QGroupBox(t("settings.ai_provider.openai.title", "🟢 OpenAI Configuration"))
-        self.openai_group.setMinimumHeight(self.scale(200))
-        openai_layout = QFormLayout()
-        openai_layout.setSpacing(self.scale(20))
-        openai_layout.setLabelAlignment(Qt.AlignLeft)
-        
-        self.openai_api_key = QLineEdit()
-        self.openai_api_key.setPlaceholderText(t("settings.ai_provider.openai.api_key_placeholder", "Your OpenAI API key"))
-        self.openai_api_key.setEchoMode(QLineEdit.Password)
-        self.openai_api_key.setMinimumHeight(self.scale(40))
-        openai_layout.addRow(t("settings.ai_provider.openai.api_key", "API Key:"), self.openai_api_key)
-        
-        self.openai_model = QLineEdit()
-        self.openai_model.setPlaceholderText(t("settings.ai_provider.openai.model_placeholder", "gpt-4"))
-        self.openai_model.setMinimumHeight(self.scale(40))
-        openai_layout.addRow(t("settings.ai_provider.openai.model", "Model:"), self.openai_model)
-        
-        self.openai_group.setLayout(openai_layout)
-        layout.addWidget(self.openai_group)
-        
-        # Google Gemini Settings
-        self.gemini_group = QGroupBox(t("settings.ai_provider.gemini.title", "🔴 Google Gemini Configuration"))
-        self.gemini_group.setMinimumHeight(self.scale(250))
-        gemini_layout = QFormLayout()
-        gemini_layout.setSpacing(self.scale(20))
-        gemini_layout.setLabelAlignment(Qt.AlignLeft)
-        
-        self.gemini_api_key = QLineEdit()
-        self.gemini_api_key.setPlaceholderText(t("settings.ai_provider.gemini.api_key_placeholder", "Your Gemini API key"))
-        self.gemini_api_key.setEchoMode(QLineEdit.Password)
-        self.gemini_api_key.setMinimumHeight(self.scale(40))
-        gemini_layout.addRow(t("settings.ai_provider.gemini.api_key", "API Key:"), self.gemini_api_key)
-        
-        self.gemini_model = QLineEdit()
-        self.gemini_model.setPlaceholderText(t("settings.ai_provider.gemini.model_placeholder", "gemini-2.0-flash"))
-        self.gemini_model.setMinimumHeight(self.scale(40))
-        gemini_layout.addRow(t("settings.ai_provider.gemini.model", "Model:"), self.gemini_model)
-        
-        self.gemini_project_id = QLineEdit()
-        self.gemini_project_id.setPlaceholderText(t("settings.ai_provider.gemini.project_id_placeholder", "your-project-id"))
-        self.gemini_project_id.setMinimumHeight(self.scale(40))
-        gemini_layout.addRow(t("settings.ai_provider.gemini.project_id", "Project ID:"), self.gemini_project_id)
-        
-        self.gemini_group.setLayout(gemini_layout)
-        layout.addWidget(self.gemini_group)
-        
-        # DeepSeek Settings
-        self.deepseek_group = QGroupBox(t("settings.ai_provider.deepseek.title", "🧠 DeepSeek Configuration"))
-        self.deepseek_group.setMinimumHeight(self.scale(250))
-        deepseek_layout = QFormLayout()
-        deepseek_layout.setSpacing(self.scale(20))
-        deepseek_layout.setLabelAlignment(Qt.AlignLeft)
-        
-        self.deepseek_api_key = QLineEdit()
-        self.deepseek_api_key.setPlaceholderText(t("settings.ai_provider.deepseek.api_key_placeholder", "Your DeepSeek API key"))
-        self.deepseek_api_key.setEchoMode(QLineEdit.Password)
-        self.deepseek_api_key.setMinimumHeight(self.scale(40))
-        deepseek_layout.addRow(t("settings.ai_provider.deepseek.api_key", "API Key:"), self.deepseek_api_key)
-        
-        self.deepseek_base_url = QLineEdit()
-        self.deepseek_base_url.setPlaceholderText(t("settings.ai_provider.deepseek.base_url_placeholder", "https://api.deepseek.com"))
-        self.deepseek_base_url.setMinimumHeight(self.scale(40))
-        deepseek_layout.addRow(t("settings.ai_provider.deepseek.base_url", "Base URL:"), self.deepseek_base_url)
-        
-        self.deepseek_model = QLineEdit()
-        self.deepseek_model.setPlaceholderText(t("settings.ai_provider.deepseek.model_placeholder", "deepseek-coder"))
-        self.deepseek_model.setMinimumHeight(self.scale(40))
-        deepseek_layout.addRow(t("settings.ai_provider.deepseek.model", "Model:"), self.deepseek_model)
-        
-        self.deepseek_group.setLayout(deepseek_layout)
-        layout.addWidget(self.deepseek_group)
-        
-        # Claude Settings
-        self.claude_group = QGroupBox(t("settings.ai_provider.claude.title", "🎭 Claude Configuration"))
-        self.claude_group.setMinimumHeight(self.scale(250))
-        claude_layout = QFormLayout()
-        claude_layout.setSpacing(self.scale(20))
-        claude_layout.setLabelAlignment(Qt.AlignLeft)
-        
-        self.claude_api_key = QLineEdit()
-        self.claude_api_key.setPlaceholderText(t("settings.ai_provider.claude.api_key_placeholder", "Your Anthropic API key"))
-        self.claude_api_key.setEchoMode(QLineEdit.Password)
-        self.claude_api_key.setMinimumHeight(self.scale(40))
-        claude_layout.addRow(t("settings.ai_provider.claude.api_key", "API Key:"), self.claude_api_key)
-        
-        self.claude_base_url = QLineEdit()
-        self.claude_base_url.setPlaceholderText(t("settings.ai_provider.claude.base_url_placeholder", "https://api.anthropic.com"))
-        self.claude_base_url.setMinimumHeight(self.scale(40))
-        claude_layout.addRow(t("settings.ai_provider.claude.base_url", "Base URL:"), self.claude_base_url)
-        
-        self.claude_model = QLineEdit()
-        self.claude_model.setPlaceholderText(t("settings.ai_provider.claude.model_placeholder", "claude-3-sonnet-20240229"))
-        self.claude_model.setMinimumHeight(self.scale(40))
-        claude_layout.addRow(t("settings.ai_provider.claude.model", "Model:"), self.claude_model)
-        
-        self.claude_group.setLayout(claude_layout)
-        layout.addWidget(self.claude_group)
+        # One page per provider; a page's group is built the first time its
+        # provider is selected (see on_provider_changed)
+        self.provider_stack = QStackedWidget()
+        self._provider_pages = {}
+        self._unbuilt_providers = {}
+        for provider, prefix, title, fields in self._PROVIDER_FIELDS:
+            page = QWidget()
+            QVBoxLayout(page).setContentsMargins(0, 0, 0, 0)
+            self._provider_pages[provider] = self.provider_stack.addWidget(page)
+            self._unbuilt_providers[provider] = (prefix, title, fields)
+        layout.addWidget(self.provider_stack)
         
         layout.addStretch()
-        
-        # Set the widget to the scroll area and configure scroll area
-        tab.setWidget(content)
-        tab.setWidgetResizable(True)
-        tab.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        tab.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        
-        self.tab_widget.addTab(tab, t("settings.tabs.ai_provider", "🤖 AI Provider"))
     
-    def setup_audio_tab(self):
+    def _build_provider_group(self, prefix, title, fields):
+        """Build one provider QGroupBox from its field descriptors"""
+        key_base = f"settings.ai_provider.{prefix}"
+        group = QGroupBox(t(f"{key_base}.title", title))
+        # Plain label/field grid: rows are known up front, so skip the
+        # QFormLayout per-addRow size negotiation
+        grid = QGridLayout()
+        grid.setSpacing(self._s[20])
+        grid.setColumnStretch(1, 1)
+        
+        for row, (name, label, placeholder, is_password) in enumerate(fields):
+            if placeholder is not None:
+                placeholder = t(f"{key_base}.{name}_placeholder", placeholder)
+            line_edit = _ApiLineEdit(placeholder, password=is_password)
+            setattr(self, f"{prefix}_{name}", line_edit)
+            grid.addWidget(QLabel(t(f"{key_base}.{name}", label)), row, 0, Qt.AlignLeft | Qt.AlignVCenter)
+            grid.addWidget(line_edit, row, 1)
+        
+        group.setLayout(grid)
+        setattr(self, f"{prefix}_group", group)
+        return group
+    
+    def setup_audio_tab(self, layout):
         """Setup Audio settings tab"""
-        tab = QScrollArea()
-        content = QWidget()
-        
-        # Set proper size policy for content to expand
-        content.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        content.setMinimumSize(self.scale(1200), self.scale(1100))  # Increased for transcription settings
-        
-        layout = QVBoxLayout(content)
-        layout.setSpacing(self.scale(25))
-        layout.setContentsMargins(self.scale(30), self.scale(30), self.scale(30), self.scale(30))
-        
         # Audio Mode
         self.mode_group = QGroupBox(t("settings.audio.title", "🎤 Audio Configuration"))
-        self.mode_group.setMinimumHeight(self.scale(300))
-        mode_layout = QFormLayout()
-        mode_layout.setSpacing(self.scale(20))
-        mode_layout.setLabelAlignment(Qt.AlignLeft)
+        mode_layout = _FormLayout(self._s[20])
         
         self.audio_mode = QComboBox()
-        self.audio_mode.addItems(["single_stream", "dual_stream"])
-        self.audio_mode.setMinimumHeight(self.scale(40))
+        self.audio_mode.addItems(_AUDIO_MODES)
         mode_layout.addRow(t("settings.audio.mode", "Audio Mode:"), self.audio_mode)
         
         self.buffer_duration = QSpinBox()
         self.buffer_duration.setRange(1, 30)
         self.buffer_duration.setSuffix(t("settings.audio.buffer_suffix", " minutes"))
-        self.buffer_duration.setMinimumHeight(self.scale(40))
         mode_layout.addRow(t("settings.audio.buffer_duration", "Buffer Duration:"), self.buffer_duration)
         
         self.processing_interval = QSlider(Qt.Horizontal)
         self.processing_interval.setRange(5, 50)
         self.processing_interval.setValue(16)
-        self.processing_interval.setMinimumHeight(self.scale(40))
         self.processing_label = QLabel("1.6s")
-        self.processing_label.setMinimumWidth(self.scale(50))
-        self.processing_label.setMinimumHeight(self.scale(28))
-        self.processing_interval.valueChanged.connect(
-            lambda v: self.processing_label.setText(f"{v/10:.1f}s")
-        )
+        self.processing_label.setProperty("class", "value")
+        self.processing_interval.valueChanged.connect(_qthrottled(self._on_processing_interval_changed, parent=self))
         
         interval_layout = QHBoxLayout()
         interval_layout.addWidget(self.processing_interval)
@@ -330,160 +890,88 @@ class ModernSettingsDialog(QDialog):
         
         # System Audio Monitoring
         self.system_audio_group = QGroupBox(t("settings.audio.system_audio.title", "🔊 System Audio Monitoring"))
-        self.system_audio_group.setMinimumHeight(self.scale(400))
         system_audio_layout = QVBoxLayout()
-        system_audio_layout.setSpacing(self.scale(15))
+        system_audio_layout.setSpacing(self._s[15])
+        
+        # Toggling several apps in a row refreshes the status label once
+        self._monitoring_timer = QTimer(self)
+        self._monitoring_timer.setSingleShot(True)
+        self._monitoring_timer.setInterval(80)
+        self._monitoring_timer.timeout.connect(self.update_monitoring_status)
         
         # Full system audio monitoring toggle
         self.full_system_audio = QCheckBox(t("settings.audio.system_audio.full_monitoring", "Monitor all system audio (overrides specific app selection)"))
-        self.full_system_audio.setMinimumHeight(self.scale(32))
-        self.full_system_audio.setStyleSheet("font-weight: 600; color: #ffffff;")
+        self.full_system_audio.setObjectName("fullSystemAudio")
         self.full_system_audio.toggled.connect(self.on_full_system_audio_changed)
-        self.full_system_audio.toggled.connect(self.update_monitoring_status)
+        self.full_system_audio.toggled.connect(self._queue_monitoring_status)
         system_audio_layout.addWidget(self.full_system_audio)
         
         # Separator line
         separator = QFrame()
         separator.setFrameShape(QFrame.HLine)
         separator.setFrameShadow(QFrame.Sunken)
-        separator.setStyleSheet("color: #404040; background-color: #404040;")
+        separator.setObjectName("sectionSeparator")
         system_audio_layout.addWidget(separator)
         
         # Application selection
         self.app_selection_label = QLabel(t("settings.audio.system_audio.select_apps", "Select specific applications to monitor:"))
-        self.app_selection_label.setStyleSheet("color: #e6e6e6; font-style: italic; margin-top: 10px;")
-        self.app_selection_label.setMinimumHeight(self.scale(28))
+        self.app_selection_label.setProperty("class", "info")
         system_audio_layout.addWidget(self.app_selection_label)
         
         # Add status indicator
         self.monitoring_status = QLabel(t("settings.audio.system_audio.monitoring_status", "📊 Currently monitoring: Loading..."))
-        self.monitoring_status.setStyleSheet("color: #0078d4; font-weight: 600; margin-bottom: 10px; padding: 8px; background: #1a1a1a; border-radius: 4px;")
-        self.monitoring_status.setMinimumHeight(self.scale(32))
+        self.monitoring_status.setObjectName("monitoringStatus")
         self.monitoring_status.setWordWrap(True)
         system_audio_layout.addWidget(self.monitoring_status)
         
-        # Create a grid layout for application checkboxes
-        apps_widget = QWidget()
-        apps_layout = QGridLayout(apps_widget)
-        apps_layout.setSpacing(self.scale(15))
-        
-        # Meeting/Conferencing Applications (default enabled)
-        meeting_apps = [
-            ("Google Meet", "google_meet", "🟢"),
-            ("Zoom", "zoom", "🔵"),
-            ("Microsoft Teams", "teams", "🟣"),
-            ("Skype", "skype", "🔷"),
-            ("Discord", "discord", "🟦"),
-            ("Slack", "slack", "🟨"),
-            ("WebEx", "webex", "🟧"),
-            ("GoToMeeting", "gotomeeting", "🟫")
-        ]
-        
-        # Communication & Productivity Apps
-        other_apps = [
-            ("Chrome/Edge Browser", "browser", "🌐"),
-            ("Firefox", "firefox", "🦊"),
-            ("Spotify", "spotify", "🎵"),
-            ("YouTube", "youtube", "📺"),
-            ("VLC Media Player", "vlc", "🎬"),
-            ("OBS Studio", "obs", "📹"),
-            ("Custom Application", "custom", "⚙️")
-        ]
-        
-        self.app_checkboxes = {}
-        
-        # Add meeting apps (left column)
-        self.meeting_label = QLabel(t("settings.audio.system_audio.meeting_apps", "📞 Meeting & Communication Apps (Enabled by Default)"))
-        self.meeting_label.setStyleSheet("font-weight: 600; color: #0078d4; margin-bottom: 5px;")
-        self.meeting_label.setMinimumHeight(self.scale(32))
-        apps_layout.addWidget(self.meeting_label, 0, 0, 1, 2)
-        
-        row = 1
-        for app_name, app_key, emoji in meeting_apps:
-            checkbox = QCheckBox(f"{emoji} {app_name}")
-            checkbox.setMinimumHeight(self.scale(32))
-            checkbox.setChecked(True)  # Default to enabled for meeting apps
-            checkbox.setStyleSheet("""
-                QCheckBox {
-                    color: #ffffff;
-                    font-weight: 500;
-                }
-                QCheckBox::indicator:checked {
-                    background: #0078d4;
-                    border: 2px solid #0078d4;
-                }
-            """)
-            checkbox.toggled.connect(self.update_monitoring_status)
-            self.app_checkboxes[app_key] = checkbox
-            apps_layout.addWidget(checkbox, row, 0)
-            row += 1
-        
-        # Add other apps (right column)
-        self.other_label = QLabel(t("settings.audio.system_audio.other_apps", "🖥️ Other Applications (Disabled by Default)"))
-        self.other_label.setStyleSheet("font-weight: 600; color: #666666; margin-bottom: 5px;")
-        self.other_label.setMinimumHeight(self.scale(32))
-        apps_layout.addWidget(self.other_label, 0, 2, 1, 2)
-        
-        row = 1
-        for app_name, app_key, emoji in other_apps:
-            checkbox = QCheckBox(f"{emoji} {app_name}")
-            checkbox.setMinimumHeight(self.scale(32))
-            checkbox.setChecked(False)  # Default to disabled for other apps
-            checkbox.setStyleSheet("""
-                QCheckBox {
-                    color: #ffffff;
-                    font-weight: 500;
-                }
-                QCheckBox::indicator:checked {
-                    background: #0078d4;
-                    border: 2px solid #0078d4;
-                }
-            """)
-            checkbox.toggled.connect(self.update_monitoring_status)
-            self.app_checkboxes[app_key] = checkbox
-            apps_layout.addWidget(checkbox, row, 2)
-            row += 1
+        # One checkable list for all applications; the view paints the check
+        # indicators, so there is no QCheckBox widget per application
+        self.apps_list = QListWidget()
+        self.apps_list.setSizeAdjustPolicy(QAbstractScrollArea.AdjustToContents)
+        self.app_items = {}
+        
+        self.meeting_header = self._add_app_header(t("settings.audio.system_audio.meeting_apps", "📞 Meeting & Communication Apps (Enabled by Default)"))
+        for app_key, label, enabled in self._MONITORED_APPS:
+            if enabled:
+                self._add_app_item(app_key, label, True)
+        
+        self.other_header = self._add_app_header(t("settings.audio.system_audio.other_apps", "🖥️ Other Applications (Disabled by Default)"))
+        for app_key, label, enabled in self._MONITORED_APPS:
+            if not enabled:
+                self._add_app_item(app_key, label, False)
+        
+        self.apps_list.itemChanged.connect(self._queue_monitoring_status)
+        self.apps_list.itemChanged.connect(self._mark_dirty)
+        system_audio_layout.addWidget(self.apps_list)
         
         # Custom application input
         custom_layout = QHBoxLayout()
-        self.custom_app_input = QLineEdit()
-        self.custom_app_input.setPlaceholderText(t("settings.audio.system_audio.custom_app", "Enter custom application name (e.g., MyApp.exe)"))
-        self.custom_app_input.setMinimumHeight(self.scale(40))
-        self.custom_app_input.setStyleSheet("QLineEdit { color: #ffffff; } QLineEdit::placeholder { color: #a0a0a0; }")
+        self.custom_app_input = _ApiLineEdit(t("settings.audio.system_audio.custom_app", "Enter custom application name (e.g., MyApp.exe)"))
         
         self.add_custom_btn = QPushButton(t("settings.audio.system_audio.add_custom", "➕ Add"))
-        self.add_custom_btn.setMinimumHeight(self.scale(40))
-        self.add_custom_btn.setMaximumWidth(self.scale(80))
+        self.add_custom_btn.setObjectName("addCustomApp")
         self.add_custom_btn.clicked.connect(self.add_custom_application)
         
         custom_layout.addWidget(self.custom_app_input)
         custom_layout.addWidget(self.add_custom_btn)
-        apps_layout.addLayout(custom_layout, row, 2, 1, 2)
-        
-        system_audio_layout.addWidget(apps_widget)
+        system_audio_layout.addLayout(custom_layout)
         
         # Audio filtering options
         self.filter_label = QLabel(t("settings.audio.system_audio.filtering", "🎛️ Audio Filtering:"))
-        self.filter_label.setStyleSheet("font-weight: 600; color: #ffffff; margin-top: 15px;")
-        self.filter_label.setMinimumHeight(self.scale(28))
+        self.filter_label.setProperty("class", "section")
         system_audio_layout.addWidget(self.filter_label)
         
         self.filter_music = QCheckBox(t("settings.audio.system_audio.filter_music", "🎵 Filter out music and non-speech audio (recommended)"))
-        self.filter_music.setMinimumHeight(self.scale(32))
         self.filter_music.setChecked(True)
-        self.filter_music.setToolTip(t("settings.audio.system_audio.filter_music_tooltip", "Uses AI to detect and ignore music, sound effects, and other non-speech audio"))
+        self._lazy_tooltip(self.filter_music, "settings.audio.system_audio.filter_music_tooltip", "Uses AI to detect and ignore music, sound effects, and other non-speech audio")
         system_audio_layout.addWidget(self.filter_music)
         
         self.speech_detection_threshold = QSlider(Qt.Horizontal)
         self.speech_detection_threshold.setRange(10, 90)
         self.speech_detection_threshold.setValue(60)
-        self.speech_detection_threshold.setMinimumHeight(self.scale(40))
         self.speech_threshold_label = QLabel("60%")
-        self.speech_threshold_label.setMinimumWidth(self.scale(50))
-        self.speech_threshold_label.setMinimumHeight(self.scale(28))
-        self.speech_detection_threshold.valueChanged.connect(
-            lambda v: self.speech_threshold_label.setText(f"{v}%")
-        )
+        self.speech_threshold_label.setProperty("class", "value")
+        self.speech_detection_threshold.valueChanged.connect(self._on_speech_detection_threshold_changed)
         
         threshold_layout = QHBoxLayout()
         threshold_layout.addWidget(QLabel(t("settings.audio.system_audio.speech_sensitivity", "Speech Detection Sensitivity:")))
@@ -496,18 +984,14 @@ class ModernSettingsDialog(QDialog):
         
         # Transcription Provider
         self.transcription_group = QGroupBox(t("settings.audio.transcription.title", "📝 Transcription Settings"))
-        self.transcription_group.setMinimumHeight(self.scale(500))  # Increased for more content
         transcription_layout = QVBoxLayout()
-        transcription_layout.setSpacing(self.scale(15))
+        transcription_layout.setSpacing(self._s[15])
         
         # Provider selection
-        provider_form = QFormLayout()
-        provider_form.setSpacing(self.scale(20))
-        provider_form.setLabelAlignment(Qt.AlignLeft)
+        provider_form = _FormLayout(self._s[20])
         
         self.transcription_provider = QComboBox()
-        self.transcription_provider.addItems(["local_whisper", "google_speech", "azure_speech", "openai_whisper"])
-        self.transcription_provider.setMinimumHeight(self.scale(40))
+        self.transcription_provider.addItems(_TRANSCRIPTION_PROVIDERS)
         self.transcription_provider.currentTextChanged.connect(self.on_transcription_provider_changed)
         provider_form.addRow(t("settings.audio.transcription.provider", "Provider:"), self.transcription_provider)
         
@@ -515,14 +999,10 @@ class ModernSettingsDialog(QDialog):
         
         # Local Whisper Settings
         self.whisper_group = QGroupBox(t("settings.audio.transcription.whisper.title", "🤖 Local Whisper Configuration"))
-        self.whisper_group.setMinimumHeight(self.scale(120))
-        whisper_layout = QFormLayout()
-        whisper_layout.setSpacing(self.scale(15))
-        whisper_layout.setLabelAlignment(Qt.AlignLeft)
+        whisper_layout = _FormLayout(self._s[15])
         
         self.whisper_model = QComboBox()
-        self.whisper_model.addItems(["tiny", "base", "small", "medium", "large"])
-        self.whisper_model.setMinimumHeight(self.scale(40))
+        self.whisper_model.addItems(_WHISPER_MODELS)
         whisper_layout.addRow(t("settings.audio.transcription.whisper.model_size", "Model Size:"), self.whisper_model)
         
         self.whisper_group.setLayout(whisper_layout)
@@ -530,20 +1010,15 @@ class ModernSettingsDialog(QDialog):
         
         # Google Speech Settings
         self.google_speech_group = QGroupBox(t("settings.audio.transcription.google_speech.title", "🔴 Google Speech-to-Text Configuration"))
-        self.google_speech_group.setMinimumHeight(self.scale(200))
         google_layout = QVBoxLayout()
-        google_layout.setSpacing(self.scale(15))
+        google_layout.setSpacing(self._s[15])
         
         # JSON config file option
         json_file_layout = QHBoxLayout()
-        self.google_json_file = QLineEdit()
-        self.google_json_file.setPlaceholderText(t("settings.audio.transcription.google_speech.json_file", "Path to Google Cloud service account JSON file"))
-        self.google_json_file.setMinimumHeight(self.scale(40))
-        self.google_json_file.setStyleSheet("QLineEdit { color: #ffffff; } QLineEdit::placeholder { color: #a0a0a0; }")
+        self.google_json_file = _ApiLineEdit(t("settings.audio.transcription.google_speech.json_file", "Path to Google Cloud service account JSON file"))
         
         self.browse_json_btn = QPushButton(t("settings.audio.transcription.google_speech.browse", "📁 Browse"))
-        self.browse_json_btn.setMinimumHeight(self.scale(40))
-        self.browse_json_btn.setMaximumWidth(self.scale(100))
+        self.browse_json_btn.setObjectName("browseJsonFile")
         self.browse_json_btn.clicked.connect(self.browse_google_json_file)
         
         json_file_layout.addWidget(QLabel(t("settings.audio.transcription.google_speech.json_file", "Service Account JSON File:")))
@@ -553,10 +1028,10 @@ class ModernSettingsDialog(QDialog):
         
         # Alternative: Direct JSON input
         google_layout.addWidget(QLabel(t("settings.audio.transcription.google_speech.json_content", "Or paste JSON content:")))
-        self.google_json_content = QTextEdit()
-        self.google_json_content.setMinimumHeight(self.scale(100))
+        # Plain-text editor: pasted service-account JSON needs no rich-text layout
+        self.google_json_content = QPlainTextEdit()
+        self.google_json_content.setObjectName("googleJsonContent")
         self.google_json_content.setPlaceholderText(t("settings.audio.transcription.google_speech.json_placeholder", '{\n  "type": "service_account",\n  "project_id": "your-project",\n  "private_key_id": "...",\n  ...\n}'))
-        self.google_json_content.setStyleSheet("QTextEdit { color: #ffffff; font-family: 'Consolas', monospace; }")
         google_layout.addWidget(self.google_json_content)
         
         self.google_speech_group.setLayout(google_layout)
@@ -564,61 +1039,30 @@ class ModernSettingsDialog(QDialog):
         
         # Azure Speech Settings
         self.azure_speech_group = QGroupBox(t("settings.audio.transcription.azure_speech.title", "🔷 Azure Speech Services Configuration"))
-        self.azure_speech_group.setMinimumHeight(self.scale(250))
-        azure_speech_layout = QFormLayout()
-        azure_speech_layout.setSpacing(self.scale(20))
-        azure_speech_layout.setLabelAlignment(Qt.AlignLeft)
-        
-        self.azure_speech_key = QLineEdit()
-        self.azure_speech_key.setPlaceholderText(t("settings.audio.transcription.azure_speech.api_key_placeholder", "Your Azure Speech API key"))
-        self.azure_speech_key.setEchoMode(QLineEdit.Password)
-        self.azure_speech_key.setMinimumHeight(self.scale(40))
-        self.azure_speech_key.setStyleSheet("QLineEdit { color: #ffffff; } QLineEdit::placeholder { color: #a0a0a0; }")
+        azure_speech_layout = _FormLayout(self._s[20])
+        
+        self.azure_speech_key = _ApiLineEdit(t("settings.audio.transcription.azure_speech.api_key_placeholder", "Your Azure Speech API key"), password=True)
         azure_speech_layout.addRow(t("settings.audio.transcription.azure_speech.api_key", "API Key:"), self.azure_speech_key)
         
-        self.azure_speech_region = QLineEdit()
-        self.azure_speech_region.setPlaceholderText(t("settings.audio.transcription.azure_speech.region_placeholder", "eastus"))
-        self.azure_speech_region.setMinimumHeight(self.scale(40))
-        self.azure_speech_region.setStyleSheet("QLineEdit { color: #ffffff; } QLineEdit::placeholder { color: #a0a0a0; }")
+        self.azure_speech_region = _ApiLineEdit(t("settings.audio.transcription.azure_speech.region_placeholder", "eastus"))
         azure_speech_layout.addRow(t("settings.audio.transcription.azure_speech.region", "Region:"), self.azure_speech_region)
         
-        self.azure_speech_endpoint = QLineEdit()
-        self.azure_speech_endpoint.setPlaceholderText(t("settings.audio.transcription.azure_speech.endpoint_placeholder", "https://your-region.api.cognitive.microsoft.com/ (optional)"))
-        self.azure_speech_endpoint.setMinimumHeight(self.scale(40))
-        self.azure_speech_endpoint.setStyleSheet("QLineEdit { color: #ffffff; } QLineEdit::placeholder { color: #a0a0a0; }")
+        self.azure_speech_endpoint = _ApiLineEdit(t("settings.audio.transcription.azure_speech.endpoint_placeholder", "https://your-region.api.cognitive.microsoft.com/ (optional)"))
         azure_speech_layout.addRow(t("settings.audio.transcription.azure_speech.endpoint", "Custom Endpoint:"), self.azure_speech_endpoint)
         
-        self.azure_speech_language = QComboBox()
-        self.azure_speech_language.addItems(["en-US", "en-GB", "es-ES", "fr-FR", "de-DE", "it-IT", "pt-BR", "zh-CN", "ja-JP", "ko-KR"])
-        self.azure_speech_language.setMinimumHeight(self.scale(40))
-        azure_speech_layout.addRow(t("settings.audio.transcription.azure_speech.language", "Language:"), self.azure_speech_language)
+        self._add_form_rows(azure_speech_layout, self._AZURE_SPEECH_FIELDS, QComboBox)
         
         self.azure_speech_group.setLayout(azure_speech_layout)
         transcription_layout.addWidget(self.azure_speech_group)
         
         # OpenAI Whisper API Settings
         self.openai_whisper_group = QGroupBox(t("settings.audio.transcription.openai_whisper.title", "🟢 OpenAI Whisper API Configuration"))
-        self.openai_whisper_group.setMinimumHeight(self.scale(200))
-        openai_whisper_layout = QFormLayout()
-        openai_whisper_layout.setSpacing(self.scale(20))
-        openai_whisper_layout.setLabelAlignment(Qt.AlignLeft)
-        
-        self.openai_whisper_api_key = QLineEdit()
-        self.openai_whisper_api_key.setPlaceholderText(t("settings.audio.transcription.openai_whisper.api_key_placeholder", "Your OpenAI API key"))
-        self.openai_whisper_api_key.setEchoMode(QLineEdit.Password)
-        self.openai_whisper_api_key.setMinimumHeight(self.scale(40))
-        self.openai_whisper_api_key.setStyleSheet("QLineEdit { color: #ffffff; } QLineEdit::placeholder { color: #a0a0a0; }")
-        openai_whisper_layout.addRow(t("settings.audio.transcription.openai_whisper.api_key", "API Key:"), self.openai_whisper_api_key)
+        openai_whisper_layout = _FormLayout(self._s[20])
         
-        self.openai_whisper_model = QComboBox()
-        self.openai_whisper_model.addItems(["whisper-1"])
-        self.openai_whisper_model.setMinimumHeight(self.scale(40))
-        openai_whisper_layout.addRow(t("settings.audio.transcription.openai_whisper.model", "Model:"), self.openai_whisper_model)
+        self.openai_whisper_api_key = _ApiLineEdit(t("settings.audio.transcription.openai_whisper.api_key_placeholder", "Your OpenAI API key"), password=True)
+        openai_whisper_layout.addRow(t("settings.audio.transcription.openai_whisper.api_key", "API Key:"), self.openai_whisper_api_key)
         
-        self.openai_whisper_language = QComboBox()
-        self.openai_whisper_language.addItems(["auto-detect", "en", "es", "fr", "de", "it", "pt", "zh", "ja", "ko"])
-        self.openai_whisper_language.setMinimumHeight(self.scale(40))
-        openai_whisper_layout.addRow(t("settings.audio.transcription.openai_whisper.language", "Language:"), self.openai_whisper_language)
+        self._add_form_rows(openai_whisper_layout, self._OPENAI_WHISPER_FIELDS, QComboBox)
         
         self.openai_whisper_group.setLayout(openai_whisper_layout)
         transcription_layout.addWidget(self.openai_whisper_group)
@@ -627,34 +1071,12 @@ class ModernSettingsDialog(QDialog):
         layout.addWidget(self.transcription_group)
         
         layout.addStretch()
-        
-        # Set the widget to the scroll area and configure scroll area
-        tab.setWidget(content)
-        tab.setWidgetResizable(True)
-        tab.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        tab.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        
-        self.tab_widget.addTab(tab, t("settings.tabs.audio", "🎤 Audio"))
     
-    def setup_ui_tab(self):
+    def setup_ui_tab(self, layout):
         """Setup UI settings tab"""
-        tab = QScrollArea()
-        content = QWidget()
-        
-        # Set proper size policy for content to expand
-        content.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        content.setMinimumSize(self.scale(1200), self.scale(600))
-        
-        layout = QVBoxLayout(content)
-        layout.setSpacing(self.scale(25))
-        layout.setContentsMargins(self.scale(30), self.scale(30), self.scale(30), self.scale(30))
-        
         # Appearance
         self.appearance_group = QGroupBox(t("settings.appearance.title", "🎨 Appearance"))
-        self.appearance_group.setMinimumHeight(self.scale(500))  # Increased height for theme option
-        appearance_layout = QFormLayout()
-        appearance_layout.setSpacing(self.scale(20))
-        appearance_layout.setLabelAlignment(Qt.AlignLeft)
+        appearance_layout = _FormLayout(self._s[20])
         
         # Language Selection
         self.language_selector = QComboBox()
@@ -665,113 +1087,70 @@ class ModernSettingsDialog(QDialog):
                 self.language_selector.addItem(f"{lang_name} ({lang_code})", lang_code)
         else:
             self.language_selector.addItem("English (en)", "en")
-        self.language_selector.setMinimumHeight(self.scale(40))
-        self.language_selector.setToolTip(t("settings.language.tooltip", "Select the interface language"))
-        self.language_selector.currentIndexChanged.connect(self.on_language_changed)
-        self.language_label = QLabel(t("settings.language.label", "Language:"))
-        appearance_layout.addRow(self.language_label, self.language_selector)
+        self._lazy_tooltip(self.language_selector, "settings.language.tooltip", "Select the interface language")
+        self.language_selector.currentIndexChanged.connect(_qthrottled(self.on_language_changed, ms=0, parent=self))
+        self._add_row(appearance_layout, "settings.language.label", "Language:", self.language_selector, dynamic=True)
         
         # Theme Selection
         self.theme_selector = QComboBox()
-        self.theme_selector.addItems([t("settings.theme.dark", "Dark Mode"), t("settings.theme.light", "Light Mode")])
-        self.theme_selector.setMinimumHeight(self.scale(40))
-        self.theme_selector.setToolTip(t("settings.theme.tooltip", "Choose between light and dark theme"))
-        self.theme_selector.currentTextChanged.connect(self.on_theme_changed)
-        self.theme_label = QLabel(t("settings.theme.label", "Theme:"))
-        appearance_layout.addRow(self.theme_label, self.theme_selector)
+        for theme_name, key, label in self._THEME_CHOICES:
+            self.theme_selector.addItem(t(key, label), theme_name)
+        self._lazy_tooltip(self.theme_selector, "settings.theme.tooltip", "Choose between light and dark theme")
+        self.theme_selector.currentIndexChanged.connect(_qthrottled(self.on_theme_changed, ms=0, parent=self))
+        self._add_row(appearance_layout, "settings.theme.label", "Theme:", self.theme_selector, dynamic=True)
         
         self.size_multiplier = QSlider(Qt.Horizontal)
         self.size_multiplier.setRange(10, 40)
         self.size_multiplier.setValue(10)
-        self.size_multiplier.setMinimumHeight(self.scale(40))
         self.size_label = QLabel("1.0x")
-        self.size_label.setMinimumWidth(self.scale(60))
-        self.size_label.setMinimumHeight(self.scale(28))
-        self.size_multiplier.valueChanged.connect(
-            lambda v: self.size_label.setText(f"{v/10:.1f}x")
-        )
+        self.size_label.setProperty("class", "value")
+        self.size_multiplier.valueChanged.connect(_qthrottled(self._on_size_multiplier_changed, parent=self))
         
         size_layout = QHBoxLayout()
         size_layout.addWidget(self.size_multiplier)
         size_layout.addWidget(self.size_label)
-        self.size_multiplier_label = QLabel(t("settings.size_multiplier.label", "Size Multiplier:"))
-        appearance_layout.addRow(self.size_multiplier_label, size_layout)
+        self._add_row(appearance_layout, "settings.size_multiplier.label", "Size Multiplier:", size_layout, dynamic=True)
         
         self.show_transcript = QCheckBox(t("settings.show_transcript.label", "Show live transcript in expanded view"))
-        self.show_transcript.setMinimumHeight(self.scale(32))
         appearance_layout.addRow("", self.show_transcript)
         
         self.hide_from_sharing = QCheckBox(t("settings.hide_from_sharing.label", "Hide from screen sharing"))
-        self.hide_from_sharing.setMinimumHeight(self.scale(32))
         appearance_layout.addRow("", self.hide_from_sharing)
         
         self.auto_hide_seconds = QSpinBox()
         self.auto_hide_seconds.setRange(0, 60)
         self.auto_hide_seconds.setSuffix(t("settings.auto_hide.suffix", " seconds (0 = disabled)"))
-        self.auto_hide_seconds.setMinimumHeight(self.scale(40))
-        self.auto_hide_label = QLabel(t("settings.auto_hide.label", "Auto-hide Timer:"))
-        appearance_layout.addRow(self.auto_hide_label, self.auto_hide_seconds)
+        self._add_row(appearance_layout, "settings.auto_hide.label", "Auto-hide Timer:", self.auto_hide_seconds, dynamic=True)
         
         # Screen sharing detection
         self.enable_screen_sharing_detection = QCheckBox(t("settings.screen_sharing.label", "Enable screen sharing detection"))
-        self.enable_screen_sharing_detection.setMinimumHeight(self.scale(32))
-        self.enable_screen_sharing_detection.setToolTip(t("settings.screen_sharing.tooltip", "Automatically hide overlay when screen sharing apps are detected"))
+        self._lazy_tooltip(self.enable_screen_sharing_detection, "settings.screen_sharing.tooltip", "Automatically hide overlay when screen sharing apps are detected")
         appearance_layout.addRow("", self.enable_screen_sharing_detection)
         
         # Hide overlay for screenshots/debugging
         self.hide_overlay_for_screenshots = QCheckBox(t("settings.hide_screenshots.label", "Hide overlay for screenshots/debugging"))
-        self.hide_overlay_for_screenshots.setMinimumHeight(self.scale(32))
-        self.hide_overlay_for_screenshots.setToolTip(t("settings.hide_screenshots.tooltip", "Temporarily hide the entire overlay for taking clean screenshots or debugging UI issues"))
+        self._lazy_tooltip(self.hide_overlay_for_screenshots, "settings.hide_screenshots.tooltip", "Temporarily hide the entire overlay for taking clean screenshots or debugging UI issues")
         self.hide_overlay_for_screenshots.toggled.connect(self.on_hide_overlay_toggled)
         appearance_layout.addRow("", self.hide_overlay_for_screenshots)
         
         # Enhanced UI Features Group
         self.enhanced_group = QGroupBox(t("settings.enhanced_features.title", "🚀 Enhanced Features"))
-        self.enhanced_group.setMinimumHeight(self.scale(350))
-        enhanced_layout = QFormLayout()
-        enhanced_layout.setSpacing(self.scale(20))
-        enhanced_layout.setLabelAlignment(Qt.AlignLeft)
+        enhanced_layout = _FormLayout(self._s[20])
         
         # Background opacity slider
         self.background_opacity = QSlider(Qt.Horizontal)
         self.background_opacity.setRange(5, 50)  # 0.05 to 0.5 opacity
         self.background_opacity.setValue(15)  # Default 0.15
-        self.background_opacity.setMinimumHeight(self.scale(40))
         self.opacity_label = QLabel("0.15")
-        self.opacity_label.setMinimumWidth(self.scale(60))
-        self.background_opacity.valueChanged.connect(
-            lambda v: self.opacity_label.setText(f"{v/100:.2f}")
-        )
+        self.opacity_label.setProperty("class", "value")
+        self.background_opacity.valueChanged.connect(self._on_background_opacity_changed)
         
         opacity_layout = QHBoxLayout()
         opacity_layout.addWidget(self.background_opacity)
         opacity_layout.addWidget(self.opacity_label)
-        self.background_opacity_label = QLabel(t("settings.background_opacity.label", "Background Opacity:"))
-        enhanced_layout.addRow(self.background_opacity_label, opacity_layout)
-        
-        # Blur effects
-        self.enable_blur_effects = QCheckBox(t("settings.blur_effects.label", "Enable blur effects"))
-        self.enable_blur_effects.setMinimumHeight(self.scale(32))
-        self.enable_blur_effects.setToolTip(t("settings.blur_effects.tooltip", "Apply blur effects to background for professional look"))
-        enhanced_layout.addRow("", self.enable_blur_effects)
-        
-        # Smooth animations
-        self.enable_smooth_animations = QCheckBox(t("settings.smooth_animations.label", "Enable smooth animations"))
-        self.enable_smooth_animations.setMinimumHeight(self.scale(32))
-        self.enable_smooth_animations.setToolTip(t("settings.smooth_animations.tooltip", "Use smooth animations for transitions and resizing"))
-        enhanced_layout.addRow("", self.enable_smooth_animations)
-        
-        # Auto-width adjustment
-        self.enable_auto_width = QCheckBox(t("settings.auto_width.label", "Enable auto-width adjustment"))
-        self.enable_auto_width.setMinimumHeight(self.scale(32))
-        self.enable_auto_width.setToolTip(t("settings.auto_width.tooltip", "Automatically adjust overlay width based on content"))
-        enhanced_layout.addRow("", self.enable_auto_width)
-        
-        # Dynamic transparency
-        self.enable_dynamic_transparency = QCheckBox(t("settings.dynamic_transparency.label", "Enable dynamic transparency"))
-        self.enable_dynamic_transparency.setMinimumHeight(self.scale(32))
-        self.enable_dynamic_transparency.setToolTip(t("settings.dynamic_transparency.tooltip", "Adjust transparency based on activity and context"))
-        enhanced_layout.addRow("", self.enable_dynamic_transparency)
+        self._add_row(enhanced_layout, "settings.background_opacity.label", "Background Opacity:", opacity_layout, dynamic=True)
+        
+        self._add_flag_rows(enhanced_layout, self._ENHANCED_FLAGS)
         
         self.enhanced_group.setLayout(enhanced_layout)
         
@@ -780,111 +1159,47 @@ class ModernSettingsDialog(QDialog):
         layout.addWidget(self.enhanced_group)
         
         layout.addStretch()
-        
-        # Set the widget to the scroll area and configure scroll area
-        tab.setWidget(content)
-        tab.setWidgetResizable(True)
-        tab.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        tab.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        
-        self.tab_widget.addTab(tab, t("settings.tabs.interface", "🖥️ Interface"))
     
-    def setup_assistant_tab(self):
+    def setup_assistant_tab(self, layout):
         """Setup MeetMinder behavior tab"""
-        tab = QScrollArea()
-        content = QWidget()
-        
-        # Set proper size policy for content to expand
-        content.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        content.setMinimumSize(self.scale(1200), self.scale(600))  # Set minimum size
-        
-        layout = QVBoxLayout(content)
-        layout.setSpacing(self.scale(25))
-        layout.setContentsMargins(self.scale(30), self.scale(30), self.scale(30), self.scale(30))
-        
         # Behavior Settings
         self.behavior_group = QGroupBox(t("settings.assistant.title", "🧠 Assistant Behavior"))
-        self.behavior_group.setMinimumHeight(self.scale(400))  # Set minimum height for group
-        behavior_layout = QFormLayout()
-        behavior_layout.setSpacing(self.scale(20))  # Increased spacing
-        behavior_layout.setLabelAlignment(Qt.AlignLeft)
-        
-        self.activation_mode = QComboBox()
-        self.activation_mode.addItems(["manual", "auto"])
-        self.activation_mode.setMinimumHeight(self.scale(40))  # Larger height
-        behavior_layout.addRow(t("settings.assistant.activation_mode", "Activation Mode:"), self.activation_mode)
-        
-        self.verbosity = QComboBox()
-        self.verbosity.addItems(["concise", "standard", "detailed"])
-        self.verbosity.setMinimumHeight(self.scale(40))
-        behavior_layout.addRow(t("settings.assistant.verbosity", "Response Verbosity:"), self.verbosity)
-        
-        self.response_style = QComboBox()
-        self.response_style.addItems(["professional", "casual", "technical"])
-        self.response_style.setMinimumHeight(self.scale(40))
-        behavior_layout.addRow(t("settings.assistant.response_style", "Response Style:"), self.response_style)
-        
-        self.input_prioritization = QComboBox()
-        self.input_prioritization.addItems(["mic", "system_audio", "balanced"])
-        self.input_prioritization.setMinimumHeight(self.scale(40))
-        behavior_layout.addRow(t("settings.assistant.input_priority", "Input Priority:"), self.input_prioritization)
+        behavior_layout = _FormLayout(self._s[20])
+        
+        self._add_form_rows(behavior_layout, self._ASSISTANT_FIELDS, QComboBox)
         
         self.behavior_group.setLayout(behavior_layout)
         layout.addWidget(self.behavior_group)
         
         layout.addStretch()
-        
-        # Set the widget to the scroll area and configure scroll area
-        tab.setWidget(content)
-        tab.setWidgetResizable(True)
-        tab.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        tab.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        
-        self.tab_widget.addTab(tab, t("settings.tabs.assistant", "🧠 Assistant"))
     
-    def setup_prompts_tab(self):
+    def setup_prompts_tab(self, layout):
         """Setup prompts configuration tab"""
-        tab = QScrollArea()
-        content = QWidget()
-        
-        # Set proper size policy for content to expand
-        content.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        content.setMinimumSize(self.scale(1200), self.scale(600))
-        
-        layout = QVBoxLayout(content)
-        layout.setSpacing(self.scale(25))
-        layout.setContentsMargins(self.scale(30), self.scale(30), self.scale(30), self.scale(30))
-        
         # System Prompt
         self.prompt_group = QGroupBox(t("settings.prompts.title", "📝 AI Prompt Configuration"))
-        self.prompt_group.setMinimumHeight(self.scale(500))
         prompt_layout = QVBoxLayout()
-        prompt_layout.setSpacing(self.scale(15))
+        prompt_layout.setSpacing(self._s[15])
         
         self.prompt_info = QLabel(t("settings.prompts.info", "Customize the MeetMinder assistant's behavior and response style:"))
-        self.prompt_info.setStyleSheet("color: #e6e6e6; font-style: italic;")
-        self.prompt_info.setMinimumHeight(self.scale(28))
+        self.prompt_info.setProperty("class", "info")
         prompt_layout.addWidget(self.prompt_info)
         
         self.system_prompt = QTextEdit()
-        self.system_prompt.setMinimumHeight(self.scale(350))
+        self.system_prompt.setObjectName("systemPrompt")
         self.system_prompt.setPlaceholderText(t("settings.prompts.placeholder", "Enter system prompt that defines the MeetMinder assistant's behavior, tone, and expertise..."))
         prompt_layout.addWidget(self.system_prompt)
         
         # Load/Save buttons
         button_layout = QHBoxLayout()
-        button_layout.setSpacing(self.scale(15))
+        button_layout.setSpacing(self._s[15])
         
         self.load_prompt_btn = QPushButton(t("settings.prompts.load_file", "📁 Load from File"))
-        self.load_prompt_btn.setMinimumHeight(self.scale(40))
         self.load_prompt_btn.clicked.connect(self.load_prompt_file)
         
         self.save_prompt_btn = QPushButton(t("settings.prompts.save_file", "💾 Save to File"))
-        self.save_prompt_btn.setMinimumHeight(self.scale(40))
         self.save_prompt_btn.clicked.connect(self.save_prompt_file)
         
         self.reset_prompt_btn = QPushButton(t("settings.prompts.reset_default", "🔄 Reset to Default"))
-        self.reset_prompt_btn.setMinimumHeight(self.scale(40))
         self.reset_prompt_btn.clicked.connect(self.reset_prompt_to_default)
         
         button_layout.addWidget(self.load_prompt_btn)
@@ -897,53 +1212,27 @@ class ModernSettingsDialog(QDialog):
         layout.addWidget(self.prompt_group)
         
         layout.addStretch()
-        
-        # Set the widget to the scroll area and configure scroll area
-        tab.setWidget(content)
-        tab.setWidgetResizable(True)
-        tab.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        tab.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        
-        self.tab_widget.addTab(tab, t("settings.tabs.prompts", "📝 Prompts"))
     
-    def setup_knowledge_tab(self):
+    def setup_knowledge_tab(self, layout):
         """Setup knowledge graph management tab"""
-        tab = QScrollArea()
-        content = QWidget()
-        
-        # Set proper size policy for content to expand
-        content.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        content.setMinimumSize(self.scale(1200), self.scale(600))
-        
-        layout = QVBoxLayout(content)
-        layout.setSpacing(self.scale(25))
-        layout.setContentsMargins(self.scale(30), self.scale(30), self.scale(30), self.scale(30))
-        
         # Knowledge Graph Settings
         self.knowledge_group = QGroupBox(t("settings.knowledge.title", "🧠 Knowledge Graph"))
-        self.knowledge_group.setMinimumHeight(self.scale(500))
         knowledge_layout = QVBoxLayout()
-        knowledge_layout.setSpacing(self.scale(15))
+        knowledge_layout.setSpacing(self._s[15])
         
         # Enable/disable
         self.enable_topic_graph = QCheckBox(t("settings.knowledge.enable", "Enable topic analysis and suggestions"))
-        self.enable_topic_graph.setMinimumHeight(self.scale(32))
         knowledge_layout.addWidget(self.enable_topic_graph)
         
         # Settings
-        settings_layout = QFormLayout()
-        settings_layout.setSpacing(self.scale(20))
-        settings_layout.setLabelAlignment(Qt.AlignLeft)
+        settings_layout = _FormLayout(self._s[20])
         
         self.matching_threshold = QSlider(Qt.Horizontal)
         self.matching_threshold.setRange(1, 100)
         self.matching_threshold.setValue(60)
-        self.matching_threshold.setMinimumHeight(self.scale(40))
         self.matching_label = QLabel("60%")
-        self.matching_label.setMinimumHeight(self.scale(28))
-        self.matching_threshold.valueChanged.connect(
-            lambda v: self.matching_label.setText(f"{v}%")
-        )
+        self.matching_label.setProperty("class", "value")
+        self.matching_threshold.valueChanged.connect(_qthrottled(self._on_matching_threshold_changed, ms=16, parent=self))
         
         threshold_layout = QHBoxLayout()
         threshold_layout.addWidget(self.matching_threshold)
@@ -953,36 +1242,31 @@ class ModernSettingsDialog(QDialog):
         self.max_matches = QSpinBox()
         self.max_matches.setRange(1, 10)
         self.max_matches.setValue(3)
-        self.max_matches.setMinimumHeight(self.scale(40))
         settings_layout.addRow(t("settings.knowledge.max_matches", "Max Suggestions:"), self.max_matches)
         
         knowledge_layout.addLayout(settings_layout)
         
         # Topic definitions
         self.topic_info = QLabel(t("settings.knowledge.topic_definitions", "Topic Definitions:"))
-        self.topic_info.setStyleSheet("color: #e6e6e6; margin-top: 15px;")
-        self.topic_info.setMinimumHeight(self.scale(28))
+        self.topic_info.setProperty("class", "hint")
         knowledge_layout.addWidget(self.topic_info)
         
         self.topic_definitions = QTextEdit()
-        self.topic_definitions.setMinimumHeight(self.scale(250))
-        self.topic_definitions.setPlaceholderText(t("settings.knowledge.topic_definitions_placeholder", "Example topic definitions:\n\nMeeting Management: Strategies for organizing and running effective meetings\nProject Planning: Techniques for project planning and execution\nTechnical Discussions: Handling technical topics and problem-solving\nClient Communication: Best practices for client interactions\n\nEnter one topic per line with format: Topic Name: Description"))
+        self.topic_definitions.setObjectName("topicDefinitions")
+        self.topic_definitions.setPlaceholderText(t("settings.knowledge.topic_definitions_placeholder", DEFAULT_TOPIC_PLACEHOLDER))
         knowledge_layout.addWidget(self.topic_definitions)
         
         # Buttons
         topic_button_layout = QHBoxLayout()
-        topic_button_layout.setSpacing(self.scale(15))
+        topic_button_layout.setSpacing(self._s[15])
         
         self.import_topics_btn = QPushButton(t("settings.knowledge.import_topics", "📁 Import Topics"))
-        self.import_topics_btn.setMinimumHeight(self.scale(40))
         self.import_topics_btn.clicked.connect(self.import_topics)
         
         self.export_topics_btn = QPushButton(t("settings.knowledge.export_topics", "💾 Export Topics"))
-        self.export_topics_btn.setMinimumHeight(self.scale(40))
         self.export_topics_btn.clicked.connect(self.export_topics)
         
         self.clear_topics_btn = QPushButton(t("settings.knowledge.clear_all", "🗑️ Clear All"))
-        self.clear_topics_btn.setMinimumHeight(self.scale(40))
         self.clear_topics_btn.clicked.connect(self.clear_topics)
         
         topic_button_layout.addWidget(self.import_topics_btn)
@@ -995,55 +1279,32 @@ class ModernSettingsDialog(QDialog):
         layout.addWidget(self.knowledge_group)
         
         layout.addStretch()
-        
-        # Set the widget to the scroll area and configure scroll area
-        tab.setWidget(content)
-        tab.setWidgetResizable(True)
-        tab.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        tab.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        
-        self.tab_widget.addTab(tab, t("settings.tabs.knowledge", "🧠 Knowledge"))
 
-    def setup_documents_tab(self):
+    def setup_documents_tab(self, layout):
         """Setup document management tab"""
-        tab = QScrollArea()
-        content = QWidget()
-
-        # Set proper size policy for content to expand
-        content.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        content.setMinimumSize(self.scale(1200), self.scale(600))
-
-        layout = QVBoxLayout(content)
-        layout.setSpacing(self.scale(25))
-        layout.setContentsMargins(self.scale(30), self.scale(30), self.scale(30), self.scale(30))
-
         # Document Store Settings
         self.doc_settings_group = QGroupBox(t("settings.documents.title", "📚 Document Store Configuration"))
-        self.doc_settings_group.setMinimumHeight(self.scale(200))
         doc_settings_layout = QVBoxLayout()
-        doc_settings_layout.setSpacing(self.scale(15))
+        doc_settings_layout.setSpacing(self._s[15])
 
         self.documents_enabled = QCheckBox(t("settings.documents.enabled", "Enable document storage and retrieval"))
-        self.documents_enabled.setMinimumHeight(self.scale(32))
-        self.documents_enabled.setToolTip(t("settings.documents.enabled", "Enable document storage and retrieval"))
+        self._lazy_tooltip(self.documents_enabled, "settings.documents.enabled", "Enable document storage and retrieval")
         doc_settings_layout.addWidget(self.documents_enabled)
 
         # Chunking settings
         chunk_layout = QHBoxLayout()
-        chunk_layout.setSpacing(self.scale(15))
+        chunk_layout.setSpacing(self._s[15])
 
         chunk_layout.addWidget(QLabel(t("settings.documents.chunk_size", "Chunk Size:")))
         self.chunk_size = QSpinBox()
         self.chunk_size.setRange(500, 2000)
         self.chunk_size.setValue(1000)
-        self.chunk_size.setMinimumHeight(self.scale(35))
         chunk_layout.addWidget(self.chunk_size)
 
         chunk_layout.addWidget(QLabel(t("settings.documents.chunk_overlap", "Chunk Overlap:")))
         self.chunk_overlap = QSpinBox()
         self.chunk_overlap.setRange(0, 500)
         self.chunk_overlap.setValue(200)
-        self.chunk_overlap.setMinimumHeight(self.scale(35))
         chunk_layout.addWidget(self.chunk_overlap)
 
         chunk_layout.addStretch()
@@ -1055,7 +1316,6 @@ class ModernSettingsDialog(QDialog):
         self.max_context_chunks = QSpinBox()
         self.max_context_chunks.setRange(1, 10)
         self.max_context_chunks.setValue(5)
-        self.max_context_chunks.setMinimumHeight(self.scale(35))
         max_chunks_layout.addWidget(self.max_context_chunks)
         max_chunks_layout.addStretch()
         doc_settings_layout.addLayout(max_chunks_layout)
@@ -1065,16 +1325,14 @@ class ModernSettingsDialog(QDialog):
 
         # Embedding Configuration
         self.embedding_group = QGroupBox(t("settings.documents.embedding_provider_title", "🧮 Embedding Provider"))
-        self.embedding_group.setMinimumHeight(self.scale(150))
         embedding_layout = QVBoxLayout()
-        embedding_layout.setSpacing(self.scale(15))
+        embedding_layout.setSpacing(self._s[15])
 
         # Provider selection
         provider_layout = QHBoxLayout()
         provider_layout.addWidget(QLabel(t("settings.documents.embedding_provider", "Embedding Provider:")))
         self.embedding_provider = QComboBox()
-        self.embedding_provider.addItems(["local", "openai"])
-        self.embedding_provider.setMinimumHeight(self.scale(35))
+        self.embedding_provider.addItems(_EMBEDDING_PROVIDERS)
         provider_layout.addWidget(self.embedding_provider)
         provider_layout.addStretch()
         embedding_layout.addLayout(provider_layout)
@@ -1083,12 +1341,7 @@ class ModernSettingsDialog(QDialog):
         model_layout = QHBoxLayout()
         model_layout.addWidget(QLabel(t("settings.documents.embedding_model", "Embedding Model:")))
         self.embedding_model = QComboBox()
-        self.embedding_model.addItems([
-            "all-MiniLM-L6-v2",
-            "all-mpnet-base-v2",
-            "e5-small-v2"
-        ])
-        self.embedding_model.setMinimumHeight(self.scale(35))
+        self.embedding_model.addItems(_EMBEDDING_MODELS)
         model_layout.addWidget(self.embedding_model)
         model_layout.addStretch()
         embedding_layout.addLayout(model_layout)
@@ -1098,15 +1351,13 @@ class ModernSettingsDialog(QDialog):
 
         # Vector Backend Configuration
         self.vector_group = QGroupBox(t("settings.documents.vector_storage_title", "💾 Vector Storage"))
-        self.vector_group.setMinimumHeight(self.scale(100))
         vector_layout = QVBoxLayout()
-        vector_layout.setSpacing(self.scale(15))
+        vector_layout.setSpacing(self._s[15])
 
         backend_layout = QHBoxLayout()
         backend_layout.addWidget(QLabel(t("settings.documents.vector_backend", "Vector Backend:")))
         self.vector_backend = QComboBox()
-        self.vector_backend.addItems(["faiss", "pinecone"])
-        self.vector_backend.setMinimumHeight(self.scale(35))
+        self.vector_backend.addItems(_VECTOR_BACKENDS)
         backend_layout.addWidget(self.vector_backend)
         backend_layout.addStretch()
         vector_layout.addLayout(backend_layout)
@@ -1116,30 +1367,33 @@ class ModernSettingsDialog(QDialog):
 
         # Document Management
         self.management_group = QGroupBox(t("settings.documents.management_title", "📁 Document Management"))
-        self.management_group.setMinimumHeight(self.scale(200))
         management_layout = QVBoxLayout()
-        management_layout.setSpacing(self.scale(15))
+        management_layout.setSpacing(self._s[15])
 
         # Upload button
         upload_layout = QHBoxLayout()
         self.upload_button = QPushButton(t("settings.documents.upload", "📤 Upload Document"))
-        self.upload_button.setMinimumHeight(self.scale(40))
         self.upload_button.clicked.connect(self.upload_document)
         upload_layout.addWidget(self.upload_button)
 
         self.refresh_button = QPushButton(t("settings.documents.refresh_list", "🔄 Refresh List"))
-        self.refresh_button.setMinimumHeight(self.scale(40))
-        self.refresh_button.clicked.connect(self.refresh_documents)
+        self.refresh_button.clicked.connect(self._refresh_documents_now)
         upload_layout.addWidget(self.refresh_button)
 
         upload_layout.addStretch()
         management_layout.addLayout(upload_layout)
 
-        # Document list placeholder
-        self.documents_list = QTextEdit()
-        self.documents_list.setMinimumHeight(self.scale(150))
-        self.documents_list.setPlaceholderText(t("settings.documents.uploaded_documents", "Uploaded documents will appear here..."))
-        self.documents_list.setReadOnly(True)
+        # Store statistics and status messages above the document rows
+        self.documents_summary = QLabel(t("settings.documents.uploaded_documents", "Uploaded documents will appear here..."))
+        self.documents_summary.setWordWrap(True)
+        management_layout.addWidget(self.documents_summary)
+        
+        self.documents_model = _DocumentListModel(self)
+        self.documents_list = QListView()
+        self.documents_list.setObjectName("documentsList")
+        self.documents_list.setModel(self.documents_model)
+        self.documents_list.setUniformItemSizes(True)
+        self.documents_list.setEditTriggers(QListView.NoEditTriggers)
         management_layout.addWidget(self.documents_list)
 
         self.management_group.setLayout(management_layout)
@@ -1147,178 +1401,184 @@ class ModernSettingsDialog(QDialog):
 
         layout.addStretch()
 
-        # Set the widget to the scroll area and configure scroll area
-        tab.setWidget(content)
-        tab.setWidgetResizable(True)
-        tab.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        tab.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-
-        self.tab_widget.addTab(tab, t("settings.tabs.documents", "📚 Documents"))
-
     def upload_document(self):
         """Handle document upload"""
-        file_dialog = QFileDialog()
-        file_dialog.setFileMode(QFileDialog.ExistingFile)
-        file_dialog.setNameFilter("Documents (*.pdf *.docx *.doc *.txt *.md *.pptx *.ppt *.xlsx *.xls *.py *.js *.java *.cpp *.c *.html *.css *.json *.xml)")
-
-        if file_dialog.exec_():
-            file_path = file_dialog.selectedFiles()[0]
+        file_path = self._pick_file("upload", t("messages.select_document", "Select Document"), _DOCUMENT_FILTER)
+        if file_path:
+            # A typed file name can bypass the picker's filter
+            suffix = Path(file_path).suffix
+            if suffix[1:].lower() not in _DOCUMENT_EXTENSIONS:
+                QMessageBox.warning(self,
+                                  t("messages.upload_failed", "Upload Failed"),
+                                  t("messages.unsupported_document_msg", "Unsupported document type: {ext}").format(ext=suffix or file_path))
+                return
             if hasattr(self.parent(), 'ai_helper') and self.parent().ai_helper:
-                try:
-                    import asyncio
-                    doc_id = asyncio.run(self.parent().ai_helper.add_document_async(file_path))
-                    QMessageBox.information(self, 
-                                          t("messages.document_uploaded", "Document Uploaded"),
-                                          t("messages.document_uploaded_msg", "Document uploaded successfully!\nID: {doc_id}\n\nProcessing in background...").format(doc_id=doc_id))
-                    self.refresh_documents()
-                except Exception as e:
-                    QMessageBox.warning(self, 
-                                      t("messages.upload_failed", "Upload Failed"), 
-                                      t("messages.upload_failed_msg", "Failed to upload document: {error}").format(error=str(e)))
+                # Run on the shared background loop; _on_upload_finished
+                # reports the result back on the GUI thread
+                future = asyncio.run_coroutine_threadsafe(
+                    self.parent().ai_helper.add_document_async(file_path), _get_background_loop())
+                self.upload_button.setEnabled(False)
+                _when_done(future, self._on_upload_finished)
             else:
                 QMessageBox.warning(self, 
                                   t("messages.ai_helper_not_available", "AI Helper Not Available"),
                                   t("messages.ai_helper_not_available_msg", "AI helper is not available. Please check your AI provider configuration."))
 
+    def _on_upload_finished(self, future):
+        """Report a finished upload and refresh the list (GUI thread)"""
+        self.upload_button.setEnabled(True)
+        try:
+            doc_id = future.result()
+        except Exception as e:
+            QMessageBox.warning(self, 
+                              t("messages.upload_failed", "Upload Failed"), 
+                              t("messages.upload_failed_msg", "Failed to upload document: {error}").format(error=str(e)))
+            return
+        QMessageBox.information(self, 
+                              t("messages.document_uploaded", "Document Uploaded"),
+                              t("messages.document_uploaded_msg", "Document uploaded successfully!\nID: {doc_id}\n\nProcessing in background...").format(doc_id=doc_id))
+        self._refresh_documents_now()
+    
+    def _refresh_documents_now(self):
+        """Drop the cached listing and refresh the document list"""
+        # A listing still in flight may predate the change; ignore it
+        self._docs_cache = self._docs_loading = None
+        self.refresh_documents()
+    
     def refresh_documents(self):
-        """Refresh the document list"""
-        if hasattr(self.parent(), 'ai_helper') and self.parent().ai_helper:
-            try:
-                documents = self.parent().ai_helper.list_documents()
-                stats = self.parent().ai_helper.get_document_store_stats()
-
-                text = t("settings.documents.statistics_title", "📊 Document Store Statistics:") + "\n"
-                if stats:
-                    text += t("settings.documents.total_documents", "Total Documents:") + f" {stats.get('total_documents', 0)}\n"
-                    text += t("settings.documents.completed", "Completed:") + f" {stats.get('completed_documents', 0)}\n"
-                    text += t("settings.documents.failed", "Failed:") + f" {stats.get('failed_documents', 0)}\n"
-                    text += t("settings.documents.total_chunks", "Total Chunks:") + f" {stats.get('total_chunks', 0)}\n"
-                    text += t("settings.documents.embedding", "Embedding:") + f" {stats.get('embedding_provider', 'none')}\n"
-                    text += t("settings.documents.vector_backend_label", "Vector Backend:") + f" {stats.get('vector_backend', 'none')}\n\n"
-
-                text += t("settings.documents.documents_list_title", "📁 Documents:") + "\n"
-                if documents:
-                    for doc in documents:
-                        status_emoji = {
-                            "pending": "⏳",
-                            "processing": "🔄",
-                            "completed": "✅",
-                            "failed": "❌"
-                        }.get(doc.get('status', 'unknown'), "❓")
-
-                        file_name = doc.get('file_name', t("settings.documents.unknown", "Unknown"))
-                        text += f"{status_emoji} {file_name} "
-                        text += f"(ID: {doc.get('id', 'N/A')[:8]}...)\n"
-                        status_label = t("settings.documents.status_label", "Status:")
-                        status_value = doc.get('status', t("settings.documents.unknown", "unknown"))
-                        text += f"   {status_label} {status_value}\n"
-                        if doc.get('error_message'):
-                            error_label = t("settings.documents.error_label", "Error:")
-                            text += f"   {error_label} {doc.get('error_message')}\n"
-                        text += "\n"
-                else:
-                    text += t("settings.documents.no_documents_uploaded", "No documents uploaded yet.") + "\n"
+        """Refresh the document list, querying the store off the GUI thread"""
+        helper = getattr(self.parent(), 'ai_helper', None)
+        if not helper:
+            self.documents_model.set_documents(())
+            self.documents_summary.setText(t("messages.ai_helper_not_available_msg", "AI helper is not available. Please check your AI provider configuration."))
+            return
+        if self._docs_cache is not None and time.monotonic() - self._docs_cache_ts < self._DOCS_CACHE_TTL:
+            self._show_documents(*self._docs_cache)
+        elif self._docs_loading is None:
+            # The store may hit disk; _on_documents_loaded shows the result
+            self._docs_loading = asyncio.run_coroutine_threadsafe(_list_documents(helper), _get_background_loop())
+            _when_done(self._docs_loading, self._on_documents_loaded)
+    
+    def _on_documents_loaded(self, future):
+        """Cache and show a finished document listing (GUI thread)"""
+        if future is not self._docs_loading:
+            return
+        self._docs_loading = None
+        try:
+            listing = future.result()
+            self._show_documents(*listing)
+        except Exception as e:
+            error_msg = t("settings.documents.error_loading", "Error loading documents: {error}").format(error=str(e))
+            self.documents_summary.setText(error_msg)
+            self.documents_model.set_documents(())
+            return
+        self._docs_cache, self._docs_cache_ts = listing, time.monotonic()
+    
+    def _show_documents(self, documents, stats):
+        """Fill the summary label and list model from a listing"""
+        parts = [t("settings.documents.statistics_title", "📊 Document Store Statistics:"), "\n"]
+        if stats:
+            for key, default, stat, missing in (
+                ("settings.documents.total_documents", "Total Documents:", 'total_documents', 0),
+                ("settings.documents.completed", "Completed:", 'completed_documents', 0),
+                ("settings.documents.failed", "Failed:", 'failed_documents', 0),
+                ("settings.documents.total_chunks", "Total Chunks:", 'total_chunks', 0),
+                ("settings.documents.embedding", "Embedding:", 'embedding_provider', 'none'),
+                ("settings.documents.vector_backend_label", "Vector Backend:", 'vector_backend', 'none'),
+            ):
+                parts.append(f"{t(key, default)} {stats.get(stat, missing)}\n")
+            parts.append("\n")
 
-                self.documents_list.setPlainText(text)
-            except Exception as e:
-                error_msg = t("settings.documents.error_loading", "Error loading documents: {error}").format(error=str(e))
-                self.documents_list.setPlainText(error_msg)
-        else:
-            self.documents_list.setPlainText(t("messages.ai_helper_not_available_msg", "AI helper is not available. Please check your AI provider configuration."))
+        parts.append(t("settings.documents.documents_list_title", "📁 Documents:"))
+        if not documents:
+            parts += ("\n", t("settings.documents.no_documents_uploaded", "No documents uploaded yet."))
+
+        self.documents_summary.setText("".join(parts))
+        self.documents_model.set_documents(documents or ())
 
-    def setup_hotkeys_tab(self):
+    def setup_hotkeys_tab(self, layout):
         """Setup hotkeys configuration tab"""
-        tab = QScrollArea()
-        content = QWidget()
-        
-        # Set proper size policy for content to expand
-        content.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        content.setMinimumSize(self.scale(1200), self.scale(600))
-        
-        layout = QVBoxLayout(content)
-        layout.setSpacing(self.scale(25))
-        layout.setContentsMargins(self.scale(30), self.scale(30), self.scale(30), self.scale(30))
-        
         # Hotkeys
         self.hotkeys_group = QGroupBox(t("settings.hotkeys.title", "⌨️ Global Hotkeys"))
-        self.hotkeys_group.setMinimumHeight(self.scale(350))
-        hotkeys_layout = QFormLayout()
-        hotkeys_layout.setSpacing(self.scale(20))
-        hotkeys_layout.setLabelAlignment(Qt.AlignLeft)
-        
-        self.trigger_assistance = QLineEdit()
-        self.trigger_assistance.setMinimumHeight(self.scale(40))
-        hotkeys_layout.addRow(t("settings.hotkeys.trigger_ai", "Trigger AI:"), self.trigger_assistance)
-        
-        self.toggle_overlay = QLineEdit()
-        self.toggle_overlay.setMinimumHeight(self.scale(40))
-        hotkeys_layout.addRow(t("settings.hotkeys.toggle_overlay", "Toggle Overlay:"), self.toggle_overlay)
-        
-        self.take_screenshot = QLineEdit()
-        self.take_screenshot.setMinimumHeight(self.scale(40))
-        hotkeys_layout.addRow(t("settings.hotkeys.screenshot", "Screenshot:"), self.take_screenshot)
+        hotkeys_layout = _FormLayout(self._s[20])
         
-        self.emergency_reset = QLineEdit()
-        self.emergency_reset.setMinimumHeight(self.scale(40))
-        hotkeys_layout.addRow(t("settings.hotkeys.emergency_reset", "Emergency Reset:"), self.emergency_reset)
-        
-        self.toggle_hide_for_screenshots = QLineEdit()
-        self.toggle_hide_for_screenshots.setMinimumHeight(self.scale(40))
-        self.toggle_hide_for_screenshots.setPlaceholderText(t("settings.hotkeys.toggle_hide_placeholder", "e.g., Ctrl+H"))
-        self.toggle_hide_for_screenshots.setToolTip(t("settings.hotkeys.toggle_hide_placeholder", "e.g., Ctrl+H"))
-        hotkeys_layout.addRow(t("settings.hotkeys.toggle_hide", "Toggle Hide Overlay:"), self.toggle_hide_for_screenshots)
+        self._add_form_rows(hotkeys_layout, self._HOTKEY_FIELDS, QLineEdit)
+        placeholder = t("settings.hotkeys.toggle_hide_placeholder", "e.g., Ctrl+H")
+        self.toggle_hide_for_screenshots.setPlaceholderText(placeholder)
+        self.toggle_hide_for_screenshots.setToolTip(placeholder)
         
         self.hotkeys_group.setLayout(hotkeys_layout)
         layout.addWidget(self.hotkeys_group)
         
         layout.addStretch()
-        
-        # Set the widget to the scroll area and configure scroll area
-        tab.setWidget(content)
-        tab.setWidgetResizable(True)
-        tab.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        tab.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        
-        self.tab_widget.addTab(tab, t("settings.tabs.hotkeys", "⌨️ Hotkeys"))
     
-    def setup_debug_tab(self):
+    def _add_row(self, form, key: str, default: str, field, dynamic: bool = False):
+        """Add a translated form row; ``field`` may be a widget or a layout
+        
+        Static rows use the string overload, letting QFormLayout create the
+        label. ``dynamic`` rows get a QLabel that refresh_translations
+        updates in place when the language changes.
+        """
+        if not dynamic:
+            form.addRow(t(key, default), field)
+            return
+        label = QLabel(t(key, default))
+        self._retranslatable.append((label, key, default))
+        form.addRow(label, field)
+    
+    def _lazy_tooltip(self, widget, key: str, default: str):
+        """Give ``widget`` a tooltip that is only translated on first hover"""
+        self._tooltips[widget] = (key, default)
+    
+    def event(self, event):
+        # A widget without tooltip text leaves QEvent.ToolTip unhandled, so
+        # it reaches the dialog; resolve a registered tooltip there once
+        if event.type() == QEvent.ToolTip and self._tooltips:
+            widget = self.childAt(event.pos())
+            while widget is not None and widget is not self:
+                tip = self._tooltips.get(widget)
+                if tip is not None:
+                    widget.setToolTip(t(*tip))
+                    QToolTip.showText(event.globalPos(), widget.toolTip(), widget)
+                    return True
+                widget = widget.parentWidget()
+        return super().event(event)
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._translations_stale:
+            self.refresh_translations()
+    
+    def _add_flag_rows(self, form, flags):
+        """Create one checkbox per (attribute, key, label, tooltip key, tooltip) row"""
+        for attr, key, label, tip_key, tip in flags:
+            checkbox = QCheckBox(t(key, label))
+            self._lazy_tooltip(checkbox, tip_key, tip)
+            setattr(self, attr, checkbox)
+            form.addRow("", checkbox)
+    
+    def _add_form_rows(self, form, fields, widget_cls):
+        """Create one ``widget_cls`` per (attribute, translation key, label[, items]) row"""
+        for attr, key, label, *items in fields:
+            widget = widget_cls()
+            if items:
+                widget.addItems(items[0])
+            setattr(self, attr, widget)
+            self._add_row(form, key, label, widget)
+    
+    def setup_debug_tab(self, layout):
         """Setup debug settings tab"""
-        tab = QScrollArea()
-        content = QWidget()
-        
-        # Set proper size policy for content to expand
-        content.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        content.setMinimumSize(self.scale(1200), self.scale(600))
-        
-        layout = QVBoxLayout(content)
-        layout.setSpacing(self.scale(25))
-        layout.setContentsMargins(self.scale(30), self.scale(30), self.scale(30), self.scale(30))
-        
         # Debug Settings
         self.debug_group = QGroupBox(t("settings.debug.title", "🐛 Debug & Logging"))
-        self.debug_group.setMinimumHeight(self.scale(400))
         debug_layout = QVBoxLayout()
-        debug_layout.setSpacing(self.scale(15))
-        
-        self.debug_enabled = QCheckBox(t("settings.debug.enabled", "Enable debug mode"))
-        self.debug_enabled.setMinimumHeight(self.scale(32))
-        debug_layout.addWidget(self.debug_enabled)
-        
-        self.verbose_logging = QCheckBox(t("settings.debug.verbose_logging", "Verbose logging"))
-        self.verbose_logging.setMinimumHeight(self.scale(32))
-        debug_layout.addWidget(self.verbose_logging)
+        debug_layout.setSpacing(self._s[15])
         
-        self.save_transcriptions = QCheckBox(t("settings.debug.save_transcriptions", "Save transcriptions to files"))
-        self.save_transcriptions.setMinimumHeight(self.scale(32))
-        debug_layout.addWidget(self.save_transcriptions)
+        for attr, key, label in self._DEBUG_FLAGS:
+            checkbox = QCheckBox(t(key, label))
+            setattr(self, attr, checkbox)
+            debug_layout.addWidget(checkbox)
         
-        self.save_audio_chunks = QCheckBox(t("settings.debug.save_audio", "Save audio chunks to files"))
-        self.save_audio_chunks.setMinimumHeight(self.scale(32))
-        debug_layout.addWidget(self.save_audio_chunks)
-        
-        form_layout = QFormLayout()
-        form_layout.setSpacing(self.scale(20))
-        form_layout.setLabelAlignment(Qt.AlignLeft)
+        form_layout = _FormLayout(self._s[20])
         
         self.max_debug_files = QSpinBox()
         self.max_debug_files.setRange(10, 1000)
@@ -1330,46 +1590,70 @@ class ModernSettingsDialog(QDialog):
         layout.addWidget(self.debug_group)
         
         layout.addStretch()
-        
-        # Set the widget to the scroll area and configure scroll area
-        tab.setWidget(content)
-        tab.setWidgetResizable(True)
-        tab.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        tab.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        
-        self.tab_widget.addTab(tab, t("settings.tabs.debug", "🐛 Debug"))
+    
+    # Slider value labels; bound methods rather than per-connection lambdas
+    def _on_processing_interval_changed(self, value):
+        self.processing_label.setText(_PROCESSING_TEXTS[value])
+    
+    def _on_speech_detection_threshold_changed(self, value):
+        self.speech_threshold_label.setText(_SPEECH_THRESHOLD_TEXTS[value])
+    
+    def _on_size_multiplier_changed(self, value):
+        self.size_label.setText(_SIZE_TEXTS[value])
+    
+    def _on_background_opacity_changed(self, value):
+        self.opacity_label.setText(_OPACITY_TEXTS[value])
+    
+    def _on_matching_threshold_changed(self, value):
+        self.matching_label.setText(_MATCHING_TEXTS[value])
     
     def on_provider_changed(self, provider):
-        """Handle AI provider selection change"""
-        self.azure_group.setVisible(provider == "azure_openai")
-        self.openai_group.setVisible(provider == "openai")
-        self.gemini_group.setVisible(provider == "google_gemini")
-        self.deepseek_group.setVisible(provider == "deepseek")
-        self.claude_group.setVisible(provider == "claude")
+        """Show the selected provider's page, building it on first use"""
+        if provider not in self._provider_pages:
+            return
+        index = self._provider_pages[provider]
+        spec = self._unbuilt_providers.pop(provider, None)
+        if spec is not None:
+            page = self.provider_stack.widget(index)
+            # Attach and fill the finished group with repaints held off, as
+            # _ensure_tab_built does for whole tabs
+            page.setUpdatesEnabled(False)
+            try:
+                page.layout().addWidget(self._build_provider_group(*spec))
+                rows = [row for row in self._CONFIG_BINDINGS['ai_provider']
+                        if row[0].startswith(f'ai_provider.{provider}.')]
+                self._apply_bindings(rows)
+                self._track_changes(row[1] for row in rows)
+            finally:
+                page.setUpdatesEnabled(True)
+        self.provider_stack.setCurrentIndex(index)
+    
+    def _show_only_group(self, groups, selected):
+        """Show the group mapped to ``selected`` and hide the rest in one repaint"""
+        # Only touch groups whose own hidden flag flips (isVisible() would
+        # also depend on the tab being on screen); re-enabling updates
+        # repaints the whole dialog, so a no-op switch must not get there
+        changes = [(getattr(self, attr), key == selected) for key, attr in groups.items()
+                   if getattr(self, attr).isHidden() == (key == selected)]
+        if not changes:
+            return
+        self.setUpdatesEnabled(False)
+        try:
+            # Hide first so the layout never holds two visible groups at once
+            for widget, show in sorted(changes, key=lambda change: change[1]):
+                widget.setVisible(show)
+        finally:
+            self.setUpdatesEnabled(True)
     
     def on_full_system_audio_changed(self, checked):
         """Handle full system audio monitoring toggle"""
-        # Disable/enable specific app checkboxes when full monitoring is toggled
-        for checkbox in self.app_checkboxes.values():
-            checkbox.setEnabled(not checked)
-        
-        # Update custom app input
+        # Per-application choices do not apply while everything is monitored
+        self.apps_list.setEnabled(not checked)
         self.custom_app_input.setEnabled(not checked)
-        
-        # Visual feedback
-        if checked:
-            for checkbox in self.app_checkboxes.values():
-                checkbox.setStyleSheet("color: #666666;")
-        else:
-            for checkbox in self.app_checkboxes.values():
-                checkbox.setStyleSheet("color: #ffffff;")
     
     def on_transcription_provider_changed(self, provider):
         """Handle transcription provider selection change"""
-        self.whisper_group.setVisible(provider == "local_whisper")
-        self.google_speech_group.setVisible(provider == "google_speech")
-        self.azure_speech_group.setVisible(provider == "azure_speech")
-        self.openai_whisper_group.setVisible(provider == "openai_whisper")
+        self._show_only_group(self._TRANSCRIPTION_GROUPS, provider)
     
     def on_language_changed(self, index):
         """Handle language change"""
@@ -1388,212 +1672,43 @@ class ModernSettingsDialog(QDialog):
         """Refresh all UI text with current translations"""
         if not TRANSLATIONS_AVAILABLE:
             return
+        # Nobody sees a hidden dialog's text; catch up in showEvent instead
+        if not self.isVisible():
+            self._translations_stale = True
+            return
+        self._translations_stale = False
         
         try:
             # Update window title
             self.setWindowTitle(t("settings.title", "MeetMinder Settings"))
             
-            # Update tab labels
-            if hasattr(self, 'tab_widget'):
-                for i in range(self.tab_widget.count()):
-                    tab_text = self.tab_widget.tabText(i)
-                    # Map emoji tabs to translation keys
-                    tab_mapping = {
-                        "🤖 AI Provider": t("settings.tabs.ai_provider", "🤖 AI Provider"),
-                        "🎤 Audio": t("settings.tabs.audio", "🎤 Audio"),
-                        "🖥️ Interface": t("settings.tabs.interface", "🖥️ Interface"),
-                        "🧠 Assistant": t("settings.tabs.assistant", "🧠 Assistant"),
-                        "📝 Prompts": t("settings.tabs.prompts", "📝 Prompts"),
-                        "🧠 Knowledge": t("settings.tabs.knowledge", "🧠 Knowledge"),
-                        "📚 Documents": t("settings.tabs.documents", "📚 Documents"),
-                        "⌨️ Hotkeys": t("settings.tabs.hotkeys", "⌨️ Hotkeys"),
-                        "🐛 Debug": t("settings.tabs.debug", "🐛 Debug")
-                    }
-                    if tab_text in tab_mapping:
-                        self.tab_widget.setTabText(i, tab_mapping[tab_text])
-            
-            # Update button labels
-            if hasattr(self, 'save_button'):
-                self.save_button.setText(t("settings.buttons.save", "💾 Save Settings"))
-            if hasattr(self, 'cancel_button'):
-                self.cancel_button.setText(t("settings.buttons.cancel", "❌ Cancel"))
-            if hasattr(self, 'reset_button'):
-                self.reset_button.setText(t("settings.buttons.reset", "🔄 Reset to Defaults"))
-            
-            # Update Interface tab labels
-            if hasattr(self, 'language_label'):
-                self.language_label.setText(t("settings.language.label", "Language:"))
-            if hasattr(self, 'theme_label'):
-                self.theme_label.setText(t("settings.theme.label", "Theme:"))
-            if hasattr(self, 'size_multiplier_label'):
-                self.size_multiplier_label.setText(t("settings.size_multiplier.label", "Size Multiplier:"))
-            if hasattr(self, 'auto_hide_label'):
-                self.auto_hide_label.setText(t("settings.auto_hide.label", "Auto-hide Timer:"))
-            if hasattr(self, 'auto_hide_seconds'):
-                self.auto_hide_seconds.setSuffix(t("settings.auto_hide.suffix", " seconds (0 = disabled)"))
-            if hasattr(self, 'background_opacity_label'):
-                self.background_opacity_label.setText(t("settings.background_opacity.label", "Background Opacity:"))
+            # Update tab labels by index; the current text may be in any language
+            for index, (key, default) in self._tab_titles.items():
+                self.tab_widget.setTabText(index, t(key, default))
             
-            # Update Interface tab checkboxes and labels
-            if hasattr(self, 'show_transcript'):
-                self.show_transcript.setText(t("settings.show_transcript.label", "Show live transcript in expanded view"))
-            if hasattr(self, 'hide_from_sharing'):
-                self.hide_from_sharing.setText(t("settings.hide_from_sharing.label", "Hide from screen sharing"))
-            if hasattr(self, 'enable_screen_sharing_detection'):
-                self.enable_screen_sharing_detection.setText(t("settings.screen_sharing.label", "Enable screen sharing detection"))
-                self.enable_screen_sharing_detection.setToolTip(t("settings.screen_sharing.tooltip", "Automatically hide overlay when screen sharing apps are detected"))
-            if hasattr(self, 'hide_overlay_for_screenshots'):
-                self.hide_overlay_for_screenshots.setText(t("settings.hide_screenshots.label", "Hide overlay for screenshots/debugging"))
-                self.hide_overlay_for_screenshots.setToolTip(t("settings.hide_screenshots.tooltip", "Temporarily hide the entire overlay for taking clean screenshots or debugging UI issues"))
-            if hasattr(self, 'enable_blur_effects'):
-                self.enable_blur_effects.setText(t("settings.blur_effects.label", "Enable blur effects"))
-                self.enable_blur_effects.setToolTip(t("settings.blur_effects.tooltip", "Apply blur effects to background for professional look"))
-            if hasattr(self, 'enable_smooth_animations'):
-                self.enable_smooth_animations.setText(t("settings.smooth_animations.label", "Enable smooth animations"))
-                self.enable_smooth_animations.setToolTip(t("settings.smooth_animations.tooltip", "Use smooth animations for transitions and resizing"))
-            if hasattr(self, 'enable_auto_width'):
-                self.enable_auto_width.setText(t("settings.auto_width.label", "Enable auto-width adjustment"))
-                self.enable_auto_width.setToolTip(t("settings.auto_width.tooltip", "Automatically adjust overlay width based on content"))
-            if hasattr(self, 'enable_dynamic_transparency'):
-                self.enable_dynamic_transparency.setText(t("settings.dynamic_transparency.label", "Enable dynamic transparency"))
-                self.enable_dynamic_transparency.setToolTip(t("settings.dynamic_transparency.tooltip", "Adjust transparency based on activity and context"))
+            # Update the fixed widget texts from the _RETRANSLATE table
+            for attr, setter, key, default in self._RETRANSLATE:
+                widget = getattr(self, attr, None)
+                if widget is not None:
+                    getattr(widget, setter)(t(key, default))
+            for attr, key, label, *_ in self._ENHANCED_FLAGS + self._DEBUG_FLAGS:
+                widget = getattr(self, attr, None)
+                if widget is not None:
+                    widget.setText(t(key, label))
             
-            # Update group box titles
-            if hasattr(self, 'appearance_group'):
-                self.appearance_group.setTitle(t("settings.appearance.title", "🎨 Appearance"))
-            if hasattr(self, 'enhanced_group'):
-                self.enhanced_group.setTitle(t("settings.enhanced_features.title", "🚀 Enhanced Features"))
-            if hasattr(self, 'provider_group'):
-                self.provider_group.setTitle(t("settings.ai_provider.title", "🤖 AI Provider"))
-            if hasattr(self, 'azure_group'):
-                self.azure_group.setTitle(t("settings.ai_provider.azure.title", "🔷 Azure OpenAI Configuration"))
-            if hasattr(self, 'openai_group'):
-                self.openai_group.setTitle(t("settings.ai_provider.openai.title", "🟢 OpenAI Configuration"))
-            if hasattr(self, 'gemini_group'):
-                self.gemini_group.setTitle(t("settings.ai_provider.gemini.title", "🔴 Google Gemini Configuration"))
-            if hasattr(self, 'deepseek_group'):
-                self.deepseek_group.setTitle(t("settings.ai_provider.deepseek.title", "🧠 DeepSeek Configuration"))
-            if hasattr(self, 'claude_group'):
-                self.claude_group.setTitle(t("settings.ai_provider.claude.title", "🎭 Claude Configuration"))
-            if hasattr(self, 'mode_group'):
-                self.mode_group.setTitle(t("settings.audio.title", "🎤 Audio Configuration"))
-            if hasattr(self, 'system_audio_group'):
-                self.system_audio_group.setTitle(t("settings.audio.system_audio.title", "🔊 System Audio Monitoring"))
-            if hasattr(self, 'transcription_group'):
-                self.transcription_group.setTitle(t("settings.audio.transcription.title", "📝 Transcription Settings"))
-            if hasattr(self, 'whisper_group'):
-                self.whisper_group.setTitle(t("settings.audio.transcription.whisper.title", "🤖 Local Whisper Configuration"))
-            if hasattr(self, 'google_speech_group'):
-                self.google_speech_group.setTitle(t("settings.audio.transcription.google_speech.title", "🔴 Google Speech-to-Text Configuration"))
-            if hasattr(self, 'azure_speech_group'):
-                self.azure_speech_group.setTitle(t("settings.audio.transcription.azure_speech.title", "🔷 Azure Speech Services Configuration"))
-            if hasattr(self, 'openai_whisper_group'):
-                self.openai_whisper_group.setTitle(t("settings.audio.transcription.openai_whisper.title", "🟢 OpenAI Whisper API Configuration"))
-            if hasattr(self, 'behavior_group'):
-                self.behavior_group.setTitle(t("settings.assistant.title", "🧠 Assistant Behavior"))
-            if hasattr(self, 'prompt_group'):
-                self.prompt_group.setTitle(t("settings.prompts.title", "📝 AI Prompt Configuration"))
-            if hasattr(self, 'knowledge_group'):
-                self.knowledge_group.setTitle(t("settings.knowledge.title", "🧠 Knowledge Graph"))
-            if hasattr(self, 'doc_settings_group'):
-                self.doc_settings_group.setTitle(t("settings.documents.title", "📚 Document Store Configuration"))
-            if hasattr(self, 'debug_group'):
-                self.debug_group.setTitle(t("settings.debug.title", "🐛 Debug & Logging"))
+            # Update form labels registered by _add_row(..., dynamic=True)
+            for label, key, default in self._retranslatable:
+                label.setText(t(key, default))
             
-            # Update auto_hide suffix
-            if hasattr(self, 'auto_hide_seconds'):
-                self.auto_hide_seconds.setSuffix(t("settings.auto_hide.suffix", " seconds (0 = disabled)"))
+            # Lazy tooltips resolve again, in the new language, on next hover
+            for widget in self._tooltips:
+                widget.setToolTip("")
             
-            # Update theme selector items
+            # Retitle the theme items in place; selection and stylesheet are untouched
             if hasattr(self, 'theme_selector'):
-                current_theme = self.theme_selector.currentText()
-                self.theme_selector.clear()
-                self.theme_selector.addItems([t("settings.theme.dark", "Dark Mode"), t("settings.theme.light", "Light Mode")])
-                # Restore selection
-                if "Light" in current_theme or t("settings.theme.light", "Light Mode") in current_theme:
-                    self.theme_selector.setCurrentText(t("settings.theme.light", "Light Mode"))
-                else:
-                    self.theme_selector.setCurrentText(t("settings.theme.dark", "Dark Mode"))
-            
-            # Update prompt tab widgets
-            if hasattr(self, 'prompt_info'):
-                self.prompt_info.setText(t("settings.prompts.info", "Customize the MeetMinder assistant's behavior and response style:"))
-            if hasattr(self, 'system_prompt'):
-                self.system_prompt.setPlaceholderText(t("settings.prompts.placeholder", "Enter system prompt that defines the MeetMinder assistant's behavior, tone, and expertise..."))
-            if hasattr(self, 'load_prompt_btn'):
-                self.load_prompt_btn.setText(t("settings.prompts.load_file", "📁 Load from File"))
-            if hasattr(self, 'save_prompt_btn'):
-                self.save_prompt_btn.setText(t("settings.prompts.save_file", "💾 Save to File"))
-            if hasattr(self, 'reset_prompt_btn'):
-                self.reset_prompt_btn.setText(t("settings.prompts.reset_default", "🔄 Reset to Default"))
-            
-            # Update knowledge tab widgets
-            if hasattr(self, 'enable_topic_graph'):
-                self.enable_topic_graph.setText(t("settings.knowledge.enable", "Enable topic analysis and suggestions"))
-            if hasattr(self, 'topic_info'):
-                self.topic_info.setText(t("settings.knowledge.topic_definitions", "Topic Definitions:"))
-            if hasattr(self, 'topic_definitions'):
-                self.topic_definitions.setPlaceholderText(t("settings.knowledge.topic_definitions_placeholder", "Example topic definitions:\n\nMeeting Management: Strategies for organizing and running effective meetings\nProject Planning: Techniques for project planning and execution\nTechnical Discussions: Handling technical topics and problem-solving\nClient Communication: Best practices for client interactions\n\nEnter one topic per line with format: Topic Name: Description"))
-            
-            # Update documents tab widgets
-            if hasattr(self, 'documents_enabled'):
-                self.documents_enabled.setText(t("settings.documents.enabled", "Enable document storage and retrieval"))
-            if hasattr(self, 'documents_list'):
-                self.documents_list.setPlaceholderText(t("settings.documents.uploaded_documents", "Uploaded documents will appear here..."))
-            if hasattr(self, 'upload_button'):
-                self.upload_button.setText(t("settings.documents.upload", "📤 Upload Document"))
-            if hasattr(self, 'refresh_button'):
-                self.refresh_button.setText(t("settings.documents.refresh_list", "🔄 Refresh List"))
-            if hasattr(self, 'embedding_group'):
-                self.embedding_group.setTitle(t("settings.documents.embedding_provider_title", "🧮 Embedding Provider"))
-            if hasattr(self, 'vector_group'):
-                self.vector_group.setTitle(t("settings.documents.vector_storage_title", "💾 Vector Storage"))
-            if hasattr(self, 'management_group'):
-                self.management_group.setTitle(t("settings.documents.management_title", "📁 Document Management"))
-            
-            # Update knowledge tab buttons
-            if hasattr(self, 'import_topics_btn'):
-                self.import_topics_btn.setText(t("settings.knowledge.import_topics", "📁 Import Topics"))
-            if hasattr(self, 'export_topics_btn'):
-                self.export_topics_btn.setText(t("settings.knowledge.export_topics", "💾 Export Topics"))
-            if hasattr(self, 'clear_topics_btn'):
-                self.clear_topics_btn.setText(t("settings.knowledge.clear_all", "🗑️ Clear All"))
-            
-            # Update hotkeys group title
-            if hasattr(self, 'hotkeys_group'):
-                self.hotkeys_group.setTitle(t("settings.hotkeys.title", "⌨️ Global Hotkeys"))
-            
-            # Update debug tab widgets
-            if hasattr(self, 'debug_enabled'):
-                self.debug_enabled.setText(t("settings.debug.enabled", "Enable debug mode"))
-            if hasattr(self, 'verbose_logging'):
-                self.verbose_logging.setText(t("settings.debug.verbose_logging", "Verbose logging"))
-            if hasattr(self, 'save_transcriptions'):
-                self.save_transcriptions.setText(t("settings.debug.save_transcriptions", "Save transcriptions to files"))
-            if hasattr(self, 'save_audio_chunks'):
-                self.save_audio_chunks.setText(t("settings.debug.save_audio", "Save audio chunks to files"))
-            
-            # Update audio tab widgets
-            if hasattr(self, 'full_system_audio'):
-                self.full_system_audio.setText(t("settings.audio.system_audio.full_monitoring", "Monitor all system audio (overrides specific app selection)"))
-            if hasattr(self, 'app_selection_label'):
-                self.app_selection_label.setText(t("settings.audio.system_audio.select_apps", "Select specific applications to monitor:"))
-            if hasattr(self, 'meeting_label'):
-                self.meeting_label.setText(t("settings.audio.system_audio.meeting_apps", "📞 Meeting & Communication Apps (Enabled by Default)"))
-            if hasattr(self, 'other_label'):
-                self.other_label.setText(t("settings.audio.system_audio.other_apps", "🖥️ Other Applications (Disabled by Default)"))
-            if hasattr(self, 'custom_app_input'):
-                self.custom_app_input.setPlaceholderText(t("settings.audio.system_audio.custom_app", "Enter custom application name (e.g., MyApp.exe)"))
-            if hasattr(self, 'add_custom_btn'):
-                self.add_custom_btn.setText(t("settings.audio.system_audio.add_custom", "➕ Add"))
-            if hasattr(self, 'filter_label'):
-                self.filter_label.setText(t("settings.audio.system_audio.filtering", "🎛️ Audio Filtering:"))
-            if hasattr(self, 'filter_music'):
-                self.filter_music.setText(t("settings.audio.system_audio.filter_music", "🎵 Filter out music and non-speech audio (recommended)"))
-                self.filter_music.setToolTip(t("settings.audio.system_audio.filter_music_tooltip", "Uses AI to detect and ignore music, sound effects, and other non-speech audio"))
-            if hasattr(self, 'monitoring_status'):
-                # Update monitoring status text (will be updated by update_monitoring_status)
-                pass
+                with self._silenced(self.theme_selector):
+                    for index, (_, key, label) in enumerate(self._THEME_CHOICES):
+                        self.theme_selector.setItemText(index, t(key, label))
             
             print("✅ Settings dialog translations refreshed")
         except Exception as e:
@@ -1607,117 +1722,90 @@ class ModernSettingsDialog(QDialog):
         # For now, we'll update the most critical ones explicitly
         pass
     
-    def on_theme_changed(self, theme_name):
+    def on_theme_changed(self, index):
         """Handle theme change"""
+        theme_name = self.theme_selector.itemData(index)
+        if not theme_name:
+            return
         print(f"🎨 Theme changed to: {theme_name}")
         
         # Apply theme immediately to settings dialog
         self.apply_theme_to_dialog(theme_name)
     
+    def _settings_stylesheet(self, theme_name: str) -> str:
+        """Return the settings stylesheet for ``theme_name`` at this dialog's scale"""
+        from ui.themes import ThemeManager
+        
+        # ThemeManager caches the generated text per (theme, scale)
+        return ThemeManager.generate_settings_stylesheet(ThemeManager.get_theme(theme_name), self.scale_factor)
+    
     def apply_current_theme(self):
         """Apply the current theme from config to the dialog"""
-        try:
-            from ui.themes import ThemeManager
-            from core.config import ConfigManager
-            
-            # Get current theme from config
-            config = ConfigManager()
-            current_theme = config.get_ui_config().get('overlay', {}).get('theme', 'dark')
-            
-            theme = ThemeManager.get_theme(current_theme)
-            
-            # Generate and apply stylesheet
-            stylesheet = ThemeManager.generate_settings_stylesheet(theme, self.scale_factor)
-            self.setStyleSheet(stylesheet)
-            
-            print(f"✅ Applied {current_theme} theme to settings dialog")
-            
-        except Exception as e:
-            print(f"❌ Error applying theme: {e}")
-            # Fallback to basic dark theme
-            self.setStyleSheet("QDialog { background: #141414; color: #ffffff; }")
+        # Get current theme from the config the dialog was opened with
+        self.apply_theme_to_dialog(self.current_config.get('ui', {}).get('overlay', {}).get('theme', 'dark'))
 
     def apply_theme_to_dialog(self, theme_name):
-        """Apply theme to the settings dialog"""
+        """Apply the 'light' or 'dark' theme to the settings dialog"""
+        # Anything but light renders dark, as in ThemeManager.get_theme
+        internal_theme = "light" if str(theme_name).lower() == "light" else "dark"
+        # Setting a stylesheet re-polishes every widget; skip a no-op switch
+        if internal_theme == self._applied_theme:
+            return
         try:
-            from ui.themes import ThemeManager
-            
-            # Convert display name to internal name
-            internal_theme = "light" if "Light" in theme_name else "dark"
-            theme = ThemeManager.get_theme(internal_theme)
-            
-            # Generate and apply stylesheet
-            stylesheet = ThemeManager.generate_settings_stylesheet(theme, self.scale_factor)
-            self.setStyleSheet(stylesheet)
-            
-            # Clear any individual widget overrides that might conflict
-            self.clear_hardcoded_styles()
+            self.setStyleSheet(self._settings_stylesheet(internal_theme))
+            self._applied_theme = internal_theme
             
             print(f"✅ Applied {internal_theme} theme to settings dialog")
             
         except Exception as e:
             print(f"❌ Error applying theme: {e}")
-            # Keep current dark theme as fallback
-    
-    def clear_hardcoded_styles(self):
-        """Clear hardcoded color styles from widgets to ensure theme takes precedence"""
-        # Clear styles from specific widgets that had hardcoded colors
-        widgets_to_clear = [
-            # AI Provider fields
-            getattr(self, 'azure_endpoint', None),
-            getattr(self, 'azure_api_key', None),
-            getattr(self, 'azure_model', None),
-            getattr(self, 'azure_deployment', None),
-            getattr(self, 'azure_api_version', None),
-            getattr(self, 'deepseek_api_key', None),
-            getattr(self, 'deepseek_base_url', None),
-            getattr(self, 'deepseek_model', None),
-            getattr(self, 'claude_api_key', None),
-            getattr(self, 'claude_base_url', None),
-            getattr(self, 'claude_model', None),
-            # Audio fields
-            getattr(self, 'custom_app_input', None),
-            getattr(self, 'google_json_file', None),
-            getattr(self, 'google_json_content', None),
-            getattr(self, 'azure_speech_key', None),
-            getattr(self, 'azure_speech_region', None),
-            getattr(self, 'azure_speech_endpoint', None),
-            getattr(self, 'openai_whisper_api_key', None),
-            # System audio monitoring
-            getattr(self, 'full_system_audio', None),
-            getattr(self, 'monitoring_status', None),
-        ]
-        
-        for widget in widgets_to_clear:
-            if widget:
-                widget.setStyleSheet("")
-        
-        # Also clear any labels or other elements that might have hardcoded colors
-        # This covers labels like prompt_info, topic_info, meeting_label, etc.
-        for child in self.findChildren(QLabel):
-            if child.styleSheet() and 'color:' in child.styleSheet():
-                child.setStyleSheet("")
-        
-        # Clear checkbox styles in audio monitoring section
-        for child in self.findChildren(QCheckBox):
-            if child.styleSheet() and 'color:' in child.styleSheet():
-                child.setStyleSheet("")
+            if self._applied_theme is None:
+                # Fallback to basic dark theme
+                self.setStyleSheet("QDialog { background: #141414; color: #ffffff; }")
+    
+    def _pick_file(self, role: str, title: str, name_filter: str, save_as: str = None) -> str:
+        """Run the cached file dialog for ``role`` and return the chosen path or ''
+        
+        One QFileDialog per role is kept for the dialog's lifetime, so the
+        native picker is set up once and remembers its last directory.
+        ``save_as`` switches the dialog to save mode with that default name.
+        """
+        dialog = self._file_dialogs.get(role)
+        if dialog is None:
+            dialog = QFileDialog(self)
+            dialog.setNameFilter(name_filter)
+            # Skip per-entry icon and symlink lookups, which stall on
+            # network mounts and large directories
+            dialog.setOptions(QFileDialog.DontUseCustomDirectoryIcons | QFileDialog.DontResolveSymlinks)
+            if save_as:
+                dialog.setAcceptMode(QFileDialog.AcceptSave)
+            else:
+                dialog.setFileMode(QFileDialog.ExistingFile)
+                dialog.setOption(QFileDialog.ReadOnly)
+            self._file_dialogs[role] = dialog
+        # Set on every call: the language may have changed since creation
+        dialog.setWindowTitle(title)
+        if save_as:
+            dialog.selectFile(save_as)
+        if dialog.exec_():
+            return dialog.selectedFiles()[0]
+        return ""
     
     def browse_google_json_file(self):
         """Browse for Google Cloud service account JSON file"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select Google Cloud Service Account JSON", "", "JSON Files (*.json);;All Files (*)"
+        file_path = self._pick_file(
+            "google_json", "Select Google Cloud Service Account JSON", "JSON Files (*.json);;All Files (*)"
         )
         if file_path:
             self.google_json_file.setText(file_path)
             # Optionally load and validate the JSON content
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    json_content = f.read()
-                    # Basic validation - check if it's valid JSON
-                    json.loads(json_content)
-                    self.google_json_content.setPlainText(json_content)
-                    QMessageBox.information(self, "Success", "JSON file loaded successfully!")
+                # One read; the file is closed before any message box opens
+                json_content = Path(file_path).read_text(encoding='utf-8')
+                # Basic validation - check if it's valid JSON
+                _json_loads(json_content)
+                self.google_json_content.setPlainText(json_content)
+                QMessageBox.information(self, "Success", "JSON file loaded successfully!")
             except json.JSONDecodeError:
                 QMessageBox.warning(self, "Invalid JSON", "The selected file does not contain valid JSON.")
             except Exception as e:
@@ -1734,18 +1822,13 @@ class ModernSettingsDialog(QDialog):
         app_key = f"custom_{app_name.lower().replace(' ', '_').replace('.exe', '')}"
         
         # Check if already exists
-        if app_key in self.app_checkboxes:
+        if app_key in self.app_items:
             QMessageBox.information(self, t("messages.already_added", "Already Added"), t("messages.already_added_msg", "'{name}' is already in the list.").format(name=app_name))
             return
         
-        # Add the checkbox (find a good position for it)
-        checkbox = QCheckBox(f"⚙️ {app_name}")
-        checkbox.setMinimumHeight(self.scale(32))
-        checkbox.setChecked(True)
-        self.app_checkboxes[app_key] = checkbox
+        self.apps_list.scrollToItem(self._add_app_item(app_key, f"⚙️ {app_name}", True))
+        self._mark_dirty()
         
-        # Add to the layout - find the custom application section
-        # For now, we'll show a success message and suggest restart
         QMessageBox.information(
             self, t("messages.application_added", "Application Added"), 
             t("messages.application_added_msg", "'{name}' has been added to the monitoring list.\n\nNote: The application will be monitored on the next audio capture restart.").format(name=app_name)
@@ -1756,97 +1839,69 @@ class ModernSettingsDialog(QDialog):
     
     def load_prompt_file(self):
         """Load prompt from file"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Load Prompt File", "", "Markdown Files (*.md);;Text Files (*.txt);;All Files (*)"
+        file_path = self._pick_file(
+            "load_prompt", "Load Prompt File", "Markdown Files (*.md);;Text Files (*.txt);;All Files (*)"
         )
         if file_path:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                self.system_prompt.setPlainText(content)
+                self.system_prompt.setPlainText(Path(file_path).read_text(encoding='utf-8'))
             except Exception as e:
                 QMessageBox.warning(self, "Error", f"Failed to load file: {e}")
     
     def save_prompt_file(self):
         """Save prompt to file"""
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, "Save Prompt File", "prompt_rules.md", "Markdown Files (*.md);;Text Files (*.txt);;All Files (*)"
+        file_path = self._pick_file(
+            "save_prompt", "Save Prompt File", "Markdown Files (*.md);;Text Files (*.txt);;All Files (*)",
+            save_as="prompt_rules.md"
         )
         if file_path:
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(self.system_prompt.toPlainText())
+                self._write_text_file(file_path, self.system_prompt.toPlainText())
                 QMessageBox.information(self, "Success", "Prompt saved successfully!")
             except Exception as e:
                 QMessageBox.warning(self, "Error", f"Failed to save file: {e}")
     
     def reset_prompt_to_default(self):
         """Reset prompt to default"""
-        default_prompt = """You are an intelligent AI meeting assistant designed to provide helpful, contextual responses based on real-time audio transcription and user interactions.
-
-**Core Behavior:**
-- Be concise yet comprehensive in your responses
-- Provide actionable insights and suggestions
-- Adapt your tone to the context (professional for meetings, casual for general chat)
-- Focus on being helpful rather than just informative
-
-**Response Guidelines:**
-- Keep responses under 200 words unless detailed explanation is needed
-- Use bullet points for lists and actionable items
-- Include relevant examples when helpful
-- Ask clarifying questions when context is unclear
-
-**Context Awareness:**
-- Pay attention to meeting dynamics and conversation flow
-- Identify key topics, decisions, and action items
-- Provide relevant suggestions based on the current discussion
-- Be sensitive to the professional or casual nature of the interaction
-
-**Expertise Areas:**
-- Meeting facilitation and note-taking
-- Technical problem-solving
-- Project management insights
-- Communication enhancement
-- General productivity tips"""
-        
-        self.system_prompt.setPlainText(default_prompt)
+        self.system_prompt.setPlainText(DEFAULT_PROMPT)
     
     def import_topics(self):
         """Import topics from file"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, t("messages.topics_imported", "Import Topics"), "", "Text Files (*.txt);;All Files (*)"
+        file_path = self._pick_file(
+            "import_topics", t("messages.topics_imported", "Import Topics"), "Text Files (*.txt);;All Files (*)"
         )
         if file_path:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                self.topic_definitions.setPlainText(content)
+                self.topic_definitions.setPlainText(Path(file_path).read_text(encoding='utf-8'))
             except Exception as e:
                 QMessageBox.warning(self, t("messages.error_loading_file", "Error"), t("messages.error_loading_file_msg", "Failed to load file: {error}").format(error=str(e)))
     
     def export_topics(self):
         """Export topics to file"""
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, t("messages.topics_exported", "Export Topics"), "topics.txt", "Text Files (*.txt);;All Files (*)"
+        file_path = self._pick_file(
+            "export_topics", t("messages.topics_exported", "Export Topics"), "Text Files (*.txt);;All Files (*)",
+            save_as="topics.txt"
         )
         if file_path:
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(self.topic_definitions.toPlainText())
+                self._write_text_file(file_path, self.topic_definitions.toPlainText())
                 QMessageBox.information(self, t("messages.success", "Success"), t("messages.topics_exported", "Topics exported successfully!"))
             except Exception as e:
                 QMessageBox.warning(self, t("messages.error_loading_file", "Error"), t("messages.error_exporting", "Failed to export topics: {error}").format(error=str(e)))
     
     def clear_topics(self):
-        """Clear all topics"""
-        reply = QMessageBox.question(
-            self, t("messages.clear_topics", "Clear Topics"), 
-            t("messages.clear_topics_msg", "Are you sure you want to clear all topic definitions?"),
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
+        """Clear all topics; Ctrl+Z in the editor brings them back"""
+        # Remove through a cursor edit: QTextEdit.clear() would also drop the undo history
+        cursor = self.topic_definitions.textCursor()
+        cursor.select(QTextCursor.Document)
+        cursor.removeSelectedText()
+        # The click left focus on the button; Ctrl+Z has to reach the editor
+        self.topic_definitions.setFocus()
+        QToolTip.showText(
+            self.clear_topics_btn.mapToGlobal(self.clear_topics_btn.rect().bottomLeft()),
+            t("messages.topics_cleared", "Topics cleared (Ctrl+Z to undo)"),
+            self.clear_topics_btn
         )
-        if reply == QMessageBox.Yes:
-            self.topic_definitions.clear()
     
     def setup_buttons(self, layout):
         """Setup dialog buttons"""
@@ -1872,359 +1927,264 @@ class ModernSettingsDialog(QDialog):
         
         layout.addLayout(button_layout)
     
+    @contextmanager
+    def _silenced(self, *widgets):
+        """Block signals on ``widgets`` while a tab's values are loaded.
+        
+        Without this each setCurrentText/setChecked during a load fires its
+        slot (provider visibility, monitoring status, theme, language), one
+        cascade per field.
+        """
+        blocked = [w.blockSignals(True) for w in widgets]
+        try:
+            yield
+        finally:
+            for widget, was_blocked in zip(widgets, blocked):
+                widget.blockSignals(was_blocked)
+    
     def load_current_settings(self):
-        """Load current settings into the UI"""
-        # AI Provider
-        ai_provider = self.current_config.get('ai_provider', {})
-        self.ai_provider_type.setCurrentText(ai_provider.get('type', 'azure_openai'))
-        
-        # Azure OpenAI (Legacy)
-        azure = ai_provider.get('azure_openai', {})
-        self.azure_endpoint.setText(azure.get('endpoint', ''))
-        self.azure_api_key.setText(azure.get('api_key', ''))
-        self.azure_model.setText(azure.get('model', ''))
-        self.azure_deployment.setText(azure.get('deployment_name', ''))
-        self.azure_api_version.setText(azure.get('api_version', '2024-02-01'))
-        
-        # OpenAI
-        openai = ai_provider.get('openai', {})
-        self.openai_api_key.setText(openai.get('api_key', ''))
-        self.openai_model.setText(openai.get('model', ''))
-        
-        # Gemini
-        gemini = ai_provider.get('google_gemini', {})
-        self.gemini_api_key.setText(gemini.get('api_key', ''))
-        self.gemini_model.setText(gemini.get('model', ''))
-        self.gemini_project_id.setText(str(gemini.get('project_id', '')))
-        
-        # DeepSeek
-        deepseek = ai_provider.get('deepseek', {})
-        self.deepseek_api_key.setText(deepseek.get('api_key', ''))
-        self.deepseek_base_url.setText(deepseek.get('base_url', 'https://api.deepseek.com'))
-        self.deepseek_model.setText(deepseek.get('model', 'deepseek-coder'))
-        
-        # Claude
-        claude = ai_provider.get('claude', {})
-        self.claude_api_key.setText(claude.get('api_key', ''))
-        self.claude_base_url.setText(claude.get('base_url', 'https://api.anthropic.com'))
-        self.claude_model.setText(claude.get('model', 'claude-3-sonnet-20240229'))
-        
-        # Audio
-        audio = self.current_config.get('audio', {})
-        self.audio_mode.setCurrentText(audio.get('mode', 'dual_stream'))
-        self.buffer_duration.setValue(audio.get('buffer_duration_minutes', 5))
-        processing_interval = audio.get('processing_interval_seconds', 1.6)
-        self.processing_interval.setValue(int(processing_interval * 10))
-        
-        # System Audio Monitoring
-        system_audio = audio.get('system_audio_monitoring', {})
-        self.full_system_audio.setChecked(system_audio.get('full_monitoring', False))
-        
-        # Load monitored applications
-        monitored_apps = system_audio.get('monitored_applications', {
-            # Default to meeting apps enabled
-            'google_meet': True, 'zoom': True, 'teams': True, 'skype': True,
-            'discord': True, 'slack': True, 'webex': True, 'gotomeeting': True,
-            # Other apps disabled by default
-            'browser': False, 'firefox': False, 'spotify': False, 'youtube': False,
-            'vlc': False, 'obs': False, 'custom': False
-        })
-        
-        for app_key, checkbox in self.app_checkboxes.items():
-            checkbox.setChecked(monitored_apps.get(app_key, False))
-        
-        # Audio filtering settings
-        audio_filtering = system_audio.get('audio_filtering', {})
-        self.filter_music.setChecked(audio_filtering.get('filter_non_speech', True))
-        speech_threshold = int(audio_filtering.get('speech_detection_threshold', 0.6) * 100)
-        self.speech_detection_threshold.setValue(speech_threshold)
-        
-        # Update UI state based on full monitoring setting
-        self.on_full_system_audio_changed(self.full_system_audio.isChecked())
-        
-        # Transcription
-        transcription = self.current_config.get('transcription', {})
-        self.transcription_provider.setCurrentText(transcription.get('provider', 'local_whisper'))
-        
-        # Local Whisper config
-        whisper_config = transcription.get('whisper', {})
-        self.whisper_model.setCurrentText(whisper_config.get('model_size', 'base'))
-        
-        # Google Speech config
-        google_config = transcription.get('google_speech', {})
-        self.google_json_file.setText(google_config.get('json_file_path', ''))
-        self.google_json_content.setPlainText(google_config.get('json_content', ''))
-        
-        # Azure Speech config
-        azure_speech_config = transcription.get('azure_speech', {})
-        self.azure_speech_key.setText(azure_speech_config.get('api_key', ''))
-        self.azure_speech_region.setText(azure_speech_config.get('region', 'eastus'))
-        self.azure_speech_endpoint.setText(azure_speech_config.get('endpoint', ''))
-        self.azure_speech_language.setCurrentText(azure_speech_config.get('language', 'en-US'))
-        
-        # OpenAI Whisper config
-        openai_whisper_config = transcription.get('openai_whisper', {})
-        self.openai_whisper_api_key.setText(openai_whisper_config.get('api_key', ''))
-        self.openai_whisper_model.setCurrentText(openai_whisper_config.get('model', 'whisper-1'))
-        self.openai_whisper_language.setCurrentText(openai_whisper_config.get('language', 'auto-detect'))
-        
-        # Update transcription provider visibility
-        self.on_transcription_provider_changed(self.transcription_provider.currentText())
+        """Load current settings into the tabs that have been built
         
-        # UI
-        ui = self.current_config.get('ui', {}).get('overlay', {})
-        size_mult = ui.get('size_multiplier', 1.0)
-        self.size_multiplier.setValue(int(size_mult * 10))
-        self.show_transcript.setChecked(ui.get('show_transcript', False))
-        self.hide_from_sharing.setChecked(ui.get('hide_from_sharing', True))
-        self.auto_hide_seconds.setValue(ui.get('auto_hide_seconds', 5))
-        
-        # Screen sharing detection
-        screen_sharing = self.current_config.get('screen_sharing_detection', {})
-        self.enable_screen_sharing_detection.setChecked(screen_sharing.get('enabled', False))
-        
-        # Enhanced UI Features
-        enhanced_ui = ui.get('enhanced', {})
-        self.background_opacity.setValue(int(enhanced_ui.get('background_opacity', 0.15) * 100))
-        self.enable_blur_effects.setChecked(enhanced_ui.get('blur_enabled', True))
-        self.enable_smooth_animations.setChecked(enhanced_ui.get('smooth_animations', True))
-        self.enable_auto_width.setChecked(enhanced_ui.get('auto_width', True))
-        self.enable_dynamic_transparency.setChecked(enhanced_ui.get('dynamic_transparency', False))
+        Repaints are held off until every tab is filled, so the dialog is
+        invalidated once rather than once per field; the loaders block the
+        signals whose slots would otherwise cascade.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            for index, load in self._tab_loaders.items():
+                if index not in self._unbuilt_tabs:
+                    load()
+            self.apply_current_theme()
+        finally:
+            self.setUpdatesEnabled(True)
+        self._dirty = False
+    
+    def _load_bindings(self, tab: str):
+        """Copy the config values bound to ``tab``'s widgets into them"""
+        self._apply_bindings(self._CONFIG_BINDINGS[tab])
+    
+    def _apply_bindings(self, rows):
+        """Load binding ``rows`` into their widgets, skipping ones not built yet
+        
+        Signals stay blocked while the values are written; each slider's
+        value label is then refreshed directly, once.
+        """
+        bound = [(path, attr, default, getattr(self, attr, None)) for path, attr, default in rows]
+        bound = [row for row in bound if row[3] is not None]
+        with self._silenced(*(widget for *_, widget in bound)):
+            for path, attr, default, widget in bound:
+                _write_widget(widget, _dget(self.current_config, path, default),
+                              self._SLIDER_SCALES.get(attr))
+        for _, attr, _, widget in bound:
+            if attr in self._SLIDER_SCALES:
+                getattr(self, f'_on_{attr}_changed')(widget.value())
+    
+    def _load_ai_provider_settings(self):
+        """Load the AI provider tab from current_config"""
+        with self._silenced(self.ai_provider_type):
+            self._load_bindings('ai_provider')
         
-        # Hide overlay for screenshots/debugging
-        self.hide_overlay_for_screenshots.setChecked(ui.get('hide_overlay_for_screenshots', False))
+        # Signals were blocked, so run dependent updates once
+        self.on_provider_changed(self.ai_provider_type.currentText())
+    
+    def _load_audio_settings(self):
+        """Load the Audio tab from current_config"""
+        with self._silenced(self.transcription_provider, self.full_system_audio, self.apps_list):
+            self._load_bindings('audio')
+            
+            # Load monitored applications
+            monitored_apps = _dget(self.current_config, 'audio.system_audio_monitoring.monitored_applications',
+                                   {app_key: enabled for app_key, _, enabled in self._MONITORED_APPS})
+            for app_key, item in self.app_items.items():
+                item.setCheckState(Qt.Checked if monitored_apps.get(app_key, False) else Qt.Unchecked)
         
-        # Language selection - get current language from translation manager
+        # Signals were blocked, so run dependent updates once
+        self.on_full_system_audio_changed(self.full_system_audio.isChecked())
+        self.on_transcription_provider_changed(self.transcription_provider.currentText())
+        self.update_monitoring_status()
+    
+    def _load_ui_settings(self):
+        """Load the Interface tab from current_config"""
+        with self._silenced(self.language_selector, self.theme_selector, self.hide_overlay_for_screenshots):
+            self._load_bindings('ui')
+            
+            index = self.language_selector.findData(self._current_language())
+            if index >= 0:
+                self.language_selector.setCurrentIndex(index)
+            
+            # Theme selection
+            theme = _dget(self.current_config, 'ui.overlay.theme', 'dark')
+            self.theme_selector.setCurrentIndex(self.theme_selector.findData('light' if theme == 'light' else 'dark'))
+    
+    def _current_language(self) -> str:
+        """Language code the Interface tab starts from"""
         if TRANSLATIONS_AVAILABLE:
-            translation_manager = get_translation_manager()
-            current_language = translation_manager.get_language()
-            for i in range(self.language_selector.count()):
-                if self.language_selector.itemData(i) == current_language:
-                    self.language_selector.setCurrentIndex(i)
-                    break
-        else:
-            # Fallback to config if translations not available
-            current_language = ui.get('language', 'en')
-            for i in range(self.language_selector.count()):
-                if self.language_selector.itemData(i) == current_language:
-                    self.language_selector.setCurrentIndex(i)
-                    break
-        
-        # Theme selection
-        theme = ui.get('theme', 'dark')
-        theme_display_name = "Light Mode" if theme == 'light' else "Dark Mode"
-        self.theme_selector.setCurrentText(theme_display_name)
-        
-        # Assistant
-        assistant = self.current_config.get('assistant', {})
-        self.activation_mode.setCurrentText(assistant.get('activation_mode', 'manual'))
-        self.verbosity.setCurrentText(assistant.get('verbosity', 'standard'))
-        self.response_style.setCurrentText(assistant.get('response_style', 'professional'))
-        self.input_prioritization.setCurrentText(assistant.get('input_prioritization', 'system_audio'))
-        
-        # Load prompt from file if it exists
+            return get_translation_manager().get_language()
+        # Fallback to config if translations not available
+        return _dget(self.current_config, 'ui.overlay.language', 'en')
+    
+    def _load_assistant_settings(self):
+        """Load the Assistant tab from current_config"""
+        self._load_bindings('assistant')
+    
+    def _load_prompts_settings(self):
+        """Load the Prompts tab from current_config"""
+        # Load prompt from file if it exists; remember what is on disk so an
+        # unchanged prompt is not rewritten on save
+        text = self._read_text_file(_PROMPT_FILE)
+        self._prompt_last_saved = text
+        # A reused dialog often already shows this text; setting it again
+        # would only re-layout the editor and drop its undo history
+        shown = DEFAULT_PROMPT if text is None else text
+        if shown != self.system_prompt.toPlainText():
+            self.system_prompt.setPlainText(shown)
+    
+    @classmethod
+    def _read_text_file(cls, path: Path):
+        """Return the file's text, or None if it is missing or unreadable"""
+        # A reused or newly opened dialog must not read back the text from
+        # before a save whose write is still queued
+        if cls._files_writing is not None:
+            wait([cls._files_writing])
+        if not path.is_file():
+            return None
         try:
-            with open('prompt_rules.md', 'r', encoding='utf-8') as f:
-                self.system_prompt.setPlainText(f.read())
-        except FileNotFoundError:
-            self.reset_prompt_to_default()
-        
-        # Knowledge Graph
-        topic_graph = self.current_config.get('topic_graph', {})
-        self.enable_topic_graph.setChecked(topic_graph.get('enabled', True))
-        self.matching_threshold.setValue(int(topic_graph.get('matching_threshold', 0.6) * 100))
-        self.max_matches.setValue(topic_graph.get('max_matches', 3))
+            return path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning("Could not read %s: %s", path, e)
+            return None
+    
+    @staticmethod
+    def _write_text_file(path, text: str):
+        """Write ``text`` to ``path`` via a sibling temp file and os.replace,
+        so a crash mid-write never leaves a truncated file behind"""
+        path = Path(path)
+        tmp = path.with_name(path.name + '.tmp')
+        try:
+            tmp.write_text(text, encoding='utf-8')
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            raise
+    
+    def _load_knowledge_settings(self):
+        """Load the Knowledge tab from current_config"""
+        self._load_bindings('knowledge')
+        
+        # Topic definitions saved by a previous session
+        text = self._read_text_file(_TOPICS_FILE)
+        self._topics_last_saved = text
+        if (text or '') != self.topic_definitions.toPlainText():
+            self.topic_definitions.setPlainText(text or '')
+    
+    def _load_hotkeys_settings(self):
+        """Load the Hotkeys tab from current_config"""
+        self._load_bindings('hotkeys')
+    
+    def _load_debug_settings(self):
+        """Load the Debug tab from current_config"""
+        self._load_bindings('debug')
+    
+    def _load_documents_settings(self):
+        """Load the Documents tab from current_config"""
+        self._load_bindings('documents')
         
-        # Hotkeys
-        hotkeys = self.current_config.get('hotkeys', {})
-        self.trigger_assistance.setText(hotkeys.get('trigger_assistance', 'ctrl+space'))
-        self.toggle_overlay.setText(hotkeys.get('toggle_overlay', 'ctrl+b'))
-        self.take_screenshot.setText(hotkeys.get('take_screenshot', 'ctrl+h'))
-        self.emergency_reset.setText(hotkeys.get('emergency_reset', 'ctrl+shift+r'))
-        self.toggle_hide_for_screenshots.setText(hotkeys.get('toggle_hide_for_screenshots', 'ctrl+shift+h'))
-        
-        # Debug
-        debug = self.current_config.get('debug', {})
-        self.debug_enabled.setChecked(debug.get('enabled', False))
-        self.verbose_logging.setChecked(debug.get('verbose_logging', False))
-        self.save_transcriptions.setChecked(debug.get('save_transcriptions', False))
-        self.save_audio_chunks.setChecked(debug.get('save_audio_chunks', False))
-        self.max_debug_files.setValue(debug.get('max_debug_files', 100))
-
-        # Documents
-        documents = self.current_config.get('documents', {})
-        self.documents_enabled.setChecked(documents.get('enabled', True))
-        self.chunk_size.setValue(documents.get('chunk_size', 1000))
-        self.chunk_overlap.setValue(documents.get('chunk_overlap', 200))
-        self.max_context_chunks.setValue(documents.get('max_context_chunks', 5))
-
-        embedding = documents.get('embedding', {})
-        self.embedding_provider.setCurrentText(embedding.get('provider', 'local'))
-        self.embedding_model.setCurrentText(embedding.get('model', 'all-MiniLM-L6-v2'))
-
-        vector = documents.get('vector', {})
-        self.vector_backend.setCurrentText(vector.get('backend', 'faiss'))
-
         # Refresh document list
         self.refresh_documents()
-        
-        # Update visibility based on provider
-        self.on_provider_changed(self.ai_provider_type.currentText())
-        
-        # Update monitoring status display
-        self.update_monitoring_status()
     
     def save_settings(self):
         """Save all settings and emit signal"""
+        # Nothing was edited: close without telling listeners to reapply
+        if not self._dirty:
+            self.accept()
+            return
+        
+        # Fixed values that have no widget
         new_config = {
-            'ai_provider': {
-                'type': self.ai_provider_type.currentText(),
-                'azure_openai': {
-                    'endpoint': self.azure_endpoint.text(),
-                    'api_key': self.azure_api_key.text(),
-                    'model': self.azure_model.text(),
-                    'deployment_name': self.azure_deployment.text(),
-                    'api_version': self.azure_api_version.text()
-                },
-                'openai': {
-                    'api_key': self.openai_api_key.text(),
-                    'model': self.openai_model.text()
-                },
-                'google_gemini': {
-                    'api_key': self.gemini_api_key.text(),
-                    'model': self.gemini_model.text(),
-                    'project_id': self.gemini_project_id.text()
-                },
-                'deepseek': {
-                    'api_key': self.deepseek_api_key.text(),
-                    'base_url': self.deepseek_base_url.text(),
-                    'model': self.deepseek_model.text()
-                },
-                'claude': {
-                    'api_key': self.claude_api_key.text(),
-                    'base_url': self.claude_base_url.text(),
-                    'model': self.claude_model.text()
-                }
-            },
-            'audio': {
-                'mode': self.audio_mode.currentText(),
-                'buffer_duration_minutes': self.buffer_duration.value(),
-                'processing_interval_seconds': self.processing_interval.value() / 10.0,
-                'system_audio_monitoring': {
-                    'full_monitoring': self.full_system_audio.isChecked(),
-                    'monitored_applications': {app_key: checkbox.isChecked() for app_key, checkbox in self.app_checkboxes.items()},
-                    'audio_filtering': {
-                        'filter_non_speech': self.filter_music.isChecked(),
-                        'speech_detection_threshold': self.speech_detection_threshold.value() / 100.0
-                    }
-                }
-            },
-            'transcription': {
-                'provider': self.transcription_provider.currentText(),
-                'whisper': {
-                    'model_size': self.whisper_model.currentText()
-                },
-                'google_speech': {
-                    'json_file_path': self.google_json_file.text(),
-                    'json_content': self.google_json_content.toPlainText()
-                },
-                'azure_speech': {
-                    'api_key': self.azure_speech_key.text(),
-                    'region': self.azure_speech_region.text(),
-                    'endpoint': self.azure_speech_endpoint.text(),
-                    'language': self.azure_speech_language.currentText()
-                },
-                'openai_whisper': {
-                    'api_key': self.openai_whisper_api_key.text(),
-                    'model': self.openai_whisper_model.currentText(),
-                    'language': self.openai_whisper_language.currentText()
-                }
-            },
-            'ui': {
-                'overlay': {
-                    'theme': 'light' if 'Light' in self.theme_selector.currentText() else 'dark',
-                    'size_multiplier': self.size_multiplier.value() / 10.0,
-                    'show_transcript': self.show_transcript.isChecked(),
-                    'hide_from_sharing': self.hide_from_sharing.isChecked(),
-                    'auto_hide_seconds': self.auto_hide_seconds.value(),
-                    'enhanced': {
-                        'background_opacity': self.background_opacity.value() / 100.0,
-                        'blur_enabled': self.enable_blur_effects.isChecked(),
-                        'smooth_animations': self.enable_smooth_animations.isChecked(),
-                        'auto_width': self.enable_auto_width.isChecked(),
-                        'dynamic_transparency': self.enable_dynamic_transparency.isChecked()
-                    }
-                },
-                'hide_overlay_for_screenshots': self.hide_overlay_for_screenshots.isChecked(),
-                'language': self.language_selector.itemData(self.language_selector.currentIndex()) or 'en'
-            },
             'screen_sharing_detection': {
-                'enabled': self.enable_screen_sharing_detection.isChecked(),
                 'auto_hide_overlay': True,
                 'detection_interval_seconds': 3,
                 'verbose_logging': False
             },
-            'assistant': {
-                'activation_mode': self.activation_mode.currentText(),
-                'verbosity': self.verbosity.currentText(),
-                'response_style': self.response_style.currentText(),
-                'input_prioritization': self.input_prioritization.currentText()
-            },
-            'topic_graph': {
-                'enabled': self.enable_topic_graph.isChecked(),
-                'matching_threshold': self.matching_threshold.value() / 100.0,
-                'max_matches': self.max_matches.value()
-            },
-            'hotkeys': {
-                'trigger_assistance': self.trigger_assistance.text(),
-                'toggle_overlay': self.toggle_overlay.text(),
-                'take_screenshot': self.take_screenshot.text(),
-                'emergency_reset': self.emergency_reset.text(),
-                'toggle_hide_for_screenshots': self.toggle_hide_for_screenshots.text()
-            },
-            'debug': {
-                'enabled': self.debug_enabled.isChecked(),
-                'verbose_logging': self.verbose_logging.isChecked(),
-                'save_transcriptions': self.save_transcriptions.isChecked(),
-                'save_audio_chunks': self.save_audio_chunks.isChecked(),
-                'max_debug_files': self.max_debug_files.value()
-            },
             'documents': {
-                'enabled': self.documents_enabled.isChecked(),
                 'data_dir': 'data/user_documents',
-                'chunk_size': self.chunk_size.value(),
-                'chunk_overlap': self.chunk_overlap.value(),
-                'max_context_chunks': self.max_context_chunks.value(),
-                'embedding': {
-                    'provider': self.embedding_provider.currentText(),
-                    'model': self.embedding_model.currentText(),
-                    'device': 'cpu'
-                },
-                'vector': {
-                    'backend': self.vector_backend.currentText(),
-                    'dimension': 384,
-                    'metric': 'cosine'
-                }
+                'embedding': {'device': 'cpu'},
+                'vector': {'dimension': 384, 'metric': 'cosine'}
             }
         }
-        
-        # Save prompt to file
-        try:
-            with open('prompt_rules.md', 'w', encoding='utf-8') as f:
-                f.write(self.system_prompt.toPlainText())
-        except Exception as e:
-            QMessageBox.warning(self, "Warning", f"Failed to save prompt file: {e}")
-        
-        # Save topic definitions
-        try:
-            with open('topic_definitions.txt', 'w', encoding='utf-8') as f:
-                f.write(self.topic_definitions.toPlainText())
-        except Exception as e:
-            QMessageBox.warning(self, t("messages.warning", "Warning"), t("messages.warning_save_topics", "Failed to save topic definitions: {error}").format(error=str(e)))
+        for bindings in self._CONFIG_BINDINGS.values():
+            for path, attr, default in bindings:
+                widget = getattr(self, attr, None)
+                # Tabs and provider pages never shown keep their configured values
+                value = (_dget(self.current_config, path, default) if widget is None
+                         else _read_widget(widget, self._SLIDER_SCALES.get(attr)))
+                _dset(new_config, path, value)
+        
+        if hasattr(self, 'app_items'):
+            monitored_apps = {app_key: item.checkState() == Qt.Checked for app_key, item in self.app_items.items()}
+        else:
+            configured = _dget(self.current_config, 'audio.system_audio_monitoring.monitored_applications',
+                               {app_key: enabled for app_key, _, enabled in self._MONITORED_APPS})
+            monitored_apps = {app_key: bool(configured.get(app_key, False)) for app_key, _, _ in self._MONITORED_APPS}
+        _dset(new_config, 'audio.system_audio_monitoring.monitored_applications', monitored_apps)
+        if hasattr(self, 'theme_selector'):
+            _dset(new_config, 'ui.overlay.theme', self.theme_selector.currentData() or 'dark')
+            _dset(new_config, 'ui.language', self.language_selector.itemData(self.language_selector.currentIndex()) or 'en')
+        else:
+            _dset(new_config, 'ui.overlay.theme', 'light' if _dget(self.current_config, 'ui.overlay.theme', 'dark') == 'light' else 'dark')
+            _dset(new_config, 'ui.language', self._current_language())
+        
+        # Save prompt and topic files (skipped when their tab was never
+        # opened or they match what is on disk) on the file writer, so the
+        # dialog closes without waiting on the disk; _on_files_saved reports
+        # failures in a single warning
+        files = []
+        prompt_text = self.system_prompt.toPlainText() if hasattr(self, 'system_prompt') else None
+        if prompt_text is not None and prompt_text != self._prompt_last_saved:
+            files.append((_PROMPT_FILE, prompt_text))
+        topics_text = self.topic_definitions.toPlainText() if hasattr(self, 'topic_definitions') else None
+        if topics_text is not None and topics_text != self._topics_last_saved:
+            files.append((_TOPICS_FILE, topics_text))
+        if files:
+            future = _file_writer.submit(self._write_files, files)
+            # Shared by all instances; the writer runs in order, so this
+            # finishing means every earlier save has too
+            ModernSettingsDialog._files_writing = future
+            _when_done(future, self._on_files_saved)
         
         self.settings_changed.emit(new_config)
         self.accept()
     
+    @classmethod
+    def _write_files(cls, files):
+        """Write (path, text) pairs; runs on the file writer and
+        returns (path, text, error or None) for each"""
+        results = []
+        for path, text in files:
+            try:
+                cls._write_text_file(path, text)
+                results.append((path, text, None))
+            except Exception as e:
+                results.append((path, text, e))
+        return results
+    
+    def _on_files_saved(self, future):
+        """Record saved prompt/topic text and warn about failures (GUI thread)"""
+        errors = []
+        for path, text, error in future.result():
+            if path == _PROMPT_FILE:
+                if error is None:
+                    self._prompt_last_saved = text
+                else:
+                    errors.append(f"Failed to save prompt file: {error}")
+            elif error is None:
+                self._topics_last_saved = text
+            else:
+                errors.append(t("messages.warning_save_topics", "Failed to save topic definitions: {error}").format(error=str(error)))
+        
+        if errors:
+            QMessageBox.warning(self, t("messages.warning", "Warning"), "\n".join(errors))
+    
     def reset_to_defaults(self):
         """Reset all settings to defaults"""
         reply = QMessageBox.question(
@@ -2238,11 +2198,33 @@ class ModernSettingsDialog(QDialog):
             # Reset to defaults - you could reload from a default config here
             self.reject()  # For now, just close the dialog 
 
+    def _add_app_header(self, text: str) -> QListWidgetItem:
+        """Append a bold, non-checkable section row to the application list"""
+        item = QListWidgetItem(text, self.apps_list)
+        item.setFlags(Qt.ItemIsEnabled)
+        font = item.font()
+        font.setBold(True)
+        item.setFont(font)
+        return item
+    
+    def _add_app_item(self, app_key: str, text: str, checked: bool) -> QListWidgetItem:
+        """Append a checkable application row keyed by app_key"""
+        item = QListWidgetItem(text, self.apps_list)
+        item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsUserCheckable)
+        item.setCheckState(Qt.Checked if checked else Qt.Unchecked)
+        item.setData(Qt.UserRole, app_key)
+        self.app_items[app_key] = item
+        return item
+    
+    def _queue_monitoring_status(self, *_):
+        """(Re)start the coalescing timer behind update_monitoring_status"""
+        self._monitoring_timer.start()
+    
     def update_monitoring_status(self):
         """Update the monitoring status label"""
         if self.full_system_audio.isChecked():
             self.monitoring_status.setText("📊 Currently monitoring: 🌐 ALL SYSTEM AUDIO")
-            self.monitoring_status.setStyleSheet("color: #ff6b6b; font-weight: 600; margin-bottom: 10px; padding: 8px; background: #1a1a1a; border-radius: 4px;")
+            self._set_monitoring_state("all")
             return
         
         # Get enabled apps
@@ -2265,8 +2247,8 @@ class ModernSettingsDialog(QDialog):
             'custom': 'Custom Apps'
         }
         
-        for app_key, checkbox in self.app_checkboxes.items():
-            if checkbox.isChecked():
+        for app_key, item in self.app_items.items():
+            if item.checkState() == Qt.Checked:
                 enabled_apps.append(app_names.get(app_key, app_key))
         
         if enabled_apps:
@@ -2274,13 +2256,21 @@ class ModernSettingsDialog(QDialog):
                 status_text = f"📊 Currently monitoring: {', '.join(enabled_apps)}"
             else:
                 status_text = f"📊 Currently monitoring: {', '.join(enabled_apps[:3])} and {len(enabled_apps)-3} more"
-            self.monitoring_status.setStyleSheet("color: #0078d4; font-weight: 600; margin-bottom: 10px; padding: 8px; background: #1a1a1a; border-radius: 4px;")
+            self._set_monitoring_state("apps")
         else:
             status_text = "📊 Currently monitoring: ⚠️ No applications selected"
-            self.monitoring_status.setStyleSheet("color: #ffa500; font-weight: 600; margin-bottom: 10px; padding: 8px; background: #1a1a1a; border-radius: 4px;")
+            self._set_monitoring_state("none")
         
         self.monitoring_status.setText(status_text)
     
+    def _set_monitoring_state(self, state: str):
+        """Switch the status label's themed colour; re-polish only on change"""
+        label = self.monitoring_status
+        if label.property("status") != state:
+            label.setProperty("status", state)
+            label.style().unpolish(label)
+            label.style().polish(label)
+    
     def on_hide_overlay_toggled(self, checked):
         """Handle hide overlay for screenshots/debugging toggle"""
         # Add any additional logic you want to execute when this toggle is changed
@@ -4,10 +4,15 @@ Provides light and dark theme definitions with consistent styling
 """
 
 import base64
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, Any
 from dataclasses import dataclass
 
-@dataclass
+# Static SVG icons referenced from generated stylesheets
+ICONS_DIR = Path(__file__).resolve().parent.parent / "icons"
+
+@dataclass(frozen=True)
 class ThemeColors:
     """Color definitions for a theme"""
     # Main colors
@@ -137,7 +142,10 @@ class ThemeManager:
             "dark": "Dark Mode"
         }
     
+    # Themes are frozen, so each (theme, size) pair always generates the
+    # same text; re-applying a theme reuses it instead of rebuilding it
     @classmethod
+    @lru_cache(maxsize=32)
     def generate_stylesheet(cls, theme: ThemeColors, size_multiplier: float = 1.0) -> str:
         """Generate complete stylesheet for the given theme"""
         
@@ -301,7 +309,20 @@ class ThemeManager:
         
         return stylesheet
 
+    @staticmethod
+    def _svg_image_url(file_name: str, svg: str) -> str:
+        """Return a stylesheet url() for an SVG icon.
+        
+        Prefers the copy shipped in icons/ so Qt can cache the decoded image by
+        path; falls back to an inline base64 data URI when no file exists.
+        """
+        icon_path = ICONS_DIR / file_name
+        if icon_path.is_file():
+            return f'url("{icon_path.as_posix()}")'
+        return f"url(data:image/svg+xml;base64,{base64.b64encode(svg.encode()).decode()})"
+    
     @classmethod
+    @lru_cache(maxsize=32)
     def generate_settings_stylesheet(cls, theme: ThemeColors, size_multiplier: float = 1.0) -> str:
         """Generate stylesheet specifically for the settings dialog"""
         
@@ -320,20 +341,17 @@ class ThemeManager:
             # For RGB values, use white for dark theme, black for light theme
             text_color_hex = "ffffff" if theme.background == "#141414" else "000000"
         
-        # Create base64 encoded SVGs with theme-appropriate colors
-        import base64
-        
         # Dropdown arrow SVG with theme color
         dropdown_arrow_svg = f'''<svg width="12" height="8" viewBox="0 0 12 8" fill="none" xmlns="http://www.w3.org/2000/svg">
 <path d="M1 1L6 6L11 1" stroke="#{text_color_hex}" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"/>
 </svg>'''
-        dropdown_arrow_b64 = base64.b64encode(dropdown_arrow_svg.encode()).decode()
+        dropdown_arrow_url = cls._svg_image_url(f"dropdown_arrow_{text_color_hex.lower()}.svg", dropdown_arrow_svg)
         
         # Checkbox checkmark SVG with white color (always white on colored background)
         checkmark_svg = '''<svg width="12" height="12" viewBox="0 0 12 12" fill="none" xmlns="http://www.w3.org/2000/svg">
 <path d="M10 3L4.5 8.5L2 6" stroke="white" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"/>
 </svg>'''
-        checkmark_b64 = base64.b64encode(checkmark_svg.encode()).decode()
+        checkmark_url = cls._svg_image_url("checkmark.svg", checkmark_svg)
         
         # Generate comprehensive settings dialog stylesheet
         stylesheet = f"""
@@ -407,6 +425,35 @@ class ThemeManager:
                 min-height: {scale(28)}px;
                 padding: {scale(4)}px;
             }}
+            QLabel[class="info"] {{
+                color: {theme.text_secondary};
+                font-style: italic;
+            }}
+            QLabel[class="hint"] {{
+                color: {theme.text_secondary};
+                margin-top: {scale(15)}px;
+            }}
+            QLabel[class="section"] {{
+                font-weight: 600;
+                margin-top: {scale(10)}px;
+            }}
+            QLabel[class="value"] {{
+                min-width: {scale(50)}px;
+            }}
+            QLabel#monitoringStatus {{
+                color: {theme.primary};
+                background: {theme.background_secondary};
+                font-weight: 600;
+                margin-bottom: {scale(10)}px;
+                padding: {scale(8)}px;
+                border-radius: {scale(4)}px;
+            }}
+            QLabel#monitoringStatus[status="all"] {{
+                color: {theme.error};
+            }}
+            QLabel#monitoringStatus[status="none"] {{
+                color: {theme.warning};
+            }}
             QCheckBox {{
                 color: {theme.text_primary};
                 font-size: {scale_font(14)}px;
@@ -414,6 +461,17 @@ class ThemeManager:
                 min-height: {scale(32)}px;
                 padding: {scale(6)}px;
             }}
+            QCheckBox:disabled {{
+                color: {theme.text_muted};
+            }}
+            QCheckBox#fullSystemAudio {{
+                font-weight: 600;
+            }}
+            QFrame#sectionSeparator {{
+                background: {theme.border};
+                max-height: 1px;
+                border: none;
+            }}
             QCheckBox::indicator {{
                 width: {scale(20)}px;
                 height: {scale(20)}px;
@@ -424,7 +482,33 @@ class ThemeManager:
             QCheckBox::indicator:checked {{
                 background: {theme.primary};
                 border: 2px solid {theme.primary};
-                image: url(data:image/svg+xml;base64,{checkmark_b64});
+                image: {checkmark_url};
+            }}
+            QListView {{
+                background: {theme.background_tertiary};
+                border: 2px solid {theme.border};
+                border-radius: {scale(6)}px;
+                color: {theme.text_primary};
+                font-size: {scale_font(14)}px;
+                padding: {scale(6)}px;
+            }}
+            QListView::item {{
+                min-height: {scale(32)}px;
+            }}
+            QListView:disabled {{
+                color: {theme.text_muted};
+            }}
+            QListWidget::indicator {{
+                width: {scale(20)}px;
+                height: {scale(20)}px;
+                border-radius: {scale(4)}px;
+                border: 2px solid {theme.border};
+                background: {theme.background_secondary};
+            }}
+            QListWidget::indicator:checked {{
+                background: {theme.primary};
+                border: 2px solid {theme.primary};
+                image: {checkmark_url};
             }}
             QComboBox, QSpinBox, QLineEdit {{
                 background: {theme.background_secondary};
@@ -448,7 +532,7 @@ class ThemeManager:
                 width: {scale(30)}px;
             }}
             QComboBox::down-arrow {{
-                image: url(data:image/svg+xml;base64,{dropdown_arrow_b64});
+                image: {dropdown_arrow_url};
             }}
             QComboBox QAbstractItemView {{
                 background: {theme.background_secondary};
@@ -459,7 +543,13 @@ class ThemeManager:
             QLineEdit::placeholder {{
                 color: {theme.text_muted};
             }}
-            QTextEdit {{
+            QLineEdit[fieldClass="apiField"] {{
+                color: {theme.text_primary};
+            }}
+            QLineEdit[fieldClass="apiField"]::placeholder {{
+                color: {theme.text_muted};
+            }}
+            QTextEdit, QPlainTextEdit {{
                 background: {theme.background_tertiary};
                 border: 2px solid {theme.border};
                 border-radius: {scale(6)}px;
@@ -469,9 +559,21 @@ class ThemeManager:
                 font-family: 'Consolas', 'Monaco', monospace;
                 line-height: 1.4;
             }}
-            QTextEdit:focus {{
+            QTextEdit:focus, QPlainTextEdit:focus {{
                 border: 2px solid {theme.primary};
             }}
+            QPlainTextEdit#googleJsonContent {{
+                min-height: {scale(100)}px;
+            }}
+            QTextEdit#systemPrompt {{
+                min-height: {scale(350)}px;
+            }}
+            QTextEdit#topicDefinitions {{
+                min-height: {scale(250)}px;
+            }}
+            QListView#documentsList {{
+                min-height: {scale(150)}px;
+            }}
             QPushButton {{
                 background: {theme.background_tertiary};
                 border: 2px solid {theme.border};
@@ -482,6 +584,12 @@ class ThemeManager:
                 min-height: {scale(35)}px;
                 font-weight: 500;
             }}
+            QPushButton#addCustomApp {{
+                max-width: {scale(80)}px;
+            }}
+            QPushButton#browseJsonFile {{
+                max-width: {scale(100)}px;
+            }}
             QPushButton:hover {{
                 background: {theme.background_secondary};
                 border: 2px solid {theme.primary};
@@ -512,6 +620,9 @@ class ThemeManager:
             QScrollBar::handle:vertical:hover {{
                 background: {theme.text_secondary};
             }}
+            QSlider {{
+                min-height: {scale(40)}px;
+            }}
             QSlider::groove:horizontal {{
                 background: {theme.border};
                 height: {scale(8)}px;
@@ -6,8 +6,7 @@ Provides multi-language support for the application UI
 import json
 import os
 from pathlib import Path
-from typing import Dict, Optional, List
-from functools import lru_cache
+from typing import Dict, Optional, List, Tuple
 from utils.app_logger import logger
 
 
@@ -48,6 +47,8 @@ class TranslationManager:
         
         self.current_language = language or self.DEFAULT_LANGUAGE
         self.translations: Dict[str, Dict[str, str]] = {}
+        # (language, key, default) -> resolved text, before any formatting
+        self._lookup_cache: Dict[Tuple[str, str, Optional[str]], object] = {}
         
         # Load translations
         self._load_translations()
@@ -90,6 +91,9 @@ class TranslationManager:
             logger.warning(f"⚠️ Unsupported language: {language}, falling back to {self.DEFAULT_LANGUAGE}")
             language = self.DEFAULT_LANGUAGE
         
+        if language != self.current_language:
+            # Keep the lookup cache to the active language only
+            self._lookup_cache.clear()
         self.current_language = language
         logger.info(f"🌐 Language set to: {self.SUPPORTED_LANGUAGES.get(language, language)}")
     
@@ -114,6 +118,23 @@ class TranslationManager:
         Returns:
             Translated string
         """
+        cache_key = (self.current_language, key, default)
+        try:
+            value = self._lookup_cache[cache_key]
+        except KeyError:
+            value = self._lookup_cache[cache_key] = self._resolve(key, default)
+        
+        # Format the string if kwargs provided
+        if kwargs and isinstance(value, str):
+            try:
+                return value.format(**kwargs)
+            except (KeyError, ValueError):
+                return value
+        
+        return str(value)
+    
+    def _resolve(self, key: str, default: Optional[str]):
+        """Look ``key`` up in the current language, falling back to English"""
         # Get translation for current language
         translation = self.translations.get(self.current_language, {})
         
@@ -143,14 +164,7 @@ class TranslationManager:
         if isinstance(value, dict):
             value = default or key
         
-        # Format the string if kwargs provided
-        if kwargs and isinstance(value, str):
-            try:
-                return value.format(**kwargs)
-            except (KeyError, ValueError):
-                return value
-        
-        return str(value)
+        return value
     
     def t(self, key: str, default: Optional[str] = None, **kwargs) -> str:
         """Short alias for translate()"""
@@ -285,7 +299,9 @@ def get_translation_manager(locale_dir: str = "data/locales", language: str = No
 
 def t(key: str, default: Optional[str] = None, **kwargs) -> str:
     """Global translation function"""
-    manager = get_translation_manager()
+    # Read the global directly once it exists; lookups themselves are cached
+    # per (language, key, default) inside translate()
+    manager = _translation_manager or get_translation_manager()
     return manager.translate(key, default, **kwargs)
 
 